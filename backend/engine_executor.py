@@ -0,0 +1,234 @@
+"""
+AI Resume Builder - Engine Executor
+Runs CPU-bound ResumeAIEngine and ResumeMLPipeline calls off the event loop,
+on a thread pool or on a pool of worker processes that each hold their own
+warm engine and pipeline. State that only the API process holds (the
+candidate ranking index, the job index) runs on local threads under the same
+in-flight limit and timeout.
+
+Configuration (environment variables):
+    ENGINE_EXECUTOR       "thread" (default) or "process"
+    ENGINE_WORKERS        pool size, defaults to the CPU count
+    ENGINE_MAX_IN_FLIGHT  max engine calls queued or running, defaults to 2x workers
+    ENGINE_TASK_TIMEOUT   seconds to wait for a call before giving up (default 30)
+    ENGINE_CHUNK_SIZE     max items per task when a batch is split (default 25)
+
+Process workers load PIPELINE_MODEL_PATH when they start. After
+publish_model, each swaps to the new artifact before its next call.
+"""
+
+import asyncio
+import math
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ml_engine import ResumeAIEngine
+
+# Services owned by a process-pool worker, created once by _init_worker
+_worker_services: Dict[str, Any] = {}
+
+
+def _init_worker():
+    # Imported here: ml_pipeline lives in ml_model/, which the API puts on sys.path
+    from ml_pipeline import NaiveBayesDomainModel, ResumeMLPipeline
+
+    engine = ResumeAIEngine()
+    _worker_services["engine"] = engine
+    _worker_services["pipeline"] = ResumeMLPipeline.from_env(engine=engine, domain_model=NaiveBayesDomainModel.from_env())
+
+
+def _call_worker_service(service: str, method: str, args: tuple, kwargs: dict,
+                         model: Optional[Tuple[str, str]] = None) -> Any:
+    if model is not None:
+        path, version = model
+        pipeline = _worker_services["pipeline"]
+        current = pipeline.registry.current
+        if current is None or current.version != version:
+            pipeline.load_model(path)
+    return getattr(_worker_services[service], method)(*args, **kwargs)
+
+
+class EngineExecutorError(Exception):
+    """Base error for engine calls that could not be completed."""
+    status_code = 500
+
+
+class EngineBusyError(EngineExecutorError):
+    """Raised when the in-flight limit is reached and no slot frees up in time."""
+    status_code = 503
+
+
+class EngineTimeoutError(EngineExecutorError):
+    """Raised when an engine call does not finish within the task timeout."""
+    status_code = 504
+
+
+class EngineExecutor:
+    """Dispatches engine and pipeline method calls to a worker pool and awaits them."""
+
+    def __init__(self, engine: ResumeAIEngine, mode: str = "thread", max_workers: Optional[int] = None,
+                 max_in_flight: Optional[int] = None, timeout: float = 30.0, chunk_size: int = 25,
+                 pipeline: Any = None):
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Unknown executor mode: {mode!r}")
+        self.engine = engine
+        self.pipeline = pipeline
+        self.mode = mode
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_in_flight = max_in_flight or self.max_workers * 2
+        self.timeout = timeout
+        self.chunk_size = chunk_size
+        self._pool: Optional[Executor] = None
+        self._local_pool: Optional[Executor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        # (artifact path, model version) that process workers must serve
+        self.model: Optional[Tuple[str, str]] = None
+
+    @classmethod
+    def from_env(cls, engine: ResumeAIEngine, pipeline: Any = None) -> "EngineExecutor":
+        workers = os.environ.get("ENGINE_WORKERS")
+        in_flight = os.environ.get("ENGINE_MAX_IN_FLIGHT")
+        return cls(
+            engine,
+            mode=os.environ.get("ENGINE_EXECUTOR", "thread").lower(),
+            max_workers=int(workers) if workers else None,
+            max_in_flight=int(in_flight) if in_flight else None,
+            timeout=float(os.environ.get("ENGINE_TASK_TIMEOUT", "30")),
+            chunk_size=int(os.environ.get("ENGINE_CHUNK_SIZE", "25")),
+            pipeline=pipeline,
+        )
+
+    def start(self):
+        if self._pool is not None:
+            return
+        if self.mode == "process":
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker)
+        else:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="engine")
+            self._local_pool = self._pool
+        self._slots = asyncio.Semaphore(self.max_in_flight)
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            if self._local_pool not in (None, self._pool):
+                self._local_pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+            self._local_pool = None
+            self._slots = None
+
+    def publish_model(self, path: str, version: str):
+        """
+        Make every process worker serve the pipeline artifact at path: each
+        one loads it before its next call unless it already has version.
+        Thread workers share the API process's pipeline, so only the caller
+        needs to publish there.
+        """
+        self.model = (path, version)
+
+    async def run(self, method: str, *args, **kwargs) -> Any:
+        """Run engine.<method>(*args, **kwargs) on the pool and return its result."""
+        return await self.run_on("engine", method, *args, **kwargs)
+
+    async def run_pipeline(self, method: str, *args, **kwargs) -> Any:
+        """Run pipeline.<method>(*args, **kwargs) on the pool and return its result."""
+        if self.pipeline is None:
+            raise EngineExecutorError("No ML pipeline is configured for this executor")
+        return await self.run_on("pipeline", method, *args, **kwargs)
+
+    async def run_on(self, service: str, method: str, *args, **kwargs) -> Any:
+        """Run <service>.<method>(*args, **kwargs), where service is "engine" or "pipeline"."""
+        self.start()
+        if self.mode == "process":
+            return await self._submit(method, self._pool, _call_worker_service, service, method, args, kwargs,
+                                      self.model)
+        bound = getattr(getattr(self, service), method)
+        return await self._submit(method, self._pool, lambda: bound(*args, **kwargs))
+
+    async def run_local(self, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Run fn(*args, **kwargs) on a thread of the API process, whatever the
+        mode, for objects the workers do not have (e.g. a bound method of the
+        ranking index). It shares the in-flight limit and timeout of run_on.
+        """
+        self.start()
+        if self._local_pool is None:
+            self._local_pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="engine-local")
+        name = getattr(fn, "__name__", "call")
+        return await self._submit(name, self._local_pool, lambda: fn(*args, **kwargs))
+
+    async def _submit(self, name: str, pool: Executor, fn: Callable, *args) -> Any:
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.timeout)
+        except asyncio.TimeoutError:
+            raise EngineBusyError("Server is busy, please retry shortly")
+
+        loop = asyncio.get_running_loop()
+        try:
+            future = loop.run_in_executor(pool, fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+
+        # The slot is held until the work really finishes, even if the caller
+        # times out, so abandoned tasks still count against the in-flight limit.
+        slots = self._slots
+        future.add_done_callback(lambda _: slots.release())
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), self.timeout)
+        except asyncio.TimeoutError:
+            raise EngineTimeoutError(f"Engine call '{name}' timed out after {self.timeout:g}s")
+
+    def chunk(self, items: Sequence) -> List[Sequence]:
+        """Split items into roughly equal chunks, one per worker, capped at chunk_size."""
+        if not items:
+            return []
+        size = min(self.chunk_size, math.ceil(len(items) / self.max_workers))
+        return [items[i:i + size] for i in range(0, len(items), size)]
+
+    async def run_chunked(self, method: str, items: Sequence, *args, **kwargs) -> List:
+        """
+        Split items into chunks, run engine.<method>(chunk, *args, **kwargs) for
+        each chunk in parallel and concatenate the per-chunk result lists.
+        """
+        return await self.run_chunked_on("engine", method, items, *args, **kwargs)
+
+    async def run_chunked_on(self, service: str, method: str, items: Sequence, *args, **kwargs) -> List:
+        """run_chunked against either service ("engine" or "pipeline")."""
+        results = await asyncio.gather(*(
+            self.run_on(service, method, chunk, *args, **kwargs) for chunk in self.chunk(items)
+        ))
+        return [item for chunk_result in results for item in chunk_result]
+
+    async def iter_chunked(self, method: str, items: Sequence, *args, **kwargs) -> AsyncIterator[Tuple[Sequence, Any]]:
+        """
+        Like run_chunked, but yield (chunk, result) pairs as chunks finish. At
+        most max_workers chunks are scheduled at once, so memory stays bounded
+        however large the batch is. If a chunk fails with an EngineExecutorError
+        the error is yielded in place of its result.
+        """
+        chunks = iter(self.chunk(items))
+        pending = {}
+
+        def schedule():
+            chunk = next(chunks, None)
+            if chunk is not None:
+                task = asyncio.ensure_future(self.run(method, chunk, *args, **kwargs))
+                pending[task] = chunk
+
+        for _ in range(self.max_workers):
+            schedule()
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    chunk = pending.pop(task)
+                    schedule()
+                    try:
+                        yield chunk, task.result()
+                    except EngineExecutorError as e:
+                        yield chunk, e
+        finally:
+            for task in pending:
+                task.cancel()
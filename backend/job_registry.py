@@ -0,0 +1,123 @@
+"""
+AI Resume Builder - Job Description Registry
+Compiled job descriptions (JobContext: tokens, keywords, canonical keyword
+phrases and the required-skill bitset) stored under a content-hash id, so a
+JD posted once is scored against many resumes without re-extracting its
+keywords on every call. Ids include the engine version, like response cache
+keys, so a JD compiled by an older engine is never reused.
+
+Recently used JDs stay in memory; evicted ones are pickled to a spill
+directory when one is configured and loaded back on their next use.
+
+Configuration (environment variables):
+    JOB_REGISTRY_MAX_ENTRIES  compiled JDs kept in memory (default 1024)
+    JOB_REGISTRY_SPILL_DIR    directory for evicted JDs, unset disables spilling
+"""
+
+import os
+import pickle
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from ml_engine import JobContext
+from response_cache import cache_key
+
+_JOB_ID_RE = re.compile(r"[0-9a-f]{64}")
+
+
+def job_id_for(job_description: str) -> str:
+    """Content-hash id of a job description under the current engine version."""
+    return cache_key("job-description", job_description)
+
+
+class JobRegistry:
+    """Thread-safe LRU of compiled job descriptions, with optional on-disk spill."""
+
+    def __init__(self, max_entries: int = 1024, spill_dir: Optional[str] = None):
+        self.max_entries = max_entries
+        self.spill_dir = spill_dir
+        self._entries: "OrderedDict[str, JobContext]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.spill_hits = 0
+        self.misses = 0
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+
+    @classmethod
+    def from_env(cls) -> "JobRegistry":
+        return cls(
+            max_entries=int(os.environ.get("JOB_REGISTRY_MAX_ENTRIES", "1024")),
+            spill_dir=os.environ.get("JOB_REGISTRY_SPILL_DIR") or None,
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, job_id: str) -> Optional[JobContext]:
+        """Compiled JD for job_id from memory or the spill directory, or None if unknown."""
+        if not _JOB_ID_RE.fullmatch(job_id or ""):
+            return None
+        with self._lock:
+            job = self._entries.get(job_id)
+            if job is not None:
+                self._entries.move_to_end(job_id)
+                self.hits += 1
+                return job
+        job = self._load_spilled(job_id)
+        if job is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.spill_hits += 1
+        self.put(job_id, job)
+        return job
+
+    def put(self, job_id: str, job: JobContext):
+        with self._lock:
+            self._entries[job_id] = job
+            self._entries.move_to_end(job_id)
+            evicted: List[Tuple[str, JobContext]] = []
+            while len(self._entries) > self.max_entries:
+                evicted.append(self._entries.popitem(last=False))
+        # Disk writes happen outside the lock so lookups are never blocked on I/O
+        for evicted_id, evicted_job in evicted:
+            self._spill(evicted_id, evicted_job)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "spill_dir": self.spill_dir,
+                "hits": self.hits,
+                "spill_hits": self.spill_hits,
+                "misses": self.misses,
+            }
+
+    def _spill_path(self, job_id: str) -> str:
+        return os.path.join(self.spill_dir, f"{job_id}.pkl")
+
+    def _spill(self, job_id: str, job: JobContext):
+        if not self.spill_dir:
+            return
+        path = self._spill_path(job_id)
+        if os.path.exists(path):
+            return
+        # Write then rename, so a concurrent reader never sees a partial file
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(job, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    def _load_spilled(self, job_id: str) -> Optional[JobContext]:
+        if not self.spill_dir:
+            return None
+        try:
+            with open(self._spill_path(job_id), "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
@@ -3,10 +3,29 @@ AI Resume & Portfolio Builder - FastAPI Backend
 """
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ValidationError
 from typing import List, Optional
+import asyncio
 import json
+import os
+import sys
+import tempfile
+import threading
+
+# The ML pipeline lives in ml_model/, next to this backend package
+_ML_MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ml_model")
+if _ML_MODEL_PATH not in sys.path:
+    sys.path.insert(0, _ML_MODEL_PATH)
+
 from ml_engine import ResumeAIEngine
+from ml_pipeline import CandidateRankingIndex, NaiveBayesDomainModel, ResumeMLPipeline
+from job_index import JobIndex, ShardedJobIndex
+from engine_executor import EngineExecutor, EngineExecutorError
+from response_cache import ResponseCache, cache_key
+from skill_index import CandidateCoverageIndex, SkillInterner
+from job_registry import JobRegistry, job_id_for
+from near_duplicates import bands_for
 
 app = FastAPI(title="AI Resume Builder API", version="1.0.0")
 
@@ -18,7 +37,35 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+MAX_BATCH_SIZE = int(os.environ.get("MAX_BATCH_SIZE", "1000"))
+MAX_BULLET_BATCH_SIZE = int(os.environ.get("MAX_BULLET_BATCH_SIZE", "10000"))
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+# Where /api/model/rebuild saves the artifact that process workers swap to
+PIPELINE_MODEL_PATH = os.environ.get("PIPELINE_MODEL_PATH") or os.path.join(
+    tempfile.gettempdir(), "resume-pipeline-model.bmf")
+
+# One warm engine per process, shared by the ML pipeline
 ai_engine = ResumeAIEngine()
+ml_pipeline = ResumeMLPipeline.from_env(engine=ai_engine, domain_model=NaiveBayesDomainModel.from_env())
+engine_executor = EngineExecutor.from_env(ai_engine, pipeline=ml_pipeline)
+response_cache = ResponseCache.from_env()
+# Its own interner: user skills interned here must not shift the ids of the
+# engine's fixed vocabulary, which compiled job descriptions store as bits
+candidate_index = CandidateCoverageIndex(SkillInterner(canonicalizer=ai_engine.skill_canonicalizer))
+ranking_index = CandidateRankingIndex(ml_pipeline)
+job_registry = JobRegistry.from_env()
+job_index = JobIndex.from_env()
+_model_rebuild_lock = threading.Lock()
+
+@app.on_event("startup")
+def start_engine_executor():
+    engine_executor.start()
+
+@app.on_event("shutdown")
+def stop_engine_executor():
+    engine_executor.shutdown()
+    if isinstance(job_index, ShardedJobIndex):
+        job_index.shutdown()
 
 # ─── Pydantic Models ───────────────────────────────────────────────────────────
 
@@ -70,63 +117,359 @@ class GenerateRequest(BaseModel):
     generate_cover_letter: bool = True
     generate_portfolio: bool = True
     job_description: Optional[str] = None
+    job_id: Optional[str] = None  # from /api/job-descriptions, used instead of job_description
     company_name: Optional[str] = None
     tone: str = "professional"  # professional, creative, technical
 
+class BatchGenerateRequest(BaseModel):
+    # Profiles are validated one by one so a bad profile only fails its own item
+    profiles: List[dict]
+    generate_resume: bool = True
+    generate_cover_letter: bool = True
+    generate_portfolio: bool = True
+    job_description: Optional[str] = None
+    job_id: Optional[str] = None
+    company_name: Optional[str] = None
+    tone: str = "professional"
+
 class ATSRequest(BaseModel):
     resume_text: str
+    job_description: Optional[str] = None
+    job_id: Optional[str] = None
+
+class JobDescriptionRequest(BaseModel):
+    job_description: str
+
+class MatchJobsRequest(BaseModel):
+    resume_text: str
+
+class FullAnalysisRequest(BaseModel):
+    profile: StudentProfile
     job_description: str
 
+class ScoreBulletsRequest(BaseModel):
+    bullets: List[str]
+
+class ModelRebuildRequest(BaseModel):
+    documents: List[str]
+    version: Optional[str] = None
+
+class NearDuplicateRequest(BaseModel):
+    texts: List[str]
+    threshold: float = 0.6
+
+class CandidateSkills(BaseModel):
+    candidate_id: str
+    skills: List[str]
+
+class CandidateBulkRequest(BaseModel):
+    candidates: List[CandidateSkills]
+
+class CandidateSearchRequest(BaseModel):
+    skills: List[str]
+    min_coverage: Optional[int] = None
+    limit: int = 50
+
+class CandidateResume(BaseModel):
+    candidate_id: str
+    resume_text: Optional[str] = None
+    profile: Optional[dict] = None  # serialized like /api/full-analysis profiles
+
+class CandidateResumeBulkRequest(BaseModel):
+    resumes: List[CandidateResume]
+
+class RankCandidatesRequest(BaseModel):
+    job_description: Optional[str] = None
+    job_id: Optional[str] = None
+
 # ─── Routes ───────────────────────────────────────────────────────────────────
 
 @app.get("/")
 def root():
     return {"message": "AI Resume Builder API is running!", "version": "1.0.0"}
 
+def _ndjson(obj) -> str:
+    return json.dumps(obj) + "\n"
+
+async def _stream_generate(request: GenerateRequest):
+    """Yield each generated section as an NDJSON line as soon as it is ready."""
+    try:
+        job = _registered_job(request.job_id) if request.job_id else request.job_description
+        context = await engine_executor.run("build_context", request.profile.dict(), job)
+    except Exception as e:
+        yield _ndjson({"error": str(e)})
+        return
+
+    sections = {}
+    if request.generate_resume:
+        sections["resume"] = engine_executor.run(
+            "generate_resume", context.profile, tone=request.tone, context=context
+        )
+    if request.generate_cover_letter and request.company_name:
+        sections["cover_letter"] = engine_executor.run(
+            "generate_cover_letter", context.profile, request.company_name,
+            context.job.job_description, request.tone, context=context
+        )
+    if request.generate_portfolio:
+        sections["portfolio"] = engine_executor.run(
+            "generate_portfolio_content", context.profile, context=context
+        )
+    sections["skills_analysis"] = engine_executor.run(
+        "analyze_skills", context.profile, context.job.job_description, context=context
+    )
+
+    async def labelled(name, coro):
+        try:
+            return name, await coro, None
+        except Exception as e:
+            return name, None, str(e)
+
+    tasks = [asyncio.ensure_future(labelled(name, coro)) for name, coro in sections.items()]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            name, data, error = await next_done
+            if error is None:
+                yield _ndjson({"section": name, "data": data})
+            else:
+                yield _ndjson({"section": name, "error": error})
+        yield _ndjson({"done": True})
+    finally:
+        for task in tasks:
+            task.cancel()
+
+async def _stream_batch(request: BatchGenerateRequest, items: List, invalid: List[dict]):
+    """Yield one NDJSON line per batch item as its chunk completes."""
+    succeeded = failed = 0
+    for item in invalid:
+        failed += 1
+        yield _ndjson(item)
+    try:
+        job = await _compile_job(request.job_description, request.job_id)
+    except Exception as e:
+        yield _ndjson({"error": str(e)})
+        return
+
+    chunk_results = engine_executor.iter_chunked(
+        "generate_batch",
+        items,
+        job,
+        company_name=request.company_name,
+        tone=request.tone,
+        generate_resume=request.generate_resume,
+        generate_cover_letter=request.generate_cover_letter,
+        generate_portfolio=request.generate_portfolio,
+    )
+    async for chunk, results in chunk_results:
+        if isinstance(results, Exception):
+            results = [{"index": index, "success": False, "error": str(results)} for index, _ in chunk]
+        for item in results:
+            if item["success"]:
+                succeeded += 1
+            else:
+                failed += 1
+            yield _ndjson(item)
+    yield _ndjson({"done": True, "total": succeeded + failed, "succeeded": succeeded, "failed": failed})
+
+def _generate_section_inputs(request: GenerateRequest, profile: dict) -> dict:
+    """Inputs each /api/generate section depends on, used to build its cache key."""
+    # A registered JD's id is a hash of its text, so it stands in for the text
+    job = {"job_id": request.job_id} if request.job_id else request.job_description
+    sections = {}
+    if request.generate_resume:
+        sections["resume"] = {"profile": profile, "job_description": job, "tone": request.tone}
+    if request.generate_cover_letter and request.company_name:
+        sections["cover_letter"] = {
+            "profile": profile,
+            "company_name": request.company_name,
+            "job_description": job,
+            "tone": request.tone,
+        }
+    if request.generate_portfolio:
+        sections["portfolio"] = {"profile": profile}
+    sections["skills_analysis"] = {"skills": profile.get("skills"), "job_description": job}
+    return sections
+
 @app.post("/api/generate")
-async def generate_documents(request: GenerateRequest):
-    """Generate resume, cover letter, and portfolio from student profile."""
+async def generate_documents(request: GenerateRequest, stream: bool = False, cache: bool = True):
+    """
+    Generate resume, cover letter, and portfolio from student profile.
+    With ?stream=true each section is sent as an NDJSON line when ready.
+    Sections are cached individually; pass ?cache=false to bypass the cache.
+    """
+    job = _registered_job(request.job_id) if request.job_id else request.job_description
+    if stream:
+        return StreamingResponse(_stream_generate(request), media_type=NDJSON_MEDIA_TYPE)
     try:
+        profile = request.profile.dict()
+        keys = {
+            name: cache_key(f"generate:{name}", inputs)
+            for name, inputs in _generate_section_inputs(request, profile).items()
+        }
         result = {}
+        if cache:
+            for name, key in keys.items():
+                cached = response_cache.get(key)
+                if cached is not None:
+                    result[name] = cached
 
-        if request.generate_resume:
-            result["resume"] = ai_engine.generate_resume(
-                request.profile.dict(),
-                request.job_description,
-                request.tone
+        missing = [name for name in keys if name not in result]
+        if missing:
+            generated = await engine_executor.run(
+                "generate_documents",
+                profile,
+                job,
+                company_name=request.company_name,
+                tone=request.tone,
+                generate_resume="resume" in missing,
+                generate_cover_letter="cover_letter" in missing,
+                generate_portfolio="portfolio" in missing,
+                include_skills_analysis="skills_analysis" in missing,
             )
+            if cache:
+                for name in missing:
+                    response_cache.set(keys[name], generated[name])
+            result.update(generated)
 
-        if request.generate_cover_letter and request.company_name:
-            result["cover_letter"] = ai_engine.generate_cover_letter(
-                request.profile.dict(),
-                request.company_name,
-                request.job_description,
-                request.tone
-            )
+        # Keep the section order of an uncached response
+        return {"success": True, "data": {name: result[name] for name in keys}}
+    except EngineExecutorError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
-        if request.generate_portfolio:
-            result["portfolio"] = ai_engine.generate_portfolio_content(
-                request.profile.dict()
-            )
+def _validate_batch_profiles(profiles: List[dict]):
+    """Split raw batch profiles into valid (index, profile) items and error results."""
+    items, invalid = [], []
+    for index, raw_profile in enumerate(profiles):
+        try:
+            items.append((index, StudentProfile(**raw_profile).dict()))
+        except ValidationError as e:
+            invalid.append({"index": index, "success": False, "error": str(e)})
+    return items, invalid
 
-        result["skills_analysis"] = ai_engine.analyze_skills(
-            request.profile.dict(),
-            request.job_description
+@app.post("/api/generate/batch")
+async def generate_documents_batch(request: BatchGenerateRequest, stream: bool = False):
+    """
+    Generate documents for many profiles against one job description.
+    With ?stream=true each item is sent as an NDJSON line when its chunk finishes.
+    """
+    if len(request.profiles) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=413, detail=f"Batch exceeds {MAX_BATCH_SIZE} profiles")
+    if request.job_id:
+        _registered_job(request.job_id)
+    items, invalid = _validate_batch_profiles(request.profiles)
+    if stream:
+        return StreamingResponse(_stream_batch(request, items, invalid), media_type=NDJSON_MEDIA_TYPE)
+    try:
+        # JD keywords and other JD-derived state are computed once for the batch
+        job = await _compile_job(request.job_description, request.job_id)
+        results = await engine_executor.run_chunked(
+            "generate_batch",
+            items,
+            job,
+            company_name=request.company_name,
+            tone=request.tone,
+            generate_resume=request.generate_resume,
+            generate_cover_letter=request.generate_cover_letter,
+            generate_portfolio=request.generate_portfolio,
         )
+        results = sorted(results + invalid, key=lambda r: r["index"])
+        succeeded = sum(1 for r in results if r["success"])
+        return {
+            "success": True,
+            "total": len(results),
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+            "results": results,
+        }
+    except EngineExecutorError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
-        return {"success": True, "data": result}
+def _registered_job(job_id: str):
+    """Compiled JD for a registered job_id; 404 if it is unknown or has expired."""
+    job = job_registry.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job description: {job_id}")
+    return job
+
+async def _compile_job(job_description: Optional[str], job_id: Optional[str] = None):
+    """The registered JD for job_id, else a JobContext compiled from the text."""
+    if job_id:
+        return _registered_job(job_id)
+    return await engine_executor.run("build_job_context", job_description)
+
+def _job_summary(job_id: str, job) -> dict:
+    return {
+        "job_id": job_id,
+        "keywords": list(job.keywords),
+        "required_skills": ai_engine.skill_interner.names_of(job.skill_bits),
+    }
+
+@app.post("/api/job-descriptions")
+async def register_job_description(request: JobDescriptionRequest):
+    """
+    Compile a job description once and return its id. Pass job_id instead of
+    job_description to /api/ats-score and /api/generate to skip re-parsing it.
+    """
+    try:
+        job_id = job_id_for(request.job_description)
+        job = job_registry.get(job_id)
+        if job is None:
+            job = await engine_executor.run("build_job_context", request.job_description)
+            job_registry.put(job_id, job)
+        return {"success": True, **_job_summary(job_id, job)}
+    except EngineExecutorError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/job-descriptions/{job_id}")
+def get_job_description(job_id: str):
+    return {"success": True, **_job_summary(job_id, _registered_job(job_id))}
+
+@app.post("/api/match-jobs")
+async def match_jobs(request: MatchJobsRequest, k: int = 20):
+    """Top-k postings from the job index (JOB_INDEX_PATH) for a resume, by BM25."""
+    if job_index is None:
+        raise HTTPException(status_code=503, detail="No job index loaded; set JOB_INDEX_PATH")
+    if not 1 <= k <= 100:
+        raise HTTPException(status_code=400, detail="k must be between 1 and 100")
+    try:
+        matches = await engine_executor.run_local(job_index.search, request.resume_text, k)
+        return {"success": True, "indexed_jobs": len(job_index), "matches": matches}
+    except EngineExecutorError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/ats-score")
-async def ats_score(request: ATSRequest):
-    """Score resume against job description for ATS compatibility."""
+async def ats_score(request: ATSRequest, cache: bool = True):
+    """
+    Score resume against job description for ATS compatibility (?cache=false bypasses the cache).
+    Pass job_id from /api/job-descriptions instead of job_description to reuse a compiled JD.
+    """
+    if request.job_id:
+        job, job_key = _registered_job(request.job_id), {"job_id": request.job_id}
+    elif request.job_description is not None:
+        job = job_key = request.job_description
+    else:
+        raise HTTPException(status_code=400, detail="Either job_description or job_id is required")
     try:
-        score = ai_engine.calculate_ats_score(
-            request.resume_text,
-            request.job_description
-        )
+        key = cache_key("ats-score", {"resume_text": request.resume_text, "job_description": job_key})
+        score = response_cache.get(key) if cache else None
+        if score is None:
+            score = await engine_executor.run(
+                "calculate_ats_score",
+                request.resume_text,
+                job
+            )
+            if cache:
+                response_cache.set(key, score)
         return {"success": True, "data": score}
+    except EngineExecutorError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -134,8 +477,10 @@ async def ats_score(request: ATSRequest):
 async def enhance_summary(profile: StudentProfile):
     """Generate an enhanced professional summary."""
     try:
-        summary = ai_engine.generate_professional_summary(profile.dict())
+        summary = await engine_executor.run("generate_professional_summary", profile.dict())
         return {"success": True, "summary": summary}
+    except EngineExecutorError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -143,11 +488,177 @@ async def enhance_summary(profile: StudentProfile):
 async def suggest_skills(profile: StudentProfile):
     """Suggest additional relevant skills based on profile."""
     try:
-        suggestions = ai_engine.suggest_skills(profile.dict())
+        suggestions = await engine_executor.run("suggest_skills", profile.dict())
         return {"success": True, "suggestions": suggestions}
+    except EngineExecutorError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/full-analysis")
+async def full_analysis(request: FullAnalysisRequest, cache: bool = True):
+    """Combined job match, skill gap and bullet quality report (?cache=false bypasses the cache)."""
+    try:
+        snapshot = ml_pipeline.registry.current
+        key = cache_key("full-analysis", {
+            "profile": request.profile.dict(),
+            "job_description": request.job_description,
+            "model_version": snapshot.version if snapshot else None,
+        })
+        analysis = response_cache.get(key) if cache else None
+        if analysis is None:
+            analysis = await engine_executor.run_pipeline(
+                "full_analysis",
+                request.profile.dict(),
+                request.job_description
+            )
+            if cache:
+                response_cache.set(key, analysis)
+        return {"success": True, "data": analysis}
+    except EngineExecutorError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+def _rebuild_model(documents: List[str], version: Optional[str]) -> dict:
+    """Fit and publish a model here, save it, and point the process workers at the saved artifact."""
+    # One rebuild at a time, so the saved file and the published version always agree
+    with _model_rebuild_lock:
+        snapshot = ml_pipeline.registry.build(documents, version)
+        ml_pipeline.save(PIPELINE_MODEL_PATH)
+        engine_executor.publish_model(PIPELINE_MODEL_PATH, snapshot.version)
+    return {"model_version": snapshot.version, "n_documents": snapshot.n_documents}
+
+@app.post("/api/model/rebuild")
+async def rebuild_model(request: ModelRebuildRequest):
+    """Fit a new TF-IDF model on a corpus of resumes and job descriptions and swap every worker to it."""
+    if not request.documents:
+        raise HTTPException(status_code=400, detail="documents must not be empty")
+    if len(request.documents) > MAX_BULLET_BATCH_SIZE:
+        raise HTTPException(status_code=413, detail=f"At most {MAX_BULLET_BATCH_SIZE} documents per request")
+    try:
+        model = await engine_executor.run_local(_rebuild_model, request.documents, request.version)
+        return {"success": True, **model}
+    except EngineExecutorError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/score-bullets")
+async def score_bullets(request: ScoreBulletsRequest):
+    """Score a batch of bullet points; large batches are split across engine workers."""
+    if len(request.bullets) > MAX_BULLET_BATCH_SIZE:
+        raise HTTPException(status_code=413, detail=f"At most {MAX_BULLET_BATCH_SIZE} bullets per request")
+    try:
+        scored = await engine_executor.run_chunked_on("pipeline", "score_bullets", request.bullets)
+        average = sum(s["overall_score"] for s in scored) / len(scored) if scored else 0
+        return {"success": True, "total": len(scored), "average_score": round(average, 1), "results": scored}
+    except EngineExecutorError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/near-duplicates")
+async def near_duplicates(request: NearDuplicateRequest):
+    """Group near-duplicate texts: the bullets of one resume, or whole resumes across a batch."""
+    if len(request.texts) > MAX_BULLET_BATCH_SIZE:
+        raise HTTPException(status_code=413, detail=f"At most {MAX_BULLET_BATCH_SIZE} texts per request")
+    if not 0 < request.threshold <= 1:
+        raise HTTPException(status_code=400, detail="threshold must be in (0, 1]")
+    try:
+        bands_for(request.threshold)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    try:
+        groups = await engine_executor.run("find_near_duplicates", request.texts, request.threshold)
+        return {"success": True, "total": len(request.texts), "groups": groups}
+    except EngineExecutorError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/candidates")
+def add_candidates(request: CandidateBulkRequest):
+    """Store (or replace) candidates' skill sets in the coverage index."""
+    try:
+        added = candidate_index.add_many((c.candidate_id, c.skills) for c in request.candidates)
+        return {"success": True, "added": added, "total": len(candidate_index)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.delete("/api/candidates/{candidate_id}")
+def remove_candidate(candidate_id: str):
+    """Drop a candidate from the coverage index."""
+    if not candidate_index.remove(candidate_id):
+        raise HTTPException(status_code=404, detail=f"Unknown candidate: {candidate_id}")
+    return {"success": True, "total": len(candidate_index)}
+
+@app.post("/api/candidates/search")
+def search_candidates(request: CandidateSearchRequest):
+    """Candidates covering at least min_coverage of the skills (all by default), best coverage first."""
+    try:
+        return {"success": True, "data": candidate_index.query(request.skills, request.min_coverage, request.limit)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/recruiter/resumes")
+async def add_candidate_resumes(request: CandidateResumeBulkRequest):
+    """Store (or replace) candidate resumes, as text or profiles, in the ranking index."""
+    missing = [r.candidate_id for r in request.resumes if r.resume_text is None and r.profile is None]
+    if missing:
+        raise HTTPException(status_code=400, detail=f"resume_text or profile is required for: {', '.join(missing[:10])}")
+    try:
+        added = await engine_executor.run_local(
+            ranking_index.add_many,
+            [(r.candidate_id, r.resume_text if r.resume_text is not None else r.profile) for r in request.resumes]
+        )
+        return {"success": True, "added": added, "total": len(ranking_index)}
+    except EngineExecutorError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.delete("/api/recruiter/resumes/{candidate_id}")
+def remove_candidate_resume(candidate_id: str):
+    """Drop a candidate resume from the ranking index."""
+    if not ranking_index.remove(candidate_id):
+        raise HTTPException(status_code=404, detail=f"Unknown candidate: {candidate_id}")
+    return {"success": True, "total": len(ranking_index)}
+
+@app.post("/api/recruiter/rank")
+async def rank_candidates(request: RankCandidatesRequest, k: int = 20):
+    """Top-k stored resumes for a job description (or registered job_id), by ATS score and TF-IDF similarity."""
+    if request.job_id:
+        job = _registered_job(request.job_id)
+    elif request.job_description is not None:
+        job = request.job_description
+    else:
+        raise HTTPException(status_code=400, detail="Either job_description or job_id is required")
+    if not 1 <= k <= 100:
+        raise HTTPException(status_code=400, detail="k must be between 1 and 100")
+    try:
+        ranked = await engine_executor.run_local(ranking_index.rank, job, k)
+        return {"success": True, "data": ranked}
+    except EngineExecutorError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/skills/lookup")
+def lookup_skill(q: str, limit: int = 5):
+    """Typo-tolerant skill lookup: canonical skills within a small edit distance of q."""
+    return {"success": True, "query": q, "suggestions": ai_engine.skill_canonicalizer.suggest(q, limit)}
+
+@app.get("/api/cache/stats")
+def cache_stats():
+    """Response cache and job description registry hit/miss counters and size."""
+    return {"success": True, "cache": response_cache.stats(), "job_registry": job_registry.stats()}
+
+@app.delete("/api/cache")
+def purge_cache():
+    """Drop every cached response."""
+    return {"success": True, "purged": response_cache.purge()}
+
 @app.get("/api/templates")
 def get_templates():
     """Get available resume templates."""
@@ -167,8 +678,10 @@ async def improve_bullets(data: dict):
     try:
         bullets = data.get("bullets", [])
         role = data.get("role", "")
-        improved = ai_engine.improve_bullet_points(bullets, role)
+        improved = await engine_executor.run("improve_bullet_points", bullets, role)
         return {"success": True, "improved_bullets": improved}
+    except EngineExecutorError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
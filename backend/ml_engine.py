@@ -6,10 +6,63 @@ For production, swap prompt_builder calls to OpenAI/Gemini/Claude API.
 
 import re
 import json
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, FrozenSet, Tuple, Union
 from collections import Counter
 import math
 
+from nlp_utils import Document, TermMatcher, TextIndex, normalize_term, ngrams
+from skill_index import SkillCanonicalizer, SkillInterner
+from near_duplicates import DEFAULT_THRESHOLD, MinHasher, find_near_duplicates
+
+# Bump when generated output changes so cached responses are invalidated
+ENGINE_VERSION = "1.5.6"
+
+_PROFILE_LIST_FIELDS = ("skills", "education", "experience", "projects", "certifications")
+_NESTED_LIST_FIELDS = {"education": ("achievements",), "experience": ("technologies",), "projects": ("technologies",)}
+_DIGIT_RE = re.compile(r'\d')
+_METRIC_PLACEHOLDER = " (quantify impact with metrics)"
+
+
+# ─── Analysis Context ─────────────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class JobContext:
+    """
+    Job-description state derived once and shared by every engine call.
+    skill_bits index the engine's fixed skill vocabulary, never grown after
+    startup, so they mean the same in every worker and after a spill. The
+    JD's TF-IDF vector is left out: it belongs to a model version that
+    /api/model/rebuild can replace under a cached JD, and one transform
+    costs about 0.15 ms.
+    """
+    job_description: Optional[str]
+    text_lower: str
+    tokens: Tuple[str, ...]
+    keywords: Tuple[str, ...]
+    keywords_lower: Tuple[str, ...]
+    keyword_phrases: Tuple[str, ...]
+    keyword_set: FrozenSet[str]
+    keyword_grams: FrozenSet[str]
+    skill_bits: int
+
+
+@dataclass(frozen=True)
+class AnalysisContext:
+    """
+    Immutable per-request analysis state: the normalized profile, its skill
+    sets and the job context. Build it once with ResumeAIEngine.build_context
+    and pass it to every engine method instead of re-deriving it per call.
+    """
+    profile: Dict[str, Any]
+    skills: Tuple[str, ...]
+    skills_lower: Tuple[str, ...]
+    skill_set: FrozenSet[str]
+    skill_phrases: Tuple[str, ...]
+    skill_grams: FrozenSet[str]
+    skill_bits: int
+    job: JobContext
+
 
 class ResumeAIEngine:
     """
@@ -46,24 +99,178 @@ class ResumeAIEngine:
             "marketing": ["SEO", "content strategy", "campaign", "ROI", "conversion", "analytics", "brand"],
         }
 
+        self.role_skill_map = {
+            "frontend": ["TypeScript", "React", "Next.js", "Tailwind CSS", "GraphQL", "Webpack", "Jest"],
+            "backend": ["Docker", "PostgreSQL", "Redis", "Kubernetes", "Kafka", "gRPC", "Terraform"],
+            "fullstack": ["TypeScript", "Docker", "PostgreSQL", "Redis", "GraphQL", "Jest", "CI/CD"],
+            "data": ["PySpark", "Airflow", "DBT", "Snowflake", "Tableau", "BigQuery", "MLflow"],
+            "ml": ["PyTorch", "Hugging Face", "MLflow", "LangChain", "ONNX", "Triton", "Ray"],
+            "devops": ["Terraform", "Ansible", "Prometheus", "Grafana", "ArgoCD", "Helm", "Vault"],
+        }
+        self.generic_skills = ["Docker", "Git", "PostgreSQL", "REST API", "Unit Testing", "CI/CD", "Agile"]
+
+        skill_vocabulary = (
+            [s for sl in self.skill_categories.values() for s in sl]
+            + [s for sl in self.role_skill_map.values() for s in sl]
+            + self.generic_skills
+        )
+
+        # Aliases ("JS", "k8s", "Postgres") resolve to one canonical skill and
+        # misspelled skill entries ("Pyhton") are corrected against the
+        # vocabulary, so skills are compared by canonical key, not spelling
+        self.skill_canonicalizer = SkillCanonicalizer(vocabulary=skill_vocabulary)
+
+        # Precompiled matchers: taxonomy terms (each followed by its aliases)
+        # and action verbs are normalized once here and matched on word
+        # boundaries in a single pass per text
+        self._skill_matcher = TermMatcher(
+            term
+            for sl in self.skill_categories.values() for s in sl
+            for term in [s, *self.skill_canonicalizer.aliases_of(s)]
+        )
+        self._verb_matcher = TermMatcher(v for vlist in self.action_verbs.values() for v in vlist)
+        self._verb_set = frozenset(v.lower() for vlist in self.action_verbs.values() for v in vlist)
+        self._skill_category = {}
+        for cat, cat_skills in self.skill_categories.items():
+            for skill in cat_skills:
+                self._skill_category.setdefault(self.skill_canonicalizer.key(skill), cat)
+
+        # Every skill the engine compares against gets an integer id up front;
+        # profile skill sets become bitsets over this vocabulary. Ids follow
+        # the taxonomy order, and nothing interns into it afterwards
+        self.skill_interner = SkillInterner(skill_vocabulary, canonicalizer=self.skill_canonicalizer)
+
+        # Seeded, so signatures agree across worker processes
+        self.minhasher = MinHasher()
+
+    # ─── Analysis Context ──────────────────────────────────────────────────────
+
+    def build_job_context(self, job_description: Union[str, Document, None]) -> JobContext:
+        """Lowercase, tokenize and extract keywords from a job description once."""
+        doc = Document.of(job_description or "")
+        if isinstance(job_description, Document):
+            job_description = job_description.text
+        tokens = tuple(doc.tokens)
+        keywords = self._extract_keywords(doc)
+        keyword_phrases = tuple(self.skill_canonicalizer.key(k) for k in keywords)
+        keyword_grams = set()
+        for phrase in keyword_phrases:
+            keyword_grams.update(ngrams(phrase.split(" ")))
+        return JobContext(
+            job_description=job_description,
+            text_lower=doc.lower,
+            tokens=tokens,
+            keywords=tuple(keywords),
+            keywords_lower=tuple(k.lower() for k in keywords),
+            keyword_phrases=keyword_phrases,
+            keyword_set=frozenset(keyword_phrases),
+            keyword_grams=frozenset(keyword_grams),
+            skill_bits=self.skill_interner.bits(keywords),
+        )
+
+    def build_context(self, profile: Dict, job_description: Union[str, JobContext, None] = None,
+                      job: Optional[JobContext] = None) -> AnalysisContext:
+        """
+        Build the shared analysis context for one profile/job description pair.
+        job_description may be an already compiled JobContext.
+        """
+        if isinstance(job_description, JobContext):
+            job = job_description
+        normalized = self._normalize_profile(profile)
+        skills = tuple(normalized["skills"])
+        skills_lower = tuple(s.lower() for s in skills)
+        skill_phrases = tuple(self.skill_canonicalizer.fuzzy_key(s) for s in skills)
+        skill_grams = set()
+        for phrase in skill_phrases:
+            skill_grams.update(ngrams(phrase.split(" ")))
+        return AnalysisContext(
+            profile=normalized,
+            skills=skills,
+            skills_lower=skills_lower,
+            skill_set=frozenset(skills_lower),
+            skill_phrases=skill_phrases,
+            skill_grams=frozenset(skill_grams),
+            skill_bits=self.skill_interner.bits(self.skill_canonicalizer.fuzzy_canonical(s) for s in skills),
+            job=job if job is not None else self.build_job_context(job_description),
+        )
+
+    def _normalize_profile(self, profile: Dict) -> Dict:
+        """Copy the profile, replacing null list fields with empty lists."""
+        normalized = dict(profile)
+        for field in _PROFILE_LIST_FIELDS:
+            normalized[field] = list(normalized.get(field) or [])
+        for field, nested_fields in _NESTED_LIST_FIELDS.items():
+            items = []
+            for item in normalized[field]:
+                item = dict(item)
+                for nested in nested_fields:
+                    item[nested] = list(item.get(nested) or [])
+                items.append(item)
+            normalized[field] = items
+        return normalized
+
+    def generate_documents(self, profile: Dict, job_description: Union[str, JobContext, None] = None,
+                           company_name: Optional[str] = None, tone: str = "professional",
+                           generate_resume: bool = True, generate_cover_letter: bool = True,
+                           generate_portfolio: bool = True, include_skills_analysis: bool = True,
+                           context: Optional[AnalysisContext] = None) -> Dict:
+        """Generate every requested document plus the skills analysis from one context."""
+        ctx = context or self.build_context(profile, job_description)
+        result = {}
+
+        if generate_resume:
+            result["resume"] = self.generate_resume(ctx.profile, tone=tone, context=ctx)
+
+        if generate_cover_letter and company_name:
+            result["cover_letter"] = self.generate_cover_letter(
+                ctx.profile, company_name, ctx.job.job_description, tone, context=ctx
+            )
+
+        if generate_portfolio:
+            result["portfolio"] = self.generate_portfolio_content(ctx.profile, context=ctx)
+
+        if include_skills_analysis:
+            result["skills_analysis"] = self.analyze_skills(ctx.profile, ctx.job.job_description, context=ctx)
+        return result
+
+    def generate_batch(self, items: List[Tuple[int, Dict]], job: JobContext, **options) -> List[Dict]:
+        """
+        Run generate_documents for many (index, profile) pairs against one job
+        context. Failures are reported per item instead of failing the batch.
+        """
+        results = []
+        for index, profile in items:
+            try:
+                ctx = self.build_context(profile, job=job)
+                data = self.generate_documents(ctx.profile, context=ctx, **options)
+                results.append({"index": index, "success": True, "data": data})
+            except Exception as e:
+                results.append({"index": index, "success": False, "error": str(e)})
+        return results
+
     # ─── Resume Generation ─────────────────────────────────────────────────────
 
-    def generate_resume(self, profile: Dict, job_description: Optional[str] = None, tone: str = "professional") -> Dict:
+    def generate_resume(self, profile: Dict, job_description: Union[str, JobContext, None] = None, tone: str = "professional",
+                        context: Optional[AnalysisContext] = None) -> Dict:
         """Generate a structured, ATS-optimized resume."""
+        ctx = context or self.build_context(profile, job_description)
+        profile = ctx.profile
+        jd_keywords = list(ctx.job.keywords)
 
-        # Extract keywords from job description if provided
-        jd_keywords = self._extract_keywords(job_description) if job_description else []
+        experience = self._enhance_experience(profile.get("experience", []), ctx.job, tone)
+        projects = self._enhance_projects(profile.get("projects", []), ctx.job)
 
         # Build resume sections
         resume = {
             "header": self._build_header(profile),
             "summary": self._generate_summary(profile, jd_keywords, tone),
-            "skills": self._organize_skills(profile.get("skills", []), jd_keywords),
-            "experience": self._enhance_experience(profile.get("experience", []), jd_keywords, tone),
-            "projects": self._enhance_projects(profile.get("projects", []), jd_keywords),
+            "skills": self._organize_skills(ctx.skills, ctx.skill_phrases, ctx.job),
+            "experience": experience,
+            "projects": projects,
             "education": self._format_education(profile.get("education", [])),
             "certifications": profile.get("certifications", []),
             "ats_keywords_used": jd_keywords[:20] if jd_keywords else [],
+            "duplicate_bullets": self._find_duplicate_bullets(experience, projects),
             "metadata": {
                 "target_role": profile.get("target_role"),
                 "target_industry": profile.get("target_industry"),
@@ -129,7 +336,7 @@ class ResumeAIEngine:
 
         return summary
 
-    def _organize_skills(self, skills: List[str], jd_keywords: List[str]) -> Dict:
+    def _organize_skills(self, skills: Tuple[str, ...], skill_phrases: Tuple[str, ...], job: JobContext) -> Dict:
         """Organize and prioritize skills, highlighting JD matches."""
         categorized = {cat: [] for cat in self.skill_categories}
         categorized["other"] = []
@@ -138,28 +345,41 @@ class ResumeAIEngine:
         priority_skills = []
         regular_skills = []
 
-        for skill in skills:
-            if any(kw.lower() in skill.lower() or skill.lower() in kw.lower() for kw in jd_keywords):
-                priority_skills.append(skill)
+        for skill, phrase in zip(skills, skill_phrases):
+            if self._skill_matches_job(phrase, job):
+                priority_skills.append((skill, phrase))
             else:
-                regular_skills.append(skill)
+                regular_skills.append((skill, phrase))
 
-        all_skills = priority_skills + regular_skills
-
-        for skill in all_skills:
-            placed = False
-            for cat, cat_skills in self.skill_categories.items():
-                if any(s.lower() == skill.lower() or skill.lower() in s.lower() for s in cat_skills):
-                    categorized[cat].append(skill)
-                    placed = True
-                    break
-            if not placed:
-                categorized["other"].append(skill)
+        for skill, phrase in priority_skills + regular_skills:
+            categories = self._categories_of(phrase)
+            categorized[categories[0] if categories else "other"].append(skill)
 
         # Remove empty categories
         return {k: v for k, v in categorized.items() if v}
 
-    def _enhance_experience(self, experiences: List[Dict], keywords: List[str], tone: str) -> List[Dict]:
+    def _skill_matches_job(self, phrase: str, job: JobContext) -> bool:
+        """True if a normalized skill contains a JD keyword or appears inside one."""
+        if not phrase:
+            return False
+        if phrase in job.keyword_grams:
+            return True
+        return not job.keyword_set.isdisjoint(ngrams(phrase.split(" ")))
+
+    def _categories_of(self, phrase: str) -> List[str]:
+        """Skill categories of a normalized skill: exact taxonomy hit first, then terms it contains."""
+        categories = []
+        exact = self._skill_category.get(phrase)
+        if exact:
+            categories.append(exact)
+        if phrase:
+            for term in self._skill_matcher.find(self._skill_matcher.index(phrase)):
+                category = self._skill_category[self.skill_canonicalizer.key(term)]
+                if category not in categories:
+                    categories.append(category)
+        return categories
+
+    def _enhance_experience(self, experiences: List[Dict], job: JobContext, tone: str) -> List[Dict]:
         """Enhance experience bullet points with action verbs and quantification."""
         enhanced = []
         for exp in experiences:
@@ -168,12 +388,12 @@ class ResumeAIEngine:
 
             # Generate enhanced bullets
             bullets = self._generate_experience_bullets(
-                description, exp.get("role", ""), exp.get("technologies", []), keywords, tone
+                description, exp.get("role", ""), exp.get("technologies", []), job.keywords, tone
             )
             enhanced_exp["bullets"] = bullets
             enhanced_exp["technologies_highlighted"] = [
                 tech for tech in exp.get("technologies", [])
-                if any(kw.lower() in tech.lower() for kw in keywords)
+                if not job.keyword_set.isdisjoint(TextIndex(tech).phrases)
             ]
             enhanced.append(enhanced_exp)
 
@@ -192,11 +412,7 @@ class ResumeAIEngine:
         for i, sentence in enumerate(sentences[:5]):
             # Check if sentence already starts with action verb
             first_word = sentence.split()[0] if sentence.split() else ""
-            already_has_verb = any(
-                first_word.lower() == v.lower()
-                for vlist in self.action_verbs.values()
-                for v in vlist
-            )
+            already_has_verb = first_word.lower() in self._verb_set
 
             if not already_has_verb and verbs:
                 verb = verbs[i % len(verbs)]
@@ -209,7 +425,7 @@ class ResumeAIEngine:
             # Add metric suggestion if missing
             has_metric = bool(re.search(r'\d+%?|\d+x|million|thousand', sentence))
             if not has_metric and i < 2:
-                sentence += " (quantify impact with metrics)"
+                sentence += _METRIC_PLACEHOLDER
 
             bullets.append(sentence)
 
@@ -220,14 +436,14 @@ class ResumeAIEngine:
 
         return bullets
 
-    def _enhance_projects(self, projects: List[Dict], keywords: List[str]) -> List[Dict]:
+    def _enhance_projects(self, projects: List[Dict], job: JobContext) -> List[Dict]:
         """Enhance project descriptions for resume."""
         enhanced = []
         for proj in projects:
             enhanced_proj = proj.copy()
             # Check keyword relevance
-            proj_text = (proj.get("description", "") + " ".join(proj.get("technologies", []))).lower()
-            relevance_score = sum(1 for kw in keywords if kw.lower() in proj_text)
+            proj_index = self._index_for(proj.get("description", "") + " " + " ".join(proj.get("technologies", [])), job)
+            relevance_score = sum(1 for phrase in job.keyword_phrases if phrase in proj_index)
             enhanced_proj["relevance_score"] = relevance_score
             enhanced_proj["highlight"] = relevance_score > 2
 
@@ -242,6 +458,29 @@ class ResumeAIEngine:
         enhanced.sort(key=lambda x: x.get("relevance_score", 0), reverse=True)
         return enhanced
 
+    def _find_duplicate_bullets(self, experience: List[Dict], projects: List[Dict]) -> List[Dict]:
+        """Flag near-duplicate experience bullets and project descriptions across the resume."""
+        locations, texts = [], []
+        for i, exp in enumerate(experience):
+            for j, bullet in enumerate(exp.get("bullets", [])):
+                locations.append({"section": "experience", "item": i, "bullet": j, "text": bullet})
+                # The shared metric placeholder would make unrelated bullets look alike
+                texts.append(bullet.replace(_METRIC_PLACEHOLDER, ""))
+        for i, proj in enumerate(projects):
+            description = proj.get("description", "")
+            if description:
+                locations.append({"section": "projects", "item": i, "text": description})
+                texts.append(description)
+
+        return [
+            {"similarity": group["similarity"], "occurrences": [locations[m] for m in group["members"]]}
+            for group in find_near_duplicates(texts, hasher=self.minhasher)
+        ]
+
+    def find_near_duplicates(self, texts: List[str], threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+        """Group near-duplicate texts (bullets or whole resumes) by MinHash/LSH."""
+        return find_near_duplicates(texts, threshold=threshold, hasher=self.minhasher)
+
     def _format_education(self, education: List[Dict]) -> List[Dict]:
         formatted = []
         for edu in education:
@@ -254,8 +493,11 @@ class ResumeAIEngine:
 
     # ─── Cover Letter Generation ───────────────────────────────────────────────
 
-    def generate_cover_letter(self, profile: Dict, company: str, job_description: Optional[str], tone: str) -> Dict:
+    def generate_cover_letter(self, profile: Dict, company: str, job_description: Union[str, JobContext, None], tone: str,
+                              context: Optional[AnalysisContext] = None) -> Dict:
         """Generate a personalized cover letter."""
+        ctx = context or self.build_context(profile, job_description)
+        profile = ctx.profile
         name = profile.get("name", "Candidate")
         target_role = profile.get("target_role", "Software Developer")
         skills = profile.get("skills", [])[:6]
@@ -266,15 +508,14 @@ class ResumeAIEngine:
         degree = education[0].get("degree", "Bachelor's") if education else "Bachelor's"
         field = education[0].get("field", "") if education else ""
 
-        # Extract JD keywords
-        jd_keywords = self._extract_keywords(job_description) if job_description else []
+        jd_keywords = list(ctx.job.keywords)
 
         # Find best matching project
         best_project = None
         if projects:
             for proj in projects:
-                proj_text = proj.get("description", "") + " ".join(proj.get("technologies", []))
-                if any(kw.lower() in proj_text.lower() for kw in jd_keywords):
+                proj_index = self._index_for(proj.get("description", "") + " " + " ".join(proj.get("technologies", [])), ctx.job)
+                if any(phrase in proj_index for phrase in ctx.job.keyword_phrases):
                     best_project = proj
                     break
             if not best_project:
@@ -325,7 +566,10 @@ class ResumeAIEngine:
         # JD-specific paragraph
         jd_para = ""
         if jd_keywords:
-            matching_skills = [s for s in skills if any(kw.lower() in s.lower() for kw in jd_keywords)]
+            matching_skills = [
+                s for s, phrase in zip(skills, ctx.skill_phrases)
+                if not ctx.job.keyword_set.isdisjoint(ngrams(phrase.split(" ")))
+            ]
             if matching_skills:
                 jd_para = (
                     f"I noticed {company} is looking for expertise in {', '.join(jd_keywords[:3])}. "
@@ -349,8 +593,10 @@ class ResumeAIEngine:
 
     # ─── Portfolio Generation ──────────────────────────────────────────────────
 
-    def generate_portfolio_content(self, profile: Dict) -> Dict:
+    def generate_portfolio_content(self, profile: Dict, context: Optional[AnalysisContext] = None) -> Dict:
         """Generate structured portfolio content."""
+        ctx = context or self.build_context(profile)
+        profile = ctx.profile
         name = profile.get("name", "Developer")
         skills = profile.get("skills", [])
         projects = profile.get("projects", [])
@@ -428,8 +674,9 @@ class ResumeAIEngine:
 
     def _generate_skill_chart(self, skills: List[str]) -> List[Dict]:
         chart_data = []
-        for cat, cat_skills in self.skill_categories.items():
-            matching = [s for s in skills if any(cs.lower() in s.lower() or s.lower() in cs.lower() for cs in cat_skills)]
+        skill_categories = [(s, self._categories_of(normalize_term(s))) for s in skills]
+        for cat in self.skill_categories:
+            matching = [s for s, categories in skill_categories if cat in categories]
             if matching:
                 # Proficiency heuristic based on order in skills list
                 proficiency = max(40, 100 - skills.index(matching[0]) * 5) if matching[0] in skills else 60
@@ -475,16 +722,54 @@ class ResumeAIEngine:
 
     # ─── ATS Score ────────────────────────────────────────────────────────────
 
-    def calculate_ats_score(self, resume_text: str, job_description: str) -> Dict:
-        """Calculate ATS compatibility score."""
-        jd_keywords = self._extract_keywords(job_description)
-        resume_lower = resume_text.lower()
+    def calculate_ats_score(self, resume_text: Union[str, Document], job_description: Union[str, Document, JobContext]) -> Dict:
+        """Calculate ATS compatibility score against a JD text or a compiled JobContext."""
+        job = job_description if isinstance(job_description, JobContext) else self.build_job_context(job_description)
+        jd_keywords = job.keywords
+        resume_doc = Document.of(resume_text)
+        resume_index = self._index_for(resume_doc, job)
+        # Canonical skills mentioned under any alias ("k8s" counts for Kubernetes)
+        resume_skills = {self.skill_canonicalizer.key(t) for t in self._skill_matcher.find(resume_index)}
 
         # Keyword matching
-        matched = [kw for kw in jd_keywords if kw.lower() in resume_lower]
-        missed = [kw for kw in jd_keywords if kw.lower() not in resume_lower]
+        found = [phrase in resume_index or phrase in resume_skills for phrase in job.keyword_phrases]
+        matched = [kw for kw, hit in zip(jd_keywords, found) if hit]
+        missed = [kw for kw, hit in zip(jd_keywords, found) if not hit]
         keyword_score = (len(matched) / len(jd_keywords) * 100) if jd_keywords else 0
 
+        format_checks, format_score, verb_score, quant_score = self._ats_resume_checks(resume_doc, resume_index)
+        total_score = int(keyword_score * 0.4 + format_score * 0.25 + verb_score * 0.2 + quant_score * 0.15)
+
+        return {
+            "overall_score": total_score,
+            "breakdown": {
+                "keyword_match": round(keyword_score, 1),
+                "format_score": round(format_score, 1),
+                "action_verbs": round(verb_score, 1),
+                "quantification": round(quant_score, 1),
+            },
+            "matched_keywords": matched[:15],
+            "missing_keywords": missed[:10],
+            "format_checks": format_checks,
+            "recommendations": self._generate_ats_recommendations(keyword_score, format_checks, verb_score, missed),
+        }
+
+    def ats_resume_score(self, resume_text: Union[str, Document]) -> float:
+        """
+        The job-independent part of calculate_ats_score's overall score
+        (format, action verbs, quantification). The overall score is at most
+        this plus 0.4 x the keyword match percentage.
+        """
+        resume_doc = Document.of(resume_text)
+        resume_index = resume_doc.index(max(self._verb_matcher.max_len, 4))
+        _, format_score, verb_score, quant_score = self._ats_resume_checks(resume_doc, resume_index)
+        return format_score * 0.25 + verb_score * 0.2 + quant_score * 0.15
+
+    def _ats_resume_checks(self, resume_doc: Document, resume_index: TextIndex) -> Tuple[Dict, float, float, float]:
+        """Format checks and the format, action-verb and quantification scores of a resume."""
+        resume_text = resume_doc.text
+        resume_lower = resume_doc.lower
+
         # Format checks
         format_checks = {
             "has_email": bool(re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', resume_text)),
@@ -502,29 +787,13 @@ class ResumeAIEngine:
         format_score = sum(format_checks.values()) / len(format_checks) * 100
 
         # Action verbs check
-        all_verbs = [v for vlist in self.action_verbs.values() for v in vlist]
-        verbs_used = sum(1 for v in all_verbs if v.lower() in resume_lower)
+        verbs_used = len(self._verb_matcher.find(resume_index))
         verb_score = min(100, verbs_used * 10)
 
         # Quantification check
         numbers_count = len(re.findall(r'\d+%?|\d+x', resume_text))
         quant_score = min(100, numbers_count * 15)
-
-        total_score = int(keyword_score * 0.4 + format_score * 0.25 + verb_score * 0.2 + quant_score * 0.15)
-
-        return {
-            "overall_score": total_score,
-            "breakdown": {
-                "keyword_match": round(keyword_score, 1),
-                "format_score": round(format_score, 1),
-                "action_verbs": round(verb_score, 1),
-                "quantification": round(quant_score, 1),
-            },
-            "matched_keywords": matched[:15],
-            "missing_keywords": missed[:10],
-            "format_checks": format_checks,
-            "recommendations": self._generate_ats_recommendations(keyword_score, format_checks, verb_score, missed),
-        }
+        return format_checks, format_score, verb_score, quant_score
 
     def _generate_ats_recommendations(self, kw_score, format_checks, verb_score, missed) -> List[str]:
         recs = []
@@ -543,12 +812,20 @@ class ResumeAIEngine:
 
     # ─── Skills Analysis ───────────────────────────────────────────────────────
 
-    def analyze_skills(self, profile: Dict, job_description: Optional[str]) -> Dict:
-        skills = profile.get("skills", [])
-        jd_keywords = self._extract_keywords(job_description) if job_description else []
+    def analyze_skills(self, profile: Dict, job_description: Union[str, JobContext, None],
+                       context: Optional[AnalysisContext] = None) -> Dict:
+        ctx = context or self.build_context(profile, job_description)
+        skills = list(ctx.skills)
+        jd_keywords = ctx.job.keywords
 
-        matching = [s for s in skills if any(kw.lower() in s.lower() or s.lower() in kw.lower() for kw in jd_keywords)]
-        gaps = [kw for kw in jd_keywords if not any(kw.lower() in s.lower() for s in skills)][:8]
+        matching = [
+            s for s, phrase in zip(ctx.skills, ctx.skill_phrases)
+            if self._skill_matches_job(phrase, ctx.job)
+        ]
+        gaps = [
+            kw for kw, phrase in zip(jd_keywords, ctx.job.keyword_phrases)
+            if phrase not in ctx.skill_grams
+        ][:8]
 
         return {
             "total_skills": len(skills),
@@ -559,25 +836,17 @@ class ResumeAIEngine:
             "learning_suggestions": [f"Consider learning {gap}" for gap in gaps[:3]],
         }
 
-    def suggest_skills(self, profile: Dict) -> List[Dict]:
+    def suggest_skills(self, profile: Dict, context: Optional[AnalysisContext] = None) -> List[Dict]:
         """Suggest skills based on existing skills and target role."""
-        target_role = profile.get("target_role", "").lower()
-        current_skills = [s.lower() for s in profile.get("skills", [])]
-
-        role_skill_map = {
-            "frontend": ["TypeScript", "React", "Next.js", "Tailwind CSS", "GraphQL", "Webpack", "Jest"],
-            "backend": ["Docker", "PostgreSQL", "Redis", "Kubernetes", "Kafka", "gRPC", "Terraform"],
-            "fullstack": ["TypeScript", "Docker", "PostgreSQL", "Redis", "GraphQL", "Jest", "CI/CD"],
-            "data": ["PySpark", "Airflow", "DBT", "Snowflake", "Tableau", "BigQuery", "MLflow"],
-            "ml": ["PyTorch", "Hugging Face", "MLflow", "LangChain", "ONNX", "Triton", "Ray"],
-            "devops": ["Terraform", "Ansible", "Prometheus", "Grafana", "ArgoCD", "Helm", "Vault"],
-        }
+        ctx = context or self.build_context(profile)
+        target_role = (ctx.profile.get("target_role") or "").lower()
+        has_skill = self.skill_interner.contains
 
         suggestions = []
-        for role_key, role_skills in role_skill_map.items():
+        for role_key, role_skills in self.role_skill_map.items():
             if role_key in target_role:
                 for skill in role_skills:
-                    if skill.lower() not in current_skills:
+                    if not has_skill(ctx.skill_bits, skill):
                         suggestions.append({
                             "skill": skill,
                             "reason": f"Commonly required for {target_role} roles",
@@ -586,31 +855,32 @@ class ResumeAIEngine:
 
         # Generic suggestions if role not found
         if not suggestions:
-            generic = ["Docker", "Git", "PostgreSQL", "REST API", "Unit Testing", "CI/CD", "Agile"]
-            for skill in generic:
-                if skill.lower() not in current_skills:
+            for skill in self.generic_skills:
+                if not has_skill(ctx.skill_bits, skill):
                     suggestions.append({"skill": skill, "reason": "Widely used across all roles", "priority": "medium"})
 
         return suggestions[:8]
 
-    def generate_professional_summary(self, profile: Dict) -> str:
-        return self._generate_summary(profile, [], "professional")
+    def generate_professional_summary(self, profile: Dict, context: Optional[AnalysisContext] = None) -> str:
+        ctx = context or self.build_context(profile)
+        return self._generate_summary(ctx.profile, [], "professional")
 
     def improve_bullet_points(self, bullets: List[str], role: str) -> List[str]:
         improved = []
+        role_lower = role.lower()
+        category = "development" if "engineer" in role_lower or "develop" in role_lower else "achievement"
+        category_verbs = self.action_verbs[category]
         for bullet in bullets:
             words = bullet.strip().split()
             first_word = words[0] if words else ""
-            all_verbs = [v for vlist in self.action_verbs.values() for v in vlist]
 
-            if not any(first_word.lower() == v.lower() for v in all_verbs):
-                category = "development" if "engineer" in role.lower() or "develop" in role.lower() else "achievement"
-                verb = self.action_verbs[category][len(improved) % len(self.action_verbs[category])]
+            if words and first_word.lower() not in self._verb_set:
+                verb = category_verbs[len(improved) % len(category_verbs)]
                 words[0] = words[0].lower()
                 bullet = f"{verb} {' '.join(words)}"
 
             # Add quantification prompt if missing
-            if not re.search(r'\d+', bullet):
+            if not _DIGIT_RE.search(bullet):
                 bullet += " — [Add specific metric: X%, $Y, N users]"
 
             improved.append(bullet)
@@ -618,27 +888,56 @@ class ResumeAIEngine:
 
     # ─── Utilities ─────────────────────────────────────────────────────────────
 
-    def _extract_keywords(self, text: str) -> List[str]:
+    def find_skills(self, text: Union[str, Document]) -> List[str]:
+        """Canonical taxonomy skills mentioned in text under any alias, in taxonomy order."""
+        canonical = self.skill_canonicalizer.canonical
+        return list(dict.fromkeys(canonical(t) for t in self._skill_matcher.find(self._skill_matcher.index(text))))
+
+    def is_skill(self, term: str) -> bool:
+        """True if term (or an alias of it) is a taxonomy skill that find_skills can report."""
+        return self.skill_canonicalizer.key(term) in self._skill_category
+
+    def _index_for(self, text: Union[str, Document], job: JobContext) -> TextIndex:
+        """Phrase index of text deep enough for every JD keyword and taxonomy term."""
+        longest = max([self._skill_matcher.max_len] + [p.count(" ") + 1 for p in job.keyword_phrases])
+        return Document.of(text).index(max(longest, self._verb_matcher.max_len, 4))
+
+    def _extract_keywords(self, text: Union[str, Document]) -> List[str]:
         """Extract meaningful keywords from text using frequency + tech-term detection."""
-        if not text:
+        doc = Document.of(text)
+        if not doc.text:
             return []
 
-        # Known tech terms (preserve casing)
-        tech_terms = set()
-        all_skills = [s for sl in self.skill_categories.values() for s in sl]
-        for term in all_skills:
-            if term.lower() in text.lower():
-                tech_terms.add(term)
-
-        # Extract n-grams and filter stopwords
-        stopwords = {"and", "the", "for", "with", "you", "our", "will", "have", "are", "this",
-                    "that", "from", "your", "we", "in", "of", "to", "a", "an", "is", "be",
-                    "or", "as", "at", "by", "it", "on", "if", "no", "up", "do", "so"}
-        words = re.findall(r'\b[A-Za-z][A-Za-z0-9+#.-]{2,}\b', text)
-        word_freq = Counter(w.lower() for w in words if w.lower() not in stopwords)
+        # Known tech terms (canonical casing, whatever alias the text used),
+        # found in one word-boundary aware pass and kept in taxonomy order so
+        # the keyword list is deterministic
+        canonical = self.skill_canonicalizer.canonical
+        tech_terms = list(dict.fromkeys(
+            canonical(t) for t in self._skill_matcher.find(self._skill_matcher.index(doc))
+        ))
+
+        # Misspelled tech terms ("Kubernets"): free text is full of real words
+        # one typo from a skill ("reacts", "scalar"), so only long non-English
+        # words with a single edit are corrected, and only next to a known skill
+        misspelled = set()
+        words = doc.content_tokens
+        for i, word in enumerate(words):
+            if len(word) < 6 or word in misspelled or word in self._skill_category:
+                continue
+            if not any(self.is_skill(w) for w in words[max(i - 2, 0):i] + words[i + 1:i + 3]):
+                continue
+            corrected = self.skill_canonicalizer.correction(word, max_distance=1)
+            if corrected and self.is_skill(corrected):
+                misspelled.add(word)
+                if corrected not in tech_terms:
+                    tech_terms.append(corrected)
+
+        # Frequent content words (3+ chars, stopwords already removed)
+        word_freq = Counter(w for w in doc.content_tokens if len(w) > 2 and w not in misspelled)
 
         top_words = [w for w, _ in word_freq.most_common(30)]
 
         # Combine tech terms + frequent words
-        keywords = list(tech_terms) + [w for w in top_words if w not in [t.lower() for t in tech_terms]]
+        tech_keys = {self.skill_canonicalizer.key(t) for t in tech_terms}
+        keywords = tech_terms + [w for w in top_words if self.skill_canonicalizer.key(w) not in tech_keys]
         return keywords[:25]
\ No newline at end of file
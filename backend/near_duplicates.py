@@ -0,0 +1,242 @@
+"""
+AI Resume Builder - Near-Duplicate Detection
+MinHash signatures over word shingles and an LSH band index, so near-duplicate
+bullets, projects or whole resumes are found through bucket collisions
+instead of comparing every pair. Shingles are hashed with CRC32 and the
+permutations come from a seeded RNG rather than Python's salted hash(), so
+signatures are identical across worker processes and restarts.
+"""
+
+import random
+import zlib
+from typing import Dict, FrozenSet, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from nlp_utils import content_tokens
+
+try:
+    import numpy as np
+except ImportError:  # pure-Python signatures are used instead
+    np = None
+
+DEFAULT_NUM_PERM = 64
+DEFAULT_BANDS = 16          # LSHIndex default; find_near_duplicates uses bands_for(threshold)
+DEFAULT_SHINGLE_SIZE = 2
+DEFAULT_THRESHOLD = 0.6
+# Chance that a pair exactly at the threshold shares a bucket, used by bands_for
+DEFAULT_RECALL = 0.95
+
+# Prime just above 2**32: a * x + b stays below 2**64 for 32-bit a, x and b
+_PRIME = 4294967311
+_MAX_HASH = 0xFFFFFFFF
+
+Signature = Tuple[int, ...]
+
+
+def shingles(text: str, size: int = DEFAULT_SHINGLE_SIZE) -> FrozenSet[int]:
+    """CRC32 hashes of the word size-grams of the text's content tokens."""
+    tokens = content_tokens(text)
+    if len(tokens) < size:
+        grams = [" ".join(tokens)] if tokens else []
+    else:
+        grams = map(" ".join, zip(*(tokens[k:] for k in range(size))))
+    return frozenset(zlib.crc32(gram.encode("utf-8")) for gram in grams)
+
+
+def jaccard(a: FrozenSet[int], b: FrozenSet[int]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class MinHasher:
+    """Seeded MinHash over shingle sets: one universal hash per permutation."""
+
+    def __init__(self, num_perm: int = DEFAULT_NUM_PERM, shingle_size: int = DEFAULT_SHINGLE_SIZE, seed: int = 1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = random.Random(seed)
+        self._a = [rng.randrange(1, _MAX_HASH) for _ in range(num_perm)]
+        self._b = [rng.randrange(0, _MAX_HASH) for _ in range(num_perm)]
+        if np is not None:
+            self._a_arr = np.array(self._a, dtype=np.uint64)[:, None]
+            self._b_arr = np.array(self._b, dtype=np.uint64)[:, None]
+
+    def shingles(self, text: str) -> FrozenSet[int]:
+        return shingles(text, self.shingle_size)
+
+    def signature(self, shingle_set: Iterable[int]) -> Optional[Signature]:
+        """MinHash signature of a shingle set, or None for an empty set."""
+        hashes = list(shingle_set)
+        if not hashes:
+            return None
+        if np is not None and len(hashes) > 8:
+            values = np.array(hashes, dtype=np.uint64)[None, :]
+            mins = ((self._a_arr * values + self._b_arr) % np.uint64(_PRIME)).min(axis=1)
+            return tuple((mins & np.uint64(_MAX_HASH)).tolist())
+        return tuple(
+            min((a * x + b) % _PRIME for x in hashes) & _MAX_HASH
+            for a, b in zip(self._a, self._b)
+        )
+
+    def signature_of(self, text: str) -> Optional[Signature]:
+        return self.signature(self.shingles(text))
+
+    @staticmethod
+    def estimate(sig_a: Signature, sig_b: Signature) -> float:
+        """Jaccard estimate: the fraction of permutations whose minima agree."""
+        return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / len(sig_a)
+
+
+def bands_for(threshold: float, num_perm: int = DEFAULT_NUM_PERM, recall: float = DEFAULT_RECALL) -> int:
+    """
+    Band count for a similarity threshold: the banding of num_perm rows with
+    the most rows per band (fewest spurious candidates) under which a pair
+    at exactly threshold Jaccard collides with probability at least recall.
+    Raises ValueError when no banding can, i.e. the threshold is too low.
+    """
+    for rows in range(num_perm, 0, -1):
+        if num_perm % rows == 0:
+            bands = num_perm // rows
+            if 1 - (1 - threshold ** rows) ** bands >= recall:
+                return bands
+    raise ValueError(f"threshold {threshold:g} is too low for {num_perm} MinHash permutations")
+
+
+class LSHIndex:
+    """
+    Banded LSH over MinHash signatures. Each signature is cut into bands and
+    stored in one bucket per band; items sharing any bucket are candidates,
+    so a lookup touches only colliding items instead of the whole index.
+    """
+
+    def __init__(self, hasher: Optional[MinHasher] = None, bands: int = DEFAULT_BANDS):
+        self.hasher = hasher or MinHasher()
+        if self.hasher.num_perm % bands:
+            raise ValueError(f"num_perm {self.hasher.num_perm} is not divisible by {bands} bands")
+        self.bands = bands
+        self.rows = self.hasher.num_perm // bands
+        self._buckets: List[Dict[Signature, List[Hashable]]] = [{} for _ in range(bands)]
+        self._signatures: Dict[Hashable, Signature] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._signatures
+
+    def _band_keys(self, signature: Signature):
+        rows = self.rows
+        return (signature[i * rows:(i + 1) * rows] for i in range(self.bands))
+
+    def add(self, key: Hashable, signature: Optional[Signature]):
+        """Index a signature under key; empty texts (None) are not indexed."""
+        if signature is None:
+            return
+        if key in self._signatures:
+            self.remove(key)
+        self._signatures[key] = signature
+        for buckets, band in zip(self._buckets, self._band_keys(signature)):
+            buckets.setdefault(band, []).append(key)
+
+    def remove(self, key: Hashable) -> bool:
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return False
+        for buckets, band in zip(self._buckets, self._band_keys(signature)):
+            members = buckets[band]
+            members.remove(key)
+            if not members:
+                del buckets[band]
+        return True
+
+    def signature(self, key: Hashable) -> Optional[Signature]:
+        return self._signatures.get(key)
+
+    def candidates(self, signature: Signature) -> List[Hashable]:
+        """Keys sharing at least one band bucket with the signature, in insertion order."""
+        found = {}
+        for buckets, band in zip(self._buckets, self._band_keys(signature)):
+            for key in buckets.get(band, ()):
+                found[key] = True
+        return list(found)
+
+    def query(self, signature: Optional[Signature], threshold: float = DEFAULT_THRESHOLD) -> List[Tuple[Hashable, float]]:
+        """Indexed keys whose estimated Jaccard with the signature is at least threshold, best first."""
+        if signature is None:
+            return []
+        hits = []
+        for key in self.candidates(signature):
+            similarity = MinHasher.estimate(signature, self._signatures[key])
+            if similarity >= threshold:
+                hits.append((key, similarity))
+        hits.sort(key=lambda hit: -hit[1])
+        return hits
+
+    def collisions(self) -> Iterator[List[Hashable]]:
+        """The keys of every bucket holding more than one, band by band, in insertion order."""
+        for buckets in self._buckets:
+            for members in buckets.values():
+                if len(members) > 1:
+                    yield members
+
+
+def find_near_duplicates(texts: Sequence[str], threshold: float = DEFAULT_THRESHOLD,
+                         hasher: Optional[MinHasher] = None, bands: Optional[int] = None) -> List[Dict]:
+    """
+    Group near-duplicate texts. Texts sharing an LSH bucket are confirmed
+    with the exact shingle Jaccard and merged into groups. Within a bucket a
+    text is only compared with one representative per group found so far,
+    so n identical (or templated) texts cost O(n) comparisons, not O(n^2).
+    The banding defaults to bands_for(threshold). Returns
+    [{"members": [i, ...], "similarity": best confirmed pair similarity}],
+    groups ordered by their first member.
+    """
+    hasher = hasher or MinHasher()
+    index = LSHIndex(hasher, bands or bands_for(threshold, hasher.num_perm))
+    shingle_sets = [index.hasher.shingles(text or "") for text in texts]
+    for i, shingle_set in enumerate(shingle_sets):
+        index.add(i, index.hasher.signature(shingle_set))
+
+    parent = list(range(len(texts)))
+
+    def root(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    confirmed = []
+    compared = set()
+    for members in index.collisions():
+        representatives = []
+        for b in members:
+            grouped = False
+            for a in representatives:
+                ra, rb = root(a), root(b)
+                if ra == rb:
+                    grouped = True
+                    continue
+                if (a, b) in compared:
+                    continue
+                compared.add((a, b))
+                similarity = jaccard(shingle_sets[a], shingle_sets[b])
+                if similarity >= threshold:
+                    confirmed.append((a, similarity))
+                    parent[max(ra, rb)] = min(ra, rb)
+                    grouped = True
+            if not grouped:
+                representatives.append(b)
+
+    best: Dict[int, float] = {}
+    for a, similarity in confirmed:
+        r = root(a)
+        best[r] = max(best.get(r, 0.0), similarity)
+
+    groups: Dict[int, List[int]] = {}
+    for i in range(len(texts)):
+        groups.setdefault(root(i), []).append(i)
+    return [
+        {"members": members, "similarity": round(best[r], 3)}
+        for r, members in sorted(groups.items())
+        if len(members) > 1
+    ]
@@ -0,0 +1,230 @@
+"""
+AI Resume Builder - Shared text processing
+Word-boundary aware tokenization, a tokenize-once Document and a precompiled
+multi-term matcher, shared by the engine and the ML pipeline instead of each
+analyzer re-tokenizing the same text with its own regexes.
+"""
+
+import re
+from functools import cached_property
+from typing import Dict, FrozenSet, Iterable, List, Sequence, Set, Tuple, Union
+
+# Tokens keep "+", "#" and inner dots so C++, C#, Node.js and ASP.NET survive;
+# "/" and "-" separate tokens, so "CI/CD" and "CI CD" normalize alike.
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+(?:\.[a-z0-9+#]+)*")
+
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?;])\s+|\n+")
+_METRIC_RE = re.compile(
+    r"\$[\d,]+(?:\.\d+)?[kmb]?|\d[\d,]*(?:\.\d+)?\s*(?:%|x\b|\+|(?:users|customers|hours|days|weeks|million|thousand)\b)?",
+    re.IGNORECASE,
+)
+
+DEFAULT_MAX_PHRASE_LEN = 4
+
+STOPWORDS = frozenset({
+    "and", "the", "for", "with", "you", "our", "will", "have", "are", "this",
+    "that", "from", "your", "we", "in", "of", "to", "a", "an", "is", "be",
+    "or", "as", "at", "by", "it", "on", "if", "no", "up", "do", "so",
+})
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase and split text into matcher tokens."""
+    return _TOKEN_RE.findall(text.lower()) if text else []
+
+
+def content_tokens(text: str) -> List[str]:
+    """Word tokens (letter first, 2+ chars) with stopwords removed."""
+    return [t for t in tokenize(text) if len(t) > 1 and t[0].isalpha() and t not in STOPWORDS]
+
+
+def content_ngrams(tokens: Sequence[str], n_min: int = 1, n_max: int = 1) -> List[str]:
+    """Token n-grams for n in [n_min, n_max], grouped by n, in text order."""
+    grams = []
+    for n in range(n_min, n_max + 1):
+        if n == 1:
+            grams.extend(tokens)
+        else:
+            grams.extend(map(" ".join, zip(*(tokens[k:] for k in range(n)))))
+    return grams
+
+
+def normalize_term(term: str) -> str:
+    """Canonical phrase form of a term: its tokens joined by single spaces."""
+    return " ".join(tokenize(term))
+
+
+def ngrams(tokens: Sequence[str], max_n: int = DEFAULT_MAX_PHRASE_LEN) -> Set[str]:
+    """Every contiguous n-gram of up to max_n tokens, as normalized phrases."""
+    grams = set()
+    count = len(tokens)
+    for i in range(count):
+        for n in range(1, min(max_n, count - i) + 1):
+            grams.add(" ".join(tokens[i:i + n]))
+    return grams
+
+
+class TextIndex:
+    """
+    Phrase set of a text, built in one pass. Membership tests are hash lookups,
+    so checking K terms costs O(K) instead of K scans over the text.
+    """
+
+    __slots__ = ("tokens", "phrases")
+
+    def __init__(self, text: str, max_n: int = DEFAULT_MAX_PHRASE_LEN, tokens: Sequence[str] = None):
+        self.tokens = list(tokens) if tokens is not None else tokenize(text)
+        grams = ngrams(self.tokens, max_n)
+        # Dotted tokens also count as their leading word: "node.js" -> "node"
+        grams.update(t.split(".", 1)[0] for t in self.tokens if "." in t)
+        self.phrases: FrozenSet[str] = frozenset(grams)
+
+    def __contains__(self, phrase: str) -> bool:
+        """True if the already normalized phrase occurs in the text on word boundaries."""
+        return phrase in self.phrases
+
+    def contains_term(self, term: str) -> bool:
+        return normalize_term(term) in self.phrases
+
+
+class TermMatcher:
+    """
+    Precompiled matcher for a fixed term list. Terms are normalized once into a
+    hash table; matching a text is a single pass over its phrases.
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        self.terms: List[str] = []
+        self._ids: Dict[str, List[int]] = {}
+        self._span: Dict[str, int] = {}  # first token -> longest term starting with it
+        self.max_len = 1
+        for term in terms:
+            phrase = normalize_term(term)
+            if not phrase:
+                continue
+            self._ids.setdefault(phrase, []).append(len(self.terms))
+            self.terms.append(term)
+            length = phrase.count(" ") + 1
+            first = phrase.split(" ", 1)[0]
+            self._span[first] = max(self._span.get(first, 0), length)
+            self.max_len = max(self.max_len, length)
+
+    def index(self, text: Union[str, "Document"]) -> TextIndex:
+        """Build (or reuse a Document's) TextIndex deep enough for every term in this matcher."""
+        return Document.of(text).index(max(self.max_len, DEFAULT_MAX_PHRASE_LEN))
+
+    def lookup(self, term: str) -> List[str]:
+        """Terms whose normalized form equals the normalized term."""
+        return [self.terms[i] for i in self._ids.get(normalize_term(term), ())]
+
+    def find_ids(self, text_index: TextIndex) -> List[int]:
+        """Ids of all terms occurring in the indexed text, in registration order."""
+        found = set()
+        for phrase in text_index.phrases:
+            ids = self._ids.get(phrase)
+            if ids:
+                found.update(ids)
+        return sorted(found)
+
+    def scan_ids(self, text: Union[str, "Document"]) -> List[int]:
+        """
+        Same ids as find_ids(index(text)), found by one walk over the tokens
+        without building the phrase index: only positions whose token starts
+        some term are expanded, so cost is linear in the text length.
+        """
+        tokens = Document.of(text).tokens
+        span = self._span
+        found = set()
+        count = len(tokens)
+        for i, token in enumerate(tokens):
+            longest = span.get(token)
+            if longest:
+                for n in range(1, min(longest, count - i) + 1):
+                    ids = self._ids.get(" ".join(tokens[i:i + n]))
+                    if ids:
+                        found.update(ids)
+            if "." in token:
+                # Dotted tokens also count as their leading word: "node.js" -> "node"
+                ids = self._ids.get(token.split(".", 1)[0])
+                if ids:
+                    found.update(ids)
+        return sorted(found)
+
+    def find(self, text_index: TextIndex) -> List[str]:
+        """Terms occurring in the indexed text, deduplicated, in registration order."""
+        seen = set()
+        found = []
+        for i in self.find_ids(text_index):
+            term = self.terms[i]
+            if term not in seen:
+                seen.add(term)
+                found.append(term)
+        return found
+
+
+class Document:
+    """
+    Tokenize-once view of one input text. The lowercased text, tokens with
+    offsets, n-grams, sentences and metric spans are computed lazily and
+    cached, so every analyzer that receives the same Document shares one pass.
+    """
+
+    def __init__(self, text: str):
+        self.text = text or ""
+        self.lower = self.text.lower()
+        self._ngram_cache: Dict[Tuple[int, int], List[str]] = {}
+        self._index_cache: Dict[int, TextIndex] = {}
+
+    @classmethod
+    def of(cls, text: Union[str, "Document"]) -> "Document":
+        """Wrap a string, or return an existing Document unchanged."""
+        return text if isinstance(text, Document) else cls(text)
+
+    @cached_property
+    def token_spans(self) -> List[Tuple[str, int, int]]:
+        """(token, start, end) for every token, offsets into the original text."""
+        return [(m.group(), m.start(), m.end()) for m in _TOKEN_RE.finditer(self.lower)]
+
+    @cached_property
+    def tokens(self) -> List[str]:
+        # Reuse offsets if something already needed them; otherwise findall is cheaper
+        if "token_spans" in self.__dict__:
+            return [t for t, _, _ in self.token_spans]
+        return _TOKEN_RE.findall(self.lower)
+
+    @cached_property
+    def content_tokens(self) -> List[str]:
+        """Word tokens (letter first, 2+ chars) with stopwords removed."""
+        return [t for t in self.tokens if len(t) > 1 and t[0].isalpha() and t not in STOPWORDS]
+
+    @cached_property
+    def word_count(self) -> int:
+        """Whitespace-separated word count, as a reader would count it."""
+        return len(self.text.split())
+
+    @cached_property
+    def sentences(self) -> List[str]:
+        return [s.strip() for s in _SENTENCE_SPLIT_RE.split(self.text) if s.strip()]
+
+    @cached_property
+    def metric_spans(self) -> List[Tuple[int, int]]:
+        """Character spans of numbers, percentages, money and counted units."""
+        return [m.span() for m in _METRIC_RE.finditer(self.text)]
+
+    def ngrams(self, n_min: int = 1, n_max: int = 1) -> List[str]:
+        """Content-token n-grams for n in [n_min, n_max], in document order."""
+        key = (n_min, n_max)
+        if key not in self._ngram_cache:
+            self._ngram_cache[key] = content_ngrams(self.content_tokens, n_min, n_max)
+        return self._ngram_cache[key]
+
+    def index(self, max_n: int = DEFAULT_MAX_PHRASE_LEN) -> TextIndex:
+        """Phrase index over all tokens, cached per depth."""
+        if max_n not in self._index_cache:
+            self._index_cache[max_n] = TextIndex(self.text, max_n, tokens=self.tokens)
+        return self._index_cache[max_n]
+
+    def contains(self, term: str) -> bool:
+        """True if term occurs in the text on word boundaries."""
+        phrase = normalize_term(term)
+        return phrase in self.index(max(DEFAULT_MAX_PHRASE_LEN, phrase.count(" ") + 1))
@@ -0,0 +1,117 @@
+"""
+AI Resume Builder - Response Cache
+Content-addressed LRU cache for engine results. Keys are a canonical hash of
+the request inputs plus the engine version, so identical payloads (retries,
+re-scoring the same resume) are served without touching the engine. Values
+are stored as JSON and decoded on every hit, so callers get their own copy.
+
+Configuration (environment variables):
+    RESPONSE_CACHE_MAX_BYTES  total size cap in bytes, 0 disables (default 64 MB)
+    RESPONSE_CACHE_TTL        entry lifetime in seconds (default 3600)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from ml_engine import ENGINE_VERSION
+
+
+def cache_key(namespace: str, payload: Any) -> str:
+    """Canonical SHA-256 of a JSON-serializable payload, scoped by namespace and engine version."""
+    canonical = json.dumps(
+        {"engine": ENGINE_VERSION, "ns": namespace, "payload": payload},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Thread-safe LRU cache bounded by total serialized size, with per-entry TTL."""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, ttl: float = 3600.0):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (expires_at, size, JSON)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_env(cls) -> "ResponseCache":
+        return cls(
+            max_bytes=int(os.environ.get("RESPONSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+            ttl=float(os.environ.get("RESPONSE_CACHE_TTL", "3600")),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, size, serialized = entry
+            if expires_at < time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return json.loads(serialized)
+
+    def set(self, key: str, value: Any):
+        if not self.enabled:
+            return
+        serialized = json.dumps(value, default=str)
+        size = len(serialized)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, size, serialized)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def purge(self) -> int:
+        """Drop every entry and return how many were removed."""
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            self._bytes = 0
+            return count
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "engine_version": ENGINE_VERSION,
+            }
+
+    def _remove(self, key: str):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
@@ -0,0 +1,530 @@
+"""
+AI Resume Builder - Skill Index
+Skill canonicalization (aliases such as "JS", "k8s" and "Postgres" resolve to
+one canonical skill, typos such as "Pyhton" are corrected through a SymSpell
+delete index), skills interned to integer ids, skill sets stored as
+bitsets (Python ints, bit i = skill id i), and an in-memory coverage index
+over stored candidates that answers "who covers at least K of these skills"
+with bitwise AND and popcount instead of comparing string lists per candidate.
+"""
+
+import re
+import threading
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from nlp_utils import normalize_term
+
+_NONZERO_BYTE_RE = re.compile(b"[^\x00]")
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """Positions of the set bits of a non-negative int, ascending."""
+    if mask <= 0:
+        return
+    data = mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+    # Zero bytes are skipped by the regex engine, so sparse masks stay cheap
+    for match in _NONZERO_BYTE_RE.finditer(data):
+        byte = data[match.start()]
+        base = match.start() * 8
+        while byte:
+            low = byte & -byte
+            yield base + low.bit_length() - 1
+            byte ^= low
+
+
+def _bits_from_positions(positions: Iterable[int], base: int = 0) -> int:
+    """Build a bitset from many positions at once, without one big-int op per bit."""
+    positions = list(positions)
+    if not positions:
+        return base
+    buffer = bytearray(base.to_bytes(max((base.bit_length() + 7) // 8, max(positions) // 8 + 1), "little"))
+    for position in positions:
+        buffer[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(buffer, "little")
+
+
+# ─── Typo-Tolerant Lookup ─────────────────────────────────────────────────────
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Optimal string alignment distance (insert, delete, substitute, adjacent
+    transpose), or max_distance + 1 as soon as it is known to exceed the bound.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous2: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous2, previous = previous, current
+    return min(previous[-1], max_distance + 1)
+
+
+def _deletes(word: str, max_distance: int) -> set:
+    """word plus every string reachable from it by up to max_distance deletions."""
+    found = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier if len(w) > 1 for i in range(len(w))}
+        found |= frontier
+    return found
+
+
+class SkillSpellIndex:
+    """
+    SymSpell-style delete index over a skill vocabulary. Every vocabulary key
+    is stored under all of its deletions up to max_distance, so a lookup only
+    generates the deletions of the query and verifies the few vocabulary
+    entries that share one, instead of computing edit distance to every skill.
+    """
+
+    # Allowed edits by query length: short strings are too easy to confuse
+    LENGTH_LIMITS = ((3, 0), (5, 1))
+
+    def __init__(self, vocabulary: Iterable[str], max_distance: int = 2, cache_size: int = 65536):
+        self.max_distance = max_distance
+        self.terms: List[str] = []
+        self._keys: List[str] = []
+        self._by_key: Dict[str, int] = {}
+        self._deletes: Dict[str, List[int]] = {}
+        for term in vocabulary:
+            key = normalize_term(term)
+            if not key or key in self._by_key:
+                continue
+            term_id = self._by_key[key] = len(self.terms)
+            self.terms.append(term)
+            self._keys.append(key)
+            for variant in _deletes(key, max_distance):
+                self._deletes.setdefault(variant, []).append(term_id)
+        self._lookup_cached = lru_cache(maxsize=cache_size)(self._lookup)
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def __contains__(self, term: str) -> bool:
+        """True if term, normalized, is a vocabulary key."""
+        return normalize_term(term) in self._by_key
+
+    def limit_for(self, key: str) -> int:
+        for length, limit in self.LENGTH_LIMITS:
+            if len(key) <= length:
+                return min(limit, self.max_distance)
+        return self.max_distance
+
+    def lookup(self, term: str, max_distance: Optional[int] = None, limit: int = 5) -> List[Tuple[str, int]]:
+        """
+        Up to limit (vocabulary term, distance) pairs within the edit bound,
+        closest first, ties in vocabulary order. Candidates must share the
+        query's first character, which rules out most real-word collisions.
+        """
+        return list(self._lookup_cached(term, max_distance)[:limit])
+
+    def _lookup(self, term: str, max_distance: Optional[int]) -> Tuple[Tuple[str, int], ...]:
+        key = normalize_term(term)
+        if not key:
+            return ()
+        exact = self._by_key.get(key)
+        if exact is not None:
+            return ((self.terms[exact], 0),)
+        bound = self.limit_for(key)
+        if max_distance is not None:
+            bound = min(bound, max_distance)
+        if bound == 0:
+            return ()
+        candidates = set()
+        for variant in _deletes(key, bound):
+            candidates.update(self._deletes.get(variant, ()))
+        scored = []
+        for term_id in candidates:
+            other = self._keys[term_id]
+            if other[0] != key[0]:
+                continue
+            distance = edit_distance(key, other, bound)
+            if distance <= bound:
+                scored.append((distance, term_id))
+        scored.sort()
+        return tuple((self.terms[term_id], distance) for distance, term_id in scored)
+
+    def correct(self, term: str, max_distance: Optional[int] = None) -> Optional[str]:
+        """Closest vocabulary term within the edit bound, or None."""
+        found = self._lookup_cached(term, max_distance)
+        return found[0][0] if found else None
+
+
+# English words within a typo or two of a skill name ("scale" -> Scala,
+# "flash" -> Flask, "help" -> Helm). A word in this list, or a skill name
+# plus an inflection ("reacts", "rested", "swiftly"), is never corrected.
+COMMON_WORDS = frozenset({
+    "angler", "annular", "argued", "audible", "base", "bask", "bass", "bath", "bush",
+    "decker", "dicker", "docked", "docket", "doctor", "expressly", "fireball", "firehose",
+    "flack", "flank", "flash", "flashy", "graphic", "graphs", "held", "hell", "help",
+    "hemp", "just", "mango", "nose", "note", "nude", "onyx", "reach", "redact", "redid",
+    "reds", "reenact", "reset", "retract", "rubs", "ruse", "rugby", "rush", "scald",
+    "scalar", "scale", "scaled", "scaler", "scales", "scalp", "scaly", "shift", "shifts",
+    "shrink", "sift", "sparing", "spraying", "sprig", "sprint", "sprints", "sprung",
+    "spying", "string", "strings", "tables", "tablet", "touch",
+})
+_INFLECTIONS = ("s", "es", "ed", "d", "ing", "er", "ers", "or", "ly", "y")
+
+# Real technology names that are one edit from a different skill ("NestJS"
+# vs Next.js, "MSSQL" vs MySQL, "GraphDB" vs GraphQL): dotted names and these
+# suffix forms are left as written rather than merged into a neighbour
+_TECH_SUFFIXES = ("js", "db", "sql")
+
+
+def _extends(key: str, skill_key: str) -> bool:
+    """True if key is skill_key with letters appended ("vuex"), other than a doubled last letter."""
+    if not key.startswith(skill_key) or key == skill_key:
+        return False
+    return key != skill_key + skill_key[-1]
+
+
+# ─── Skill Canonicalizer ──────────────────────────────────────────────────────
+
+# Canonical skill -> alternative spellings. Ambiguous short forms ("TF", "CV",
+# "ES") are left out on purpose: a wrong merge is worse than a missed one.
+SKILL_ALIASES = {
+    "JavaScript": ["JS", "ECMAScript", "ES6", "Vanilla JS"],
+    "TypeScript": ["TS"],
+    "Python": ["Python3", "Python 3"],
+    "Go": ["Golang"],
+    "C++": ["CPP"],
+    "C#": ["CSharp", "C Sharp"],
+    "Node.js": ["Node", "NodeJS"],
+    "React": ["ReactJS", "React.js"],
+    "React Native": ["RN"],
+    "Next.js": ["NextJS"],
+    "Vue": ["Vue.js", "VueJS"],
+    "Angular": ["AngularJS"],
+    "Express": ["Express.js", "ExpressJS"],
+    "PostgreSQL": ["Postgres", "PSQL"],
+    "MongoDB": ["Mongo"],
+    "MySQL": ["My SQL"],
+    "Kubernetes": ["K8s", "Kube"],
+    "AWS": ["Amazon Web Services"],
+    "GCP": ["Google Cloud", "Google Cloud Platform"],
+    "Azure": ["Microsoft Azure"],
+    "CI/CD": ["CICD", "Continuous Integration", "Continuous Delivery"],
+    "REST API": ["REST", "RESTful", "RESTful API", "REST APIs"],
+    "GraphQL": ["GQL"],
+    "Scikit-learn": ["sklearn", "scikit learn", "SciKit"],
+    "Machine Learning": ["ML"],
+    "Deep Learning": ["DL"],
+    "Natural Language Processing": ["NLP"],
+    "PyTorch": ["Torch"],
+    "Hugging Face": ["HuggingFace", "HF Transformers"],
+    "Tailwind CSS": ["Tailwind", "TailwindCSS"],
+    "Unit Testing": ["Unit Tests"],
+}
+
+
+class SkillCanonicalizer:
+    """
+    Resolves raw skill strings to a canonical skill. The alias table is
+    compiled once into a hash map keyed by normalized phrase; resolutions are
+    memoized per raw string, so repeated skills cost one dict lookup.
+    Unknown skills are their own canonical form. The fuzzy_* variants also
+    correct unambiguous misspellings against the vocabulary (aliases
+    included, see correction); use them for explicit skill entries, not for
+    words taken from free text.
+    """
+
+    # Automatic corrections: one edit, on terms long enough that one edit is rarely another name
+    MAX_CORRECTION_DISTANCE = 1
+    MIN_CORRECTION_LENGTH = 5
+
+    def __init__(self, aliases: Dict[str, List[str]] = SKILL_ALIASES, vocabulary: Iterable[str] = (),
+                 cache_size: int = 65536):
+        self._canonical: Dict[str, str] = {}
+        self._aliases: Dict[str, List[str]] = {}
+        for canonical, names in aliases.items():
+            self._aliases[normalize_term(canonical)] = list(names)
+            for name in [canonical, *names]:
+                self._canonical.setdefault(normalize_term(name), canonical)
+        self.spell = SkillSpellIndex(
+            [*vocabulary, *(name for canonical, names in aliases.items() for name in [canonical, *names])],
+            cache_size=cache_size,
+        )
+        self.canonical = lru_cache(maxsize=cache_size)(self._canonical_of)
+        self.key = lru_cache(maxsize=cache_size)(self._key_of)
+        self.fuzzy_canonical = lru_cache(maxsize=cache_size)(self._fuzzy_canonical_of)
+        self.fuzzy_key = lru_cache(maxsize=cache_size)(self._fuzzy_key_of)
+
+    def _canonical_of(self, skill: str) -> str:
+        """Canonical display name of skill."""
+        return self._canonical.get(normalize_term(skill), skill.strip())
+
+    def _key_of(self, skill: str) -> str:
+        """Normalized canonical phrase of skill; equal keys mean the same skill."""
+        key = normalize_term(skill)
+        canonical = self._canonical.get(key)
+        return normalize_term(canonical) if canonical else key
+
+    def _fuzzy_canonical_of(self, skill: str) -> str:
+        """Canonical name of skill, correcting a misspelling when it is close to a known skill."""
+        known = self.spell.correct(skill, max_distance=0)
+        if known:
+            return self.canonical(known)
+        return self.correction(skill) or self.canonical(skill)
+
+    def is_common_word(self, word: str) -> bool:
+        """True for English words that must not be corrected into a skill."""
+        key = normalize_term(word)
+        if key in COMMON_WORDS:
+            return True
+        for suffix in _INFLECTIONS:
+            base = key[:-len(suffix)]
+            # "postgress" is a typo, not a plural: English adds "es" after an "s"
+            if key.endswith(suffix) and base in self.spell and not (suffix == "s" and base.endswith("s")):
+                return True
+        return False
+
+    def correction(self, skill: str, max_distance: Optional[int] = None) -> Optional[str]:
+        """
+        Canonical skill a misspelled entry stands for: the one skill within
+        MAX_CORRECTION_DISTANCE edits, when no other skill is within the
+        lookup bound either. None when skill is known or should be kept as
+        written: short terms, dotted and js/db/sql names, common English
+        words, and a skill plus a letter ("Vuex"). Farther matches are only
+        offered by suggest().
+        """
+        key = normalize_term(skill)
+        if not key or key in self.spell or len(key) < self.MIN_CORRECTION_LENGTH:
+            return None
+        if "." in key or key.endswith(_TECH_SUFFIXES) or self.is_common_word(key):
+            return None
+        matches = self.spell.lookup(skill, limit=len(self.spell))
+        if len({self.canonical(term) for term, _ in matches}) != 1:
+            return None
+        term, distance = matches[0]
+        bound = self.MAX_CORRECTION_DISTANCE if max_distance is None else min(max_distance, self.MAX_CORRECTION_DISTANCE)
+        if distance > bound or _extends(key, normalize_term(term)):
+            return None
+        return self.canonical(term)
+
+    def _fuzzy_key_of(self, skill: str) -> str:
+        return self.key(self.fuzzy_canonical(skill))
+
+    def suggest(self, skill: str, limit: int = 5) -> List[Dict]:
+        """Canonical skills within the edit bound of skill, closest first."""
+        suggestions = []
+        seen = set()
+        for term, distance in self.spell.lookup(skill, limit=limit * 2):
+            canonical = self.canonical(term)
+            if canonical not in seen:
+                seen.add(canonical)
+                suggestions.append({"skill": canonical, "matched": term, "distance": distance})
+        return suggestions[:limit]
+
+    def aliases_of(self, skill: str) -> List[str]:
+        """Alternative spellings registered for skill's canonical form."""
+        return self._aliases.get(self.key(skill), [])
+
+    def same(self, a: str, b: str) -> bool:
+        return self.key(a) == self.key(b)
+
+
+# ─── Skill Interner ───────────────────────────────────────────────────────────
+
+class SkillInterner:
+    """
+    Maps skills to dense integer ids, and skill lists to bitsets. With a
+    canonicalizer every alias of a skill shares its canonical skill's id.
+    """
+
+    def __init__(self, skills: Iterable[str] = (), canonicalizer: Optional[SkillCanonicalizer] = None):
+        self.canonicalizer = canonicalizer
+        self.names: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._raw: Dict[str, int] = {}  # spelling as given -> id, skips re-normalizing
+        self._lock = threading.Lock()
+        for skill in skills:
+            self.intern(skill)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def intern(self, skill: str) -> Optional[int]:
+        """Id of skill, assigning the next free id on first sight (None for blank skills)."""
+        skill_id = self._raw.get(skill)
+        if skill_id is not None:
+            return skill_id
+        key = self.key(skill)
+        if not key:
+            return None
+        with self._lock:
+            skill_id = self._ids.get(key)
+            if skill_id is None:
+                skill_id = self._ids[key] = len(self.names)
+                self.names.append(self.canonicalizer.canonical(skill) if self.canonicalizer else skill)
+            self._raw[skill] = skill_id
+        return skill_id
+
+    def id_of(self, skill: str) -> Optional[int]:
+        """Id of an already interned skill, without growing the table."""
+        skill_id = self._raw.get(skill)
+        return skill_id if skill_id is not None else self._ids.get(self.key(skill))
+
+    def key(self, skill: str) -> str:
+        return self.canonicalizer.key(skill) if self.canonicalizer else normalize_term(skill)
+
+    def bits(self, skills: Iterable[str], intern: bool = False) -> int:
+        """
+        Bitset of skills. Unknown skills are interned when intern is True and
+        ignored otherwise, so lookups against a fixed vocabulary stay bounded.
+        """
+        lookup = self.intern if intern else self.id_of
+        mask = 0
+        for skill in skills:
+            skill_id = lookup(skill)
+            if skill_id is not None:
+                mask |= 1 << skill_id
+        return mask
+
+    def contains(self, bits: int, skill: str) -> bool:
+        skill_id = self.id_of(skill)
+        return skill_id is not None and bool(bits >> skill_id & 1)
+
+    def names_of(self, bits: int) -> List[str]:
+        return [self.names[i] for i in iter_bits(bits)]
+
+
+# ─── Candidate Coverage Index ─────────────────────────────────────────────────
+
+class CandidateCoverageIndex:
+    """
+    Stored candidates and, per skill, a posting bitset over candidate slots.
+    A query adds the postings of the required skills with a bit-sliced
+    counter (one bitset per binary digit of the coverage count), so every
+    candidate's coverage is computed at once in O(skills x log skills)
+    big-int operations, independent of how many skills each candidate has.
+    """
+
+    def __init__(self, interner: Optional[SkillInterner] = None):
+        self.interner = interner or SkillInterner()
+        self._slots: Dict[str, int] = {}
+        self._candidates: List[Optional[str]] = []
+        self._skill_bits: List[int] = []
+        self._free: List[int] = []
+        self._postings: Dict[int, int] = {}
+        self._live = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, candidate_id: str) -> bool:
+        return candidate_id in self._slots
+
+    def add(self, candidate_id: str, skills: Iterable[str]):
+        """Store or replace one candidate's skill set."""
+        self.add_many([(candidate_id, skills)])
+
+    def add_many(self, candidates: Iterable[Tuple[str, Iterable[str]]]) -> int:
+        """Store or replace many candidates, updating each posting once. Returns how many were added."""
+        # The last entry for a repeated id wins, as if they were added one by one
+        candidates = dict(candidates)
+        added: Dict[int, List[int]] = {}
+        slots = []
+        with self._lock:
+            for candidate_id, skills in candidates.items():
+                if candidate_id in self._slots:
+                    self._remove(candidate_id)
+                slot = self._free.pop() if self._free else len(self._candidates)
+                if slot == len(self._candidates):
+                    self._candidates.append(None)
+                    self._skill_bits.append(0)
+                skill_ids = {self.interner.intern(skill) for skill in skills}
+                skill_ids.discard(None)
+                bits = 0
+                for skill_id in skill_ids:
+                    bits |= 1 << skill_id
+                    added.setdefault(skill_id, []).append(slot)
+                self._slots[candidate_id] = slot
+                self._candidates[slot] = candidate_id
+                self._skill_bits[slot] = bits
+                slots.append(slot)
+            for skill_id, skill_slots in added.items():
+                self._postings[skill_id] = _bits_from_positions(skill_slots, self._postings.get(skill_id, 0))
+            self._live = _bits_from_positions(slots, self._live)
+        return len(slots)
+
+    def remove(self, candidate_id: str) -> bool:
+        """Drop a candidate; returns False if it was not stored."""
+        with self._lock:
+            if candidate_id not in self._slots:
+                return False
+            self._remove(candidate_id)
+            return True
+
+    def _remove(self, candidate_id: str):
+        slot = self._slots.pop(candidate_id)
+        clear = ~(1 << slot)
+        for skill_id in iter_bits(self._skill_bits[slot]):
+            self._postings[skill_id] &= clear
+        self._live &= clear
+        self._candidates[slot] = None
+        self._skill_bits[slot] = 0
+        self._free.append(slot)
+
+    def query(self, required_skills: Iterable[str], min_coverage: Optional[int] = None, limit: int = 50) -> Dict:
+        """
+        Candidates covering at least min_coverage of required_skills (all of
+        them by default), ranked by coverage, ties in storage-slot order.
+        """
+        required = {self.interner.key(s) for s in required_skills} - {""}
+        # Skills no candidate has ever listed cannot be covered but still count as required
+        required_ids = sorted(i for i in map(self.interner.id_of, required) if i is not None)
+        required_bits = _bits_from_positions(required_ids)
+        threshold = max(1, min(len(required) if min_coverage is None else min_coverage, len(required)))
+
+        with self._lock:
+            return self._query(required_ids, required_bits, len(required), threshold, limit)
+
+    def _query(self, required_ids: List[int], required_bits: int, n_required: int,
+               threshold: int, limit: int) -> Dict:
+        postings = [self._postings.get(i, 0) for i in required_ids]
+
+        # Bit-sliced counter: planes[k] holds bit k of every candidate's coverage
+        planes: List[int] = []
+        for posting in postings:
+            carry = posting
+            for k in range(len(planes)):
+                if not carry:
+                    break
+                planes[k], carry = planes[k] ^ carry, planes[k] & carry
+            if carry:
+                planes.append(carry)
+
+        total = 0
+        results = []
+        for coverage in range(len(postings), threshold - 1, -1):
+            mask = self._live
+            for k, plane in enumerate(planes):
+                mask &= plane if coverage >> k & 1 else ~plane
+            if coverage >> len(planes):
+                mask = 0
+            total += mask.bit_count()
+            for slot in iter_bits(mask):
+                if len(results) >= limit:
+                    break
+                results.append({
+                    "candidate_id": self._candidates[slot],
+                    "coverage": coverage,
+                    "matched_skills": self.interner.names_of(self._skill_bits[slot] & required_bits),
+                })
+
+        return {
+            "required_skills": n_required,
+            "min_coverage": threshold,
+            "total": total,
+            "candidates": results,
+        }
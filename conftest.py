@@ -0,0 +1,4 @@
+# test_api.py drives a running server (python test_api.py) and
+# test_results.txt is its saved output, not a doctest; the unit tests next
+# to them run standalone under pytest
+collect_ignore = ["test_api.py", "test_results.txt"]
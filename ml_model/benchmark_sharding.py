@@ -0,0 +1,91 @@
+"""
+AI Resume Builder - Sharded Job Search Benchmark
+================================================
+Measures query throughput of a job index searched in one process and by
+ShardedJobIndex with 1, 2, 4, ... worker processes, and checks that every
+sharded result list equals the single-process one.
+
+    python benchmark_sharding.py --index jobs.idx --queries 500
+    python benchmark_sharding.py --docs 200000 --shards 1,2,4,8
+
+Without --index a synthetic corpus (Zipf-distributed vocabulary) is built and
+saved to a temporary file first. Throughput only scales with shards up to the
+number of idle cores; the CPU count is printed alongside the results.
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import List
+
+from job_index import JobIndex, ShardedJobIndex
+
+_SKILL_TERMS = ["python", "react", "docker", "kubernetes", "aws", "sql", "java", "golang", "rust"]
+
+
+def synthetic_corpus(n_docs: int, vocab_size: int = 20000, seed: int = 0):
+    """(id, title, text) postings whose word frequencies follow a Zipf law."""
+    rng = random.Random(seed)
+    vocab = _SKILL_TERMS + [f"term{i}" for i in range(vocab_size)]
+    weights = [1 / (i + 1) ** 1.05 for i in range(len(vocab))]
+    for i in range(n_docs):
+        yield f"job-{i}", f"Posting {i}", " ".join(rng.choices(vocab, weights, k=rng.randint(80, 300)))
+
+
+def synthetic_queries(n_queries: int, vocab_size: int = 20000, seed: int = 1) -> List[str]:
+    """Resume-length query texts over the same vocabulary as synthetic_corpus."""
+    rng = random.Random(seed)
+    vocab = _SKILL_TERMS + [f"term{i}" for i in range(vocab_size)]
+    weights = [1 / (i + 1) ** 1.05 for i in range(len(vocab))]
+    return [" ".join(rng.choices(vocab, weights, k=rng.randint(100, 500))) for _ in range(n_queries)]
+
+
+def _throughput(search_many, queries: List[str], k: int):
+    start = time.perf_counter()
+    results = search_many(queries, k)
+    elapsed = time.perf_counter() - start
+    return results, len(queries) / elapsed
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--index", help="saved JobIndex to search (default: build a synthetic one)")
+    parser.add_argument("--docs", type=int, default=100000, help="synthetic corpus size")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=20)
+    parser.add_argument("--shards", default="1,2,4,8", help="comma-separated shard counts")
+    args = parser.parse_args(argv)
+
+    path = args.index
+    if not path:
+        path = os.path.join(tempfile.mkdtemp(prefix="job-index-"), "jobs.idx")
+        start = time.perf_counter()
+        JobIndex.build(synthetic_corpus(args.docs)).save(path)
+        print(f"built {args.docs} postings in {time.perf_counter() - start:.1f}s -> {path}")
+
+    index = JobIndex.load(path)
+    queries = synthetic_queries(args.queries)
+    print(f"{len(index)} postings, {len(queries)} queries, k={args.k}, {os.cpu_count()} CPUs")
+
+    expected, baseline = _throughput(index.search_many, queries, args.k)
+    print(f"{'single process':>16}: {baseline:8.1f} queries/s")
+
+    for n_shards in (int(n) for n in args.shards.split(",")):
+        sharded = ShardedJobIndex(path, n_shards)
+        try:
+            sharded.search(queries[0], args.k)  # start the workers and map the index
+            results, qps = _throughput(sharded.search_many, queries, args.k)
+        finally:
+            sharded.shutdown()
+        exact = "exact" if results == expected else "MISMATCH"
+        print(f"{n_shards:>9} shards: {qps:8.1f} queries/s  x{qps / baseline:.2f}  {exact}")
+        if results != expected:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""
+AI Resume Builder - Bulk Resume x Job Matching
+==============================================
+Scores every resume against every job description for placement drives and
+prints each resume's best matches as JSON Lines:
+
+    python bulk_match.py resumes.jsonl jobs.jsonl --top-k 5 --out scores.bmf
+    python bulk_match.py resumes.jsonl jobs.jsonl --out scores.csv --format csv
+
+Both inputs are JSON Lines with one {"id": ..., "text": ...} per line. The
+matrix is computed in blocks of resumes, and --out streams it to a binary
+similarity matrix (see ml_pipeline.read_similarity_matrix) or a CSV file.
+With --model the TF-IDF model of a saved pipeline is used; otherwise one is
+fitted on the two input sets.
+"""
+
+import argparse
+import json
+import sys
+from contextlib import ExitStack
+from typing import List, Tuple
+
+from ml_pipeline import ResumeMLPipeline, SimilarityMatrixWriter
+
+
+def read_jsonl(path: str, id_field: str = "id", text_field: str = "text") -> Tuple[List[str], List[str]]:
+    """Ids and texts of each non-empty line; ids default to the line number."""
+    ids, texts = [], []
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f):
+            if line.strip():
+                record = json.loads(line)
+                ids.append(str(record.get(id_field, line_number)))
+                texts.append(record.get(text_field) or "")
+    return ids, texts
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("resumes", help="JSON Lines file of resumes")
+    parser.add_argument("jobs", help="JSON Lines file of job descriptions")
+    parser.add_argument("--id-field", default="id", help="JSON field holding each record's id (default: id)")
+    parser.add_argument("--text-field", default="text", help="JSON field holding each record's text (default: text)")
+    parser.add_argument("--top-k", type=int, default=5, help="matches printed per resume (default: 5)")
+    parser.add_argument("--block-rows", type=int, default=256, help="resumes scored per block (default: 256)")
+    parser.add_argument("--out", help="write the full matrix to this file")
+    parser.add_argument(
+        "--format", choices=SimilarityMatrixWriter.FORMATS, default="binary", help="file format of --out (default: binary)"
+    )
+    parser.add_argument("--model", help="pipeline artifact saved with ResumeMLPipeline.save")
+    args = parser.parse_args(argv)
+
+    resume_ids, resumes = read_jsonl(args.resumes, args.id_field, args.text_field)
+    job_ids, jobs = read_jsonl(args.jobs, args.id_field, args.text_field)
+    pipeline = ResumeMLPipeline.load(args.model) if args.model else ResumeMLPipeline()
+
+    with ExitStack() as stack:
+        sink = None
+        if args.out:
+            writer = stack.enter_context(SimilarityMatrixWriter(
+                args.out, (len(resumes), len(jobs)), args.format, row_labels=resume_ids, column_labels=job_ids
+            ))
+            sink = writer.write_rows
+        result = pipeline.similarity_matrix(resumes, jobs, top_k=args.top_k, block_rows=args.block_rows, sink=sink)
+
+    for resume_id, matches in zip(resume_ids, result["top_matches"]):
+        print(json.dumps({
+            "resume_id": resume_id,
+            "matches": [
+                {"job_id": job_ids[m["job_index"]], "similarity_score": m["similarity_score"]}
+                for m in matches
+            ],
+        }))
+    rows, cols = result["shape"]
+    print(f"scored {rows} resumes x {cols} jobs (model {result['model_version']})", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,502 @@
+"""
+AI Resume Builder - Job Posting Index
+=====================================
+BM25 inverted index over a job-description corpus, answering "which postings
+best match this resume" without scoring every posting.
+
+Postings are stored in blocks of BLOCK_SIZE documents: doc-id gaps at the
+narrowest byte width that fits the block (1, 2 or 4 bytes) followed by one
+byte of term frequency per posting. Each block records its last doc id and
+its best BM25 contribution, so a query can skip whole blocks. The index is
+saved as a model artifact (see ml_pipeline.write_artifact) and memory-mapped
+on load; worker processes that open the same file share its pages.
+
+Top-k retrieval is Block-Max MaxScore: query terms are ordered by their best
+possible contribution, terms that cannot lift a document into the current
+top k on their own are only probed for candidates found through the others,
+and a probe is skipped when the block maximum rules the candidate out.
+
+Build an index from a JSON Lines corpus with one {"id", "title", "text"} per
+line, then point JOB_INDEX_PATH at the saved file:
+
+    JobIndex.build_jsonl("jobs.jsonl").save("jobs.idx")
+
+With JOB_INDEX_SHARDS above 1 the index is searched by a ShardedJobIndex:
+worker processes each take one doc-id range of the same file and their top
+k lists are merged, with results identical to a single-process search.
+"""
+
+import copy
+import functools
+import heapq
+import json
+import math
+import os
+import sys
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from itertools import accumulate
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from ml_pipeline import ShardPool, _array_bytes, _array_view, merge_top_k, read_artifact, write_artifact
+from nlp_utils import content_tokens
+
+BLOCK_SIZE = 128
+DEFAULT_MAX_QUERY_TERMS = 32
+WINDOW_SIZE = 4096  # doc ids merged per step of a search
+_WIDTH_TYPECODES = {1: "B", 2: "H", 4: "I"}
+_END = 1 << 32  # past every doc id; an exhausted cursor sits here
+
+
+def _bm25_idf(n_docs: int, df: int) -> float:
+    return math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+
+
+class JobIndex:
+    """Disk-backed BM25 index over job postings with top-k search."""
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.n_docs = 0
+        self.avgdl = 0.0
+        self.vocabulary: Dict[str, int] = {}
+        self.doc_ids: List[str] = []
+        self.titles: List[str] = []
+        self.doc_lengths = array("I")
+        self.idf = array("d")
+        self.term_max_score = array("d")
+        self.term_df = array("I")
+        self.term_block_start = array("I", [0])
+        self.block_last_doc = array("I")
+        self.block_offset = array("Q")
+        self.block_max_score = array("d")
+        self.block_width = b""
+        self.postings = b""
+        self._norms = array("d")
+        self.doc_range: Optional[Tuple[int, int]] = None  # [lo, hi) searched by a partition
+
+    # ─── Building ─────────────────────────────────────────────────────────────
+
+    @classmethod
+    def build(
+        cls,
+        documents: Iterable[Tuple[str, str, str]],
+        k1: float = 1.2,
+        b: float = 0.75,
+        min_df: int = 2,
+    ) -> "JobIndex":
+        """
+        Index (job_id, title, text) triples in one pass. Terms seen in fewer
+        than min_df postings are dropped, which keeps typos and one-off names
+        out of the vocabulary.
+        """
+        index = cls(k1=k1, b=b)
+        docs_of: Dict[str, array] = {}
+        tfs_of: Dict[str, array] = {}
+        for doc, (job_id, title, text) in enumerate(documents):
+            tokens = content_tokens(text)
+            index.doc_ids.append(str(job_id))
+            index.titles.append(title or "")
+            index.doc_lengths.append(len(tokens))
+            for term, tf in Counter(tokens).items():
+                postings = docs_of.get(term)
+                if postings is None:
+                    postings = docs_of[term] = array("I")
+                    tfs_of[term] = array("B")
+                postings.append(doc)
+                tfs_of[term].append(min(tf, 255))
+
+        index.n_docs = len(index.doc_ids)
+        index.avgdl = sum(index.doc_lengths) / index.n_docs if index.n_docs else 0.0
+        index._compute_norms()
+
+        blob = bytearray()
+        widths = bytearray()
+        terms = sorted(t for t, postings in docs_of.items() if len(postings) >= min_df)
+        for term_id, term in enumerate(terms):
+            docs, tfs = docs_of.pop(term), tfs_of.pop(term)
+            idf = _bm25_idf(index.n_docs, len(docs))
+            index.vocabulary[term] = term_id
+            index.idf.append(idf)
+            index.term_df.append(len(docs))
+            best = 0.0
+            previous = 0
+            for start in range(0, len(docs), BLOCK_SIZE):
+                block_docs = docs[start:start + BLOCK_SIZE]
+                block_tfs = tfs[start:start + BLOCK_SIZE]
+                gaps = [block_docs[0] - previous]
+                gaps.extend(d - p for p, d in zip(block_docs, block_docs[1:]))
+                width = 1 if max(gaps) < 1 << 8 else 2 if max(gaps) < 1 << 16 else 4
+                block_best = max(index._term_score(idf, tf, d) for d, tf in zip(block_docs, block_tfs))
+                index.block_last_doc.append(block_docs[-1])
+                index.block_offset.append(len(blob))
+                index.block_max_score.append(block_best)
+                widths.append(width)
+                blob += _array_bytes(array(_WIDTH_TYPECODES[width], gaps))
+                blob += block_tfs.tobytes()
+                best = max(best, block_best)
+                previous = block_docs[-1]
+            index.term_max_score.append(best)
+            index.term_block_start.append(len(index.block_last_doc))
+        index.block_width = bytes(widths)
+        index.postings = bytes(blob)
+        return index
+
+    @classmethod
+    def build_jsonl(
+        cls,
+        path: str,
+        id_field: str = "id",
+        title_field: str = "title",
+        text_field: str = "text",
+        **options,
+    ) -> "JobIndex":
+        """Build from a JSON Lines corpus; postings without an id are numbered by line."""
+
+        def records():
+            with open(path, encoding="utf-8") as f:
+                for line_no, line in enumerate(f):
+                    if line.strip():
+                        record = json.loads(line)
+                        yield (
+                            record.get(id_field, line_no),
+                            record.get(title_field, ""),
+                            record[text_field],
+                        )
+
+        return cls.build(records(), **options)
+
+    # ─── Persistence ──────────────────────────────────────────────────────────
+
+    def save(self, path: str):
+        terms = sorted(self.vocabulary, key=self.vocabulary.get)
+        header = {
+            "kind": "bm25_job_index",
+            "k1": self.k1,
+            "b": self.b,
+            "block_size": BLOCK_SIZE,
+            "n_docs": self.n_docs,
+            "n_terms": len(terms),
+            "avgdl": self.avgdl,
+        }
+        write_artifact(
+            path,
+            header,
+            {
+                "vocabulary": "\n".join(terms).encode("utf-8"),
+                "doc_ids": "\n".join(i.replace("\n", " ") for i in self.doc_ids).encode("utf-8"),
+                "titles": "\n".join(t.replace("\n", " ") for t in self.titles).encode("utf-8"),
+                "doc_lengths": _array_bytes(array("I", self.doc_lengths)),
+                "idf": _array_bytes(array("d", self.idf)),
+                "term_max_score": _array_bytes(array("d", self.term_max_score)),
+                "term_df": _array_bytes(array("I", self.term_df)),
+                "term_block_start": _array_bytes(array("I", self.term_block_start)),
+                "block_last_doc": _array_bytes(array("I", self.block_last_doc)),
+                "block_offset": _array_bytes(array("Q", self.block_offset)),
+                "block_max_score": _array_bytes(array("d", self.block_max_score)),
+                "block_width": bytes(self.block_width),
+                "postings": bytes(self.postings),
+            },
+        )
+
+    @classmethod
+    def load(cls, path: str, use_mmap: bool = True) -> "JobIndex":
+        """Load an index saved with save(); postings and block tables stay memory-mapped."""
+        header, sections = read_artifact(path, use_mmap)
+        if header.get("kind") != "bm25_job_index":
+            raise ValueError(f"{path} does not contain a job index artifact")
+        if header["block_size"] != BLOCK_SIZE:
+            raise ValueError(f"Unsupported job index block size {header['block_size']}")
+        index = cls(k1=header["k1"], b=header["b"])
+        index.n_docs = header["n_docs"]
+        index.avgdl = header["avgdl"]
+        terms = bytes(sections["vocabulary"]).decode("utf-8").split("\n") if header["n_terms"] else []
+        index.vocabulary = {t: i for i, t in enumerate(terms)}
+        if index.n_docs:
+            index.doc_ids = bytes(sections["doc_ids"]).decode("utf-8").split("\n")
+            index.titles = bytes(sections["titles"]).decode("utf-8").split("\n")
+        index.doc_lengths = _array_view(sections["doc_lengths"], "I")
+        index.idf = _array_view(sections["idf"], "d")
+        index.term_max_score = _array_view(sections["term_max_score"], "d")
+        index.term_df = _array_view(sections["term_df"], "I")
+        index.term_block_start = _array_view(sections["term_block_start"], "I")
+        index.block_last_doc = _array_view(sections["block_last_doc"], "I")
+        index.block_offset = _array_view(sections["block_offset"], "Q")
+        index.block_max_score = _array_view(sections["block_max_score"], "d")
+        index.block_width = sections["block_width"]
+        index.postings = sections["postings"]
+        index._compute_norms()
+        return index
+
+    @classmethod
+    def from_env(cls) -> Optional[Union["JobIndex", "ShardedJobIndex"]]:
+        """
+        Load the index named by JOB_INDEX_PATH, or None when it is unset. With
+        JOB_INDEX_SHARDS above 1 it is searched by that many worker processes.
+        """
+        path = os.environ.get("JOB_INDEX_PATH")
+        if not path:
+            return None
+        shards = int(os.environ.get("JOB_INDEX_SHARDS", "1"))
+        return ShardedJobIndex(path, shards) if shards > 1 else cls.load(path)
+
+    def partition(self, shard: int, n_shards: int) -> "JobIndex":
+        """
+        View of one of n_shards contiguous doc-id ranges. It shares postings,
+        idf and length norms with the whole index, so scores are unchanged and
+        the per-shard top k lists merge into the global top k.
+        """
+        if not 0 <= shard < n_shards:
+            raise ValueError(f"Shard {shard} is out of range for {n_shards} shards")
+        part = copy.copy(self)
+        part.doc_range = (self.n_docs * shard // n_shards, self.n_docs * (shard + 1) // n_shards)
+        return part
+
+    def __len__(self) -> int:
+        return self.n_docs
+
+    # ─── Scoring ──────────────────────────────────────────────────────────────
+
+    def _compute_norms(self):
+        # The length-dependent half of the BM25 denominator, once per posting
+        k1, b, avgdl = self.k1, self.b, self.avgdl or 1.0
+        self._norms = array("d", (k1 * (1 - b + b * dl / avgdl) for dl in self.doc_lengths))
+
+    def _term_score(self, idf: float, tf: int, doc: int) -> float:
+        return idf * tf * (self.k1 + 1) / (tf + self._norms[doc])
+
+    def _decode_block(self, block: int, first_block: int, df: int) -> Tuple[List[int], bytes]:
+        """Doc ids and term frequencies of one posting block."""
+        count = min(BLOCK_SIZE, df - (block - first_block) * BLOCK_SIZE)
+        width = self.block_width[block]
+        start = self.block_offset[block]
+        gaps = array(_WIDTH_TYPECODES[width])
+        gaps.frombytes(self.postings[start:start + count * width])
+        if sys.byteorder != "little":
+            gaps.byteswap()
+        previous = self.block_last_doc[block - 1] if block > first_block else 0
+        docs = list(accumulate(gaps, initial=previous))[1:]
+        tfs = bytes(self.postings[start + count * width:start + count * (width + 1)])
+        return docs, tfs
+
+    def query_terms(self, text: str, max_terms: int = DEFAULT_MAX_QUERY_TERMS) -> List[Tuple[int, float]]:
+        """
+        (term id, weight) for the indexed terms of a query text. Repeated terms
+        weigh 1 + log(count); a long query such as a whole resume is cut down
+        to its max_terms terms with the highest weight x idf.
+        """
+        counts = Counter(t for t in content_tokens(text) if t in self.vocabulary)
+        weighted = [(self.vocabulary[t], 1 + math.log(c)) for t, c in counts.items()]
+        weighted.sort(key=lambda tw: (-tw[1] * self.idf[tw[0]], tw[0]))
+        return weighted[:max_terms]
+
+    def search(self, text: str, k: int = 20, max_terms: int = DEFAULT_MAX_QUERY_TERMS) -> List[Dict]:
+        """Top-k postings for a query text (e.g. a resume) by BM25, best first."""
+        return self.hits(self.top_docs(self.query_terms(text, max_terms), k))
+
+    def search_many(self, texts: Sequence[str], k: int = 20, max_terms: int = DEFAULT_MAX_QUERY_TERMS) -> List[List[Dict]]:
+        return [self.search(text, k, max_terms) for text in texts]
+
+    def hits(self, top: Iterable[Tuple[float, int]]) -> List[Dict]:
+        """Response entries for (score, doc) pairs."""
+        return [
+            {"job_id": self.doc_ids[doc], "title": self.titles[doc], "score": round(score, 4)}
+            for score, doc in top
+        ]
+
+    def top_docs(self, terms: Sequence[Tuple[int, float]], k: int) -> List[Tuple[float, int]]:
+        """
+        Unrounded (score, doc) of the k best documents in this index's doc range
+        for weighted query terms (see query_terms), ordered by (-score, doc).
+        """
+        cursors = [_PostingCursor(self, term_id, weight) for term_id, weight in terms]
+        cursors = [c for c in cursors if c.doc != _END]
+        if k <= 0 or not cursors:
+            return []
+        # Ascending upper bounds: cursors[:first_essential] together cannot beat theta
+        cursors.sort(key=lambda c: c.upper)
+        bounds = list(accumulate(c.upper for c in cursors))
+        first_essential = 0
+        heap: List[Tuple[float, int]] = []  # (score, -doc): the weakest hit sits on top
+        theta = 0.0
+
+        while first_essential < len(cursors):
+            # Essential lists are merged a window of doc ids at a time, so the
+            # per-posting work is a dict update rather than a cursor comparison
+            essential = first_essential
+            low = min(c.doc for c in cursors[essential:])
+            if low == _END:
+                break
+            partial: Dict[int, float] = {}
+            for c in cursors[essential:]:
+                c.collect(low + WINDOW_SIZE, partial)
+
+            for doc in sorted(partial):
+                score = partial[doc]
+                if essential and score + bounds[essential - 1] <= theta:
+                    continue
+                pruned = False
+                for i in range(essential - 1, -1, -1):
+                    c = cursors[i]
+                    rest = bounds[i - 1] if i else 0.0
+                    if score + rest + c.block_max(doc) <= theta:
+                        pruned = True
+                        break
+                    c.seek(doc)
+                    if c.doc == doc:
+                        score += c.score()
+                if pruned:
+                    continue
+
+                if len(heap) < k:
+                    heapq.heappush(heap, (score, -doc))
+                elif score > theta:
+                    heapq.heapreplace(heap, (score, -doc))
+                else:
+                    continue
+                if len(heap) == k:
+                    theta = heap[0][0]
+                    while first_essential < len(cursors) and bounds[first_essential] <= theta:
+                        first_essential += 1
+
+        return sorted(((score, -neg_doc) for score, neg_doc in heap), key=lambda hit: (-hit[0], hit[1]))
+
+
+def _load_partition(path: str, shard: int, n_shards: int) -> JobIndex:
+    return JobIndex.load(path).partition(shard, n_shards)
+
+
+class ShardedJobIndex:
+    """
+    A saved JobIndex searched by a ShardPool. Every worker memory-maps the
+    same file and searches one doc-id range; the parent turns the query into
+    weighted terms once, and the per-shard top k lists are merged into the
+    same hits JobIndex.search returns.
+    """
+
+    def __init__(self, path: str, n_shards: int):
+        self.index = JobIndex.load(path)
+        self.n_shards = n_shards
+        self.pool = ShardPool(functools.partial(_load_partition, path), n_shards)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def search(self, text: str, k: int = 20, max_terms: int = DEFAULT_MAX_QUERY_TERMS) -> List[Dict]:
+        return self.search_many([text], k, max_terms)[0]
+
+    def search_many(self, texts: Sequence[str], k: int = 20, max_terms: int = DEFAULT_MAX_QUERY_TERMS) -> List[List[Dict]]:
+        """search() for a batch of query texts, sent to each shard as one task."""
+        if not texts:
+            return []
+        calls = [(self.index.query_terms(text, max_terms), k) for text in texts]
+        per_shard = self.pool.scatter_batch("top_docs", calls)
+        return [
+            self.index.hits(merge_top_k([shard_hits[i] for shard_hits in per_shard], k))
+            for i in range(len(texts))
+        ]
+
+    def shutdown(self):
+        self.pool.shutdown()
+
+
+class _PostingCursor:
+    """Forward iterator over one term's postings, decoding a block at a time."""
+
+    __slots__ = ("index", "weight", "idf", "df", "first_block", "end_block", "stop", "upper",
+                 "block", "docs", "tfs", "pos", "doc")
+
+    def __init__(self, index: JobIndex, term_id: int, weight: float):
+        self.index = index
+        self.weight = weight
+        self.idf = index.idf[term_id]
+        self.df = index.term_df[term_id]
+        self.first_block = index.term_block_start[term_id]
+        self.end_block = index.term_block_start[term_id + 1]
+        self.upper = weight * index.term_max_score[term_id]
+        # A partition only visits postings in its doc range: blocks past the
+        # first one reaching stop are dropped, and doc ids >= stop read as _END
+        start, self.stop = index.doc_range or (0, _END)
+        if self.stop != _END:
+            self.end_block = min(
+                self.end_block,
+                bisect_left(index.block_last_doc, self.stop, self.first_block, self.end_block) + 1,
+            )
+        self.doc = _END
+        if self.first_block < self.end_block:
+            self._load(self.first_block)
+            self.seek(start)
+
+    def _load(self, block: int):
+        self.block = block
+        self.docs, self.tfs = self.index._decode_block(block, self.first_block, self.df)
+        self._move(0)
+
+    def _move(self, pos: int):
+        self.pos = pos
+        doc = self.docs[pos]
+        self.doc = doc if doc < self.stop else _END
+
+    def next(self):
+        if self.pos + 1 < len(self.docs):
+            self._move(self.pos + 1)
+        elif self.block + 1 < self.end_block:
+            self._load(self.block + 1)
+        else:
+            self.doc = _END
+
+    def _block_for(self, target: int) -> int:
+        """First block at or after the current one that may hold target (end_block if none)."""
+        if target <= self.index.block_last_doc[self.block]:
+            return self.block
+        return bisect_left(self.index.block_last_doc, target, self.block + 1, self.end_block)
+
+    def seek(self, target: int):
+        """Advance to the first posting with doc id >= target."""
+        if self.doc >= target:
+            return
+        block = self._block_for(target)
+        if block == self.end_block:
+            self.doc = _END
+            return
+        if block != self.block:
+            self._load(block)
+        self._move(bisect_left(self.docs, target, self.pos))
+
+    def block_max(self, target: int) -> float:
+        """Upper bound on this term's score for target, from block metadata only."""
+        if self.doc == _END:
+            return 0.0
+        if self.doc >= target:
+            return self.weight * self.index.block_max_score[self.block]
+        block = self._block_for(target)
+        if block == self.end_block:
+            return 0.0
+        return self.weight * self.index.block_max_score[block]
+
+    def score(self) -> float:
+        return self.weight * self.index._term_score(self.idf, self.tfs[self.pos], self.doc)
+
+    def collect(self, end: int, partial: Dict[int, float]):
+        """Add this term's score for every posting with doc id < end into partial, advancing past them."""
+        if self.doc >= end:
+            return
+        end = min(end, self.stop)
+        scale = self.weight * self.idf * (self.index.k1 + 1)
+        norms = self.index._norms
+        get = partial.get
+        while True:
+            docs, tfs = self.docs, self.tfs
+            stop = bisect_left(docs, end, self.pos)
+            for pos in range(self.pos, stop):
+                doc, tf = docs[pos], tfs[pos]
+                partial[doc] = get(doc, 0.0) + scale * tf / (tf + norms[doc])
+            if stop < len(docs):
+                self._move(stop)
+                return
+            if self.block + 1 >= self.end_block:
+                self.doc = _END
+                return
+            self._load(self.block + 1)
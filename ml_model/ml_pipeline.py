@@ -13,12 +13,40 @@ For production use: Fine-tune on resume datasets from Kaggle's
 """
 
 import re
+import csv
+import heapq
 import json
 import math
-from typing import List, Dict, Tuple, Optional
+import mmap
+import struct
+from array import array
+from typing import (
+    Any,
+    Callable,
+    List,
+    Dict,
+    Tuple,
+    Optional,
+    Union,
+    Sequence,
+    Iterable,
+    Iterator,
+    FrozenSet,
+)
 from collections import Counter, defaultdict
 import os
 import sys
+import threading
+import time
+import zlib
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:  # pure-Python fallback is used for similarity_matrix
+    np = None
 
 # Ensure the backend package is importable when running this module directly
 _HERE = os.path.dirname(__file__)
@@ -26,6 +54,152 @@ _BACKEND_PATH = os.path.abspath(os.path.join(_HERE, "..", "backend"))
 if _BACKEND_PATH not in sys.path:
     sys.path.insert(0, _BACKEND_PATH)
 
+from ml_engine import JobContext, ResumeAIEngine
+from nlp_utils import Document, TermMatcher, content_ngrams, content_tokens
+from skill_index import CandidateCoverageIndex, SkillCanonicalizer, SkillInterner
+
+
+# ─── Model Artifacts ──────────────────────────────────────────────────────────
+
+ARTIFACT_MAGIC = b"BMFMODEL"
+ARTIFACT_FORMAT_VERSION = 1
+_ARTIFACT_PREAMBLE = struct.Struct("<8sII")  # magic, format version, header length
+
+
+def write_artifact(path: str, header: Dict, sections: Dict[str, bytes]):
+    """
+    Write a binary model artifact: a fixed preamble, a JSON header, then raw
+    sections (8-byte aligned, little-endian arrays) whose offsets are recorded
+    in the header. The file is written to a temp path and renamed atomically.
+    """
+    layout = {}
+    offset = 0
+    for name, blob in sections.items():
+        offset += -offset % 8
+        layout[name] = [offset, len(blob)]
+        offset += len(blob)
+    prefix = _artifact_prefix(header, layout)
+    base = len(prefix)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(prefix)
+        for name, blob in sections.items():
+            f.write(b"\0" * (base + layout[name][0] - f.tell()))
+            f.write(blob)
+    os.replace(tmp_path, path)
+
+
+def _artifact_prefix(header: Dict, layout: Dict[str, List[int]]) -> bytes:
+    """Preamble and JSON header, padded so the sections start 8-byte aligned."""
+    header_bytes = json.dumps({**header, "sections": layout}).encode("utf-8")
+    prefix = _ARTIFACT_PREAMBLE.pack(
+        ARTIFACT_MAGIC, ARTIFACT_FORMAT_VERSION, len(header_bytes)
+    )
+    prefix += header_bytes
+    return prefix + b"\0" * (-len(prefix) % 8)
+
+
+def read_artifact(path: str, use_mmap: bool = True) -> Tuple[Dict, Dict[str, memoryview]]:
+    """
+    Read an artifact written by write_artifact. With use_mmap the sections are
+    zero-copy views into a read-only shared mapping, so worker processes that
+    load the same file share its pages.
+    """
+    with open(path, "rb") as f:
+        if use_mmap:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            buffer = f.read()
+    view = memoryview(buffer)
+    magic, version, header_len = _ARTIFACT_PREAMBLE.unpack_from(view, 0)
+    if magic != ARTIFACT_MAGIC:
+        raise ValueError(f"{path} is not a model artifact")
+    if version > ARTIFACT_FORMAT_VERSION:
+        raise ValueError(f"Unsupported artifact format version {version}")
+    start = _ARTIFACT_PREAMBLE.size
+    header = json.loads(bytes(view[start : start + header_len]).decode("utf-8"))
+    base = start + header_len
+    base += -base % 8
+    sections = {
+        name: view[base + offset : base + offset + length]
+        for name, (offset, length) in header["sections"].items()
+    }
+    return header, sections
+
+
+def _array_bytes(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _array_view(section: memoryview, typecode: str):
+    """Typed view over a little-endian section; copied only on big-endian hosts."""
+    if sys.byteorder == "little":
+        return section.cast(typecode)
+    values = array(typecode, section.tobytes())
+    values.byteswap()
+    return values
+
+
+# ─── Sparse Matrix ────────────────────────────────────────────────────────────
+
+
+class CSRMatrix:
+    """
+    Compressed sparse row matrix backed by typed arrays. Row i holds the
+    column ids indices[indptr[i]:indptr[i+1]] (sorted) and their values.
+    """
+
+    def __init__(self, indptr: array, indices: array, data: array, n_cols: int):
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.shape = (len(indptr) - 1, n_cols)
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def row(self, i: int) -> Tuple[array, array]:
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return self.indices[start:end], self.data[start:end]
+
+    def row_dict(self, i: int) -> Dict[int, float]:
+        indices, data = self.row(i)
+        return dict(zip(indices, data))
+
+    def to_dicts(self) -> List[Dict[int, float]]:
+        return [self.row_dict(i) for i in range(len(self))]
+
+    def to_dense(self):
+        """Dense NumPy array of the matrix (requires NumPy)."""
+        dense = np.zeros(self.shape, dtype=np.float64)
+        counts = np.diff(np.frombuffer(self.indptr, dtype=np.int64))
+        rows = np.repeat(np.arange(self.shape[0]), counts)
+        dense[rows, np.frombuffer(self.indices, dtype=np.int32)] = np.frombuffer(
+            self.data, dtype=np.float64
+        )
+        return dense
+
+    def dot_row(self, i: int, other: "CSRMatrix", j: int) -> float:
+        """Sparse dot product of row i of this matrix with row j of other."""
+        a_idx, a_val = self.row(i)
+        b_idx, b_val = other.row(j)
+        p = q = 0
+        total = 0.0
+        while p < len(a_idx) and q < len(b_idx):
+            if a_idx[p] == b_idx[q]:
+                total += a_val[p] * b_val[q]
+                p += 1
+                q += 1
+            elif a_idx[p] < b_idx[q]:
+                p += 1
+            else:
+                q += 1
+        return total
+
 
 # ─── TF-IDF Vectorizer (pure Python, no sklearn needed) ───────────────────────
 
@@ -33,96 +207,271 @@ if _BACKEND_PATH not in sys.path:
 class TFIDFVectorizer:
     """Lightweight TF-IDF vectorizer implemented from scratch."""
 
-    def __init__(self, max_features: int = 500, ngram_range: Tuple = (1, 2)):
+    def __init__(
+        self,
+        max_features: int = 500,
+        ngram_range: Tuple = (1, 2),
+        df_capacity: Optional[int] = None,
+    ):
         self.max_features = max_features
         self.ngram_range = ngram_range
+        # Bound on tracked document frequencies during partial_fit; the least
+        # frequent terms are pruned beyond it so memory stays flat on big corpora
+        self.df_capacity = df_capacity or max(100_000, max_features * 100)
         self.vocabulary = {}
         self.idf_values = {}
+        self.idf = array("d")
+        self.document_frequency = Counter()
+        self.n_documents = 0
         self.fitted = False
 
-    def _tokenize(self, text: str) -> List[str]:
-        tokens = re.findall(r"\b[a-z][a-z0-9+#.-]{1,}\b", text.lower())
-        stopwords = {
-            "and",
-            "the",
-            "for",
-            "with",
-            "you",
-            "our",
-            "will",
-            "have",
-            "are",
-            "this",
-            "that",
-            "from",
-            "your",
-            "we",
-            "in",
-            "of",
-            "to",
-            "a",
-            "an",
-            "is",
-            "be",
-            "or",
-            "as",
-            "at",
-            "by",
-        }
-        tokens = [t for t in tokens if t not in stopwords]
-
-        ngrams = []
-        for n in range(self.ngram_range[0], self.ngram_range[1] + 1):
-            ngrams.extend(
-                [" ".join(tokens[i : i + n]) for i in range(len(tokens) - n + 1)]
-            )
-        return ngrams
+    def _tokenize(self, text: Union[str, Document]) -> List[str]:
+        """Stopword-filtered n-grams, reusing the Document's cached tokenization."""
+        return Document.of(text).ngrams(self.ngram_range[0], self.ngram_range[1])
 
-    def fit(self, documents: List[str]):
-        """Fit TF-IDF on corpus."""
-        all_tokens = []
-        doc_tokens = []
+    def fit(self, documents: Iterable[Union[str, Document]]):
+        """Fit TF-IDF on corpus, computing document frequencies in a single pass."""
+        self.document_frequency = Counter()
+        self.n_documents = 0
+        return self.partial_fit(documents)
 
+    def partial_fit(self, documents: Iterable[Union[str, Document]]):
+        """
+        Update document frequencies with another chunk of documents (any
+        iterable, consumed once) and refresh the vocabulary and IDF. Term ids
+        can change between calls, so re-transform after updating.
+        """
+        df = self.document_frequency
         for doc in documents:
-            tokens = set(self._tokenize(doc))
-            doc_tokens.append(tokens)
-            all_tokens.extend(tokens)
-
-        token_freq = Counter(all_tokens)
-        top_tokens = [t for t, _ in token_freq.most_common(self.max_features)]
+            df.update(set(self._tokenize(doc)))
+            self.n_documents += 1
+            if len(df) > self.df_capacity * 2:
+                self._prune_document_frequency()
+        if len(df) > self.df_capacity:
+            self._prune_document_frequency()
+
+        top_tokens = [t for t, _ in df.most_common(self.max_features)]
         self.vocabulary = {t: i for i, t in enumerate(top_tokens)}
 
-        # Compute IDF
-        N = len(documents)
-        for token in self.vocabulary:
-            df = sum(1 for dt in doc_tokens if token in dt)
-            self.idf_values[token] = math.log((N + 1) / (df + 1)) + 1
+        N = self.n_documents
+        self.idf = array("d", (math.log((N + 1) / (df[t] + 1)) + 1 for t in top_tokens))
+        self.idf_values = dict(zip(top_tokens, self.idf))
 
         self.fitted = True
         return self
 
-    def transform(self, documents: List[str]) -> List[Dict[str, float]]:
-        """Transform documents to TF-IDF vectors (as dicts for sparse representation)."""
+    def save(self, path: str):
+        """Persist the fitted vocabulary, IDF and document frequencies."""
+        write_artifact(path, {"kind": "tfidf", **self._artifact_header()}, self._artifact_sections())
+
+    @classmethod
+    def load(cls, path: str, use_mmap: bool = True) -> "TFIDFVectorizer":
+        """Load a vectorizer saved with save(); the IDF array stays memory-mapped."""
+        header, sections = read_artifact(path, use_mmap)
+        return cls._from_artifact(header, sections)
+
+    def _artifact_header(self) -> Dict:
+        return {
+            "max_features": self.max_features,
+            "ngram_range": list(self.ngram_range),
+            "df_capacity": self.df_capacity,
+            "n_documents": self.n_documents,
+            "n_terms": len(self.vocabulary),
+        }
+
+    def _artifact_sections(self) -> Dict[str, bytes]:
+        if not self.fitted:
+            raise RuntimeError("Vectorizer not fitted. Call fit() first.")
+        terms = sorted(self.vocabulary, key=self.vocabulary.get)
+        return {
+            "vocabulary": "\n".join(terms).encode("utf-8"),
+            "idf": _array_bytes(array("d", self.idf)),
+            "df": _array_bytes(array("q", (self.document_frequency.get(t, 0) for t in terms))),
+        }
+
+    @classmethod
+    def _from_artifact(cls, header: Dict, sections: Dict[str, memoryview]) -> "TFIDFVectorizer":
+        vectorizer = cls(
+            max_features=header["max_features"],
+            ngram_range=tuple(header["ngram_range"]),
+            df_capacity=header["df_capacity"],
+        )
+        vocab_blob = bytes(sections["vocabulary"]).decode("utf-8")
+        terms = vocab_blob.split("\n") if header["n_terms"] else []
+        vectorizer.vocabulary = {t: i for i, t in enumerate(terms)}
+        vectorizer.idf = _array_view(sections["idf"], "d")
+        vectorizer.idf_values = dict(zip(terms, vectorizer.idf))
+        vectorizer.document_frequency = Counter(dict(zip(terms, _array_view(sections["df"], "q"))))
+        vectorizer.n_documents = header["n_documents"]
+        vectorizer.fitted = True
+        return vectorizer
+
+    def __getstate__(self):
+        # Memory-mapped views cannot be pickled; ship a private copy instead
+        state = self.__dict__.copy()
+        state["idf"] = array("d", self.idf)
+        return state
+
+    def _prune_document_frequency(self):
+        self.document_frequency = Counter(
+            dict(self.document_frequency.most_common(self.df_capacity))
+        )
+
+    def transform_matrix(self, documents: Sequence[Union[str, Document]]) -> CSRMatrix:
+        """
+        Transform documents to an L2-normalized CSR matrix. Each document costs
+        O(its own tokens): only tokens found in the vocabulary are looked up.
+        """
         if not self.fitted:
             raise RuntimeError("Vectorizer not fitted. Call fit() first.")
 
-        vectors = []
+        vocabulary = self.vocabulary
+        idf = self.idf
+        indptr = array("q", [0])
+        indices = array("i")
+        data = array("d")
         for doc in documents:
-            tokens = self._tokenize(doc)
-            tf = Counter(tokens)
-            total = max(len(tokens), 1)
-
-            vector = {}
-            for token, idx in self.vocabulary.items():
-                if token in tf:
-                    tfidf = (tf[token] / total) * self.idf_values.get(token, 1)
-                    vector[idx] = tfidf
-            vectors.append(vector)
-        return vectors
+            tf = Counter(
+                term_id
+                for term_id in map(vocabulary.get, self._tokenize(doc))
+                if term_id is not None
+            )
+            row = sorted(tf.items())
+            weights = [count * idf[term_id] for term_id, count in row]
+            norm = math.sqrt(sum(w * w for w in weights))
+            if norm > 0:
+                indices.extend(term_id for term_id, _ in row)
+                data.extend(w / norm for w in weights)
+            indptr.append(len(indices))
+        return CSRMatrix(indptr, indices, data, len(vocabulary))
+
+    def transform(self, documents: List[str]) -> List[Dict[str, float]]:
+        """Transform documents to TF-IDF vectors (as dicts for sparse representation)."""
+        return self.transform_matrix(documents).to_dicts()
 
     def fit_transform(self, documents: List[str]) -> List[Dict[str, float]]:
         return self.fit(documents).transform(documents)
 
+    def similarity_matrix(self, A: CSRMatrix, B: CSRMatrix):
+        """
+        Cosine similarity of every row of A against every row of B. Rows are
+        L2-normalized at transform time, so this is a plain sparse A @ B.T:
+        each nonzero of A is multiplied only with the rows of B sharing its
+        term. Returns a NumPy array when NumPy is installed, otherwise a list
+        of lists. Memory is the dense len(A) x len(B) result plus B's nonzeros;
+        the vocabulary size never enters it.
+        """
+        if np is not None:
+            return self._similarity_block(A, self._column_arrays(B), len(B))
+        return self._similarity_rows(A, self._column_postings(B), len(B))
+
+    def similarity_blocks(
+        self,
+        documents: Iterable[Union[str, Document]],
+        B: CSRMatrix,
+        block_rows: int = 256,
+    ) -> Iterator[Tuple[int, Any]]:
+        """
+        Cosine similarity of each document against every row of B, yielded as
+        (first row, block) for block_rows documents at a time. Documents are
+        transformed one block at a time, so memory holds B's nonzeros and one
+        block_rows x len(B) block of the matrix rather than all of it. Blocks
+        are NumPy arrays when NumPy is installed, otherwise lists of lists.
+        """
+        if np is not None:
+            columns = self._column_arrays(B)
+        else:
+            postings = self._column_postings(B)
+        documents = iter(documents)
+        start = 0
+        while True:
+            chunk = list(islice(documents, block_rows))
+            if not chunk:
+                return
+            A = self.transform_matrix(chunk)
+            if np is not None:
+                yield start, self._similarity_block(A, columns, len(B))
+            else:
+                yield start, self._similarity_rows(A, postings, len(B))
+            start += len(chunk)
+
+    @staticmethod
+    def _column_postings(B: CSRMatrix) -> Dict[int, List[Tuple[int, float]]]:
+        """B inverted into (row, value) postings per term."""
+        postings = defaultdict(list)
+        for j in range(len(B)):
+            b_idx, b_val = B.row(j)
+            for term_id, value in zip(b_idx, b_val):
+                postings[term_id].append((j, value))
+        return postings
+
+    @staticmethod
+    def _column_arrays(B: CSRMatrix):
+        """_column_postings as NumPy arrays: B's rows and values sorted by term, and term offsets."""
+        counts = np.diff(np.frombuffer(B.indptr, dtype=np.int64))
+        rows = np.repeat(np.arange(len(B), dtype=np.int64), counts)
+        terms = np.frombuffer(B.indices, dtype=np.int32)
+        order = np.argsort(terms, kind="stable")
+        term_ptr = np.zeros(B.shape[1] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(terms, minlength=B.shape[1]), out=term_ptr[1:])
+        return term_ptr, rows[order], np.frombuffer(B.data, dtype=np.float64)[order]
+
+    # Partial products A[i, t] * B[j, t] materialized at once by _similarity_block
+    PRODUCT_BUDGET = 1 << 21
+
+    @classmethod
+    def _similarity_block(cls, A: CSRMatrix, columns, n_cols: int):
+        """
+        A @ B.T as a dense array, vectorized: every nonzero of A is paired with
+        B's postings for its term and the products are summed per (row, column)
+        with bincount, PRODUCT_BUDGET products at a time.
+        """
+        term_ptr, b_rows, b_vals = columns
+        out = np.zeros(len(A) * n_cols, dtype=np.float64)
+        counts = np.diff(np.frombuffer(A.indptr, dtype=np.int64))
+        a_rows = np.repeat(np.arange(len(A), dtype=np.int64), counts)
+        a_terms = np.frombuffer(A.indices, dtype=np.int32)
+        a_vals = np.frombuffer(A.data, dtype=np.float64)
+        starts = term_ptr[a_terms]
+        lengths = term_ptr[a_terms + 1] - starts
+        ends = np.cumsum(lengths)
+
+        first = 0
+        while first < len(a_terms):
+            done = ends[first] - lengths[first]
+            last = int(np.searchsorted(ends, done + cls.PRODUCT_BUDGET, side="right"))
+            last = max(last, first + 1)
+            entry_lengths = lengths[first:last]
+            total = int(ends[last - 1] - done)
+            if total:
+                entries = np.repeat(np.arange(first, last), entry_lengths)
+                offsets = np.arange(total) - np.repeat(
+                    ends[first:last] - entry_lengths - done, entry_lengths
+                )
+                postings = starts[entries] + offsets
+                out += np.bincount(
+                    a_rows[entries] * n_cols + b_rows[postings],
+                    weights=a_vals[entries] * b_vals[postings],
+                    minlength=out.size,
+                )
+            first = last
+        return out.reshape(len(A), n_cols)
+
+    @staticmethod
+    def _similarity_rows(
+        A: CSRMatrix, postings: Dict[int, List[Tuple[int, float]]], n_cols: int
+    ) -> List[List[float]]:
+        """Rows of A @ B.T, accumulated term by term from B's postings."""
+        result = []
+        for i in range(len(A)):
+            scores = [0.0] * n_cols
+            a_idx, a_val = A.row(i)
+            for term_id, value in zip(a_idx, a_val):
+                for j, b_value in postings.get(term_id, ()):
+                    scores[j] += value * b_value
+            result.append(scores)
+        return result
+
     def cosine_similarity(self, vec1: Dict, vec2: Dict) -> float:
         """Compute cosine similarity between two sparse vectors."""
         if not vec1 or not vec2:
@@ -137,13 +486,289 @@ class TFIDFVectorizer:
         return dot / (norm1 * norm2)
 
 
+# ─── Model Registry ───────────────────────────────────────────────────────────
+
+
+@dataclass(frozen=True)
+class ModelSnapshot:
+    """An immutable, versioned fitted model. Never mutated once published."""
+
+    version: str
+    vectorizer: TFIDFVectorizer
+    created_at: float
+    n_documents: int
+
+
+class ModelRegistry:
+    """
+    Serves the current ModelSnapshot. Readers take `current` with a single
+    attribute read and no lock; new versions are fitted off to the side
+    (optionally in a background thread) and swapped in atomically.
+    """
+
+    def __init__(self, max_features: int = 300):
+        self.max_features = max_features
+        self._current: Optional[ModelSnapshot] = None
+        self._publish_lock = threading.Lock()
+        self._builder: Optional[ThreadPoolExecutor] = None
+        self._sequence = 0
+
+    @property
+    def current(self) -> Optional[ModelSnapshot]:
+        return self._current
+
+    def publish(
+        self, vectorizer: TFIDFVectorizer, version: Optional[str] = None
+    ) -> ModelSnapshot:
+        """Swap in an already fitted vectorizer as the new current snapshot."""
+        if not vectorizer.fitted:
+            raise ValueError("Only fitted vectorizers can be published")
+        with self._publish_lock:
+            self._sequence += 1
+            snapshot = ModelSnapshot(
+                version=version or f"v{self._sequence}-{int(time.time())}",
+                vectorizer=vectorizer,
+                created_at=time.time(),
+                n_documents=vectorizer.n_documents,
+            )
+            self._current = snapshot
+        return snapshot
+
+    def build(
+        self, documents: Iterable[Union[str, Document]], version: Optional[str] = None
+    ) -> ModelSnapshot:
+        """Fit a fresh vectorizer on documents and publish it."""
+        vectorizer = TFIDFVectorizer(max_features=self.max_features).fit(documents)
+        return self.publish(vectorizer, version)
+
+    def build_async(
+        self, documents: Iterable[Union[str, Document]], version: Optional[str] = None
+    ) -> Future:
+        """Fit and publish in a background thread; the Future yields the snapshot."""
+        if self._builder is None:
+            self._builder = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="model-build"
+            )
+        return self._builder.submit(self.build, documents, version)
+
+
+# ─── Naive Bayes Domain Model ─────────────────────────────────────────────────
+
+
+class NaiveBayesDomainModel:
+    """
+    Multinomial Naive Bayes over content-token n-grams, trained on a labeled
+    corpus. Per-domain log-probabilities live in one term-major array
+    (term_id * n_classes + class_id), so a saved model loads as a mmap view
+    and a batch is scored with a single gather-and-sum.
+    """
+
+    def __init__(
+        self,
+        alpha: float = 1.0,
+        ngram_range: Tuple[int, int] = (1, 2),
+        max_features: int = 20000,
+    ):
+        self.alpha = alpha
+        self.ngram_range = ngram_range
+        self.max_features = max_features
+        self.classes: List[str] = []
+        self.vocabulary: Dict[str, int] = {}
+        self.log_prior = array("d")
+        self.log_likelihood = array("d")
+        self.n_documents = 0
+        self.fitted = False
+
+    @classmethod
+    def from_env(cls) -> Optional["NaiveBayesDomainModel"]:
+        """Load the model named by DOMAIN_MODEL_PATH, or None when it is unset."""
+        path = os.environ.get("DOMAIN_MODEL_PATH")
+        return cls.load(path) if path else None
+
+    def _terms(self, text: Union[str, Document]) -> List[str]:
+        if isinstance(text, Document):
+            return text.ngrams(*self.ngram_range)
+        # Raw strings skip Document's offset tracking, which scoring never needs
+        return content_ngrams(content_tokens(text), *self.ngram_range)
+
+    def fit(
+        self, texts: Iterable[Union[str, Document]], labels: Iterable[str]
+    ) -> "NaiveBayesDomainModel":
+        """Count term occurrences per domain in one pass and build the log tables."""
+        class_docs: Counter = Counter()
+        class_terms: Dict[str, Counter] = defaultdict(Counter)
+        for text, label in zip(texts, labels):
+            class_docs[label] += 1
+            class_terms[label].update(self._terms(text))
+
+        if not class_docs:
+            raise ValueError("Cannot fit a domain model on an empty corpus")
+
+        totals: Counter = Counter()
+        for counts in class_terms.values():
+            totals.update(counts)
+        terms = [
+            t
+            for t, _ in sorted(totals.items(), key=lambda x: (-x[1], x[0]))[
+                : self.max_features
+            ]
+        ]
+
+        self.classes = sorted(class_docs)
+        self.vocabulary = {t: i for i, t in enumerate(terms)}
+        self.n_documents = sum(class_docs.values())
+        self.log_prior = array(
+            "d", (math.log(class_docs[c] / self.n_documents) for c in self.classes)
+        )
+
+        n_classes = len(self.classes)
+        likelihood = array("d", bytes(8 * len(terms) * n_classes))
+        for class_id, label in enumerate(self.classes):
+            counts = class_terms[label]
+            denominator = math.log(
+                sum(counts[t] for t in terms) + self.alpha * len(terms)
+            )
+            for term_id, term in enumerate(terms):
+                likelihood[term_id * n_classes + class_id] = (
+                    math.log(counts[term] + self.alpha) - denominator
+                )
+        self.log_likelihood = likelihood
+        self.fitted = True
+        return self
+
+    def fit_jsonl(
+        self, path: str, text_field: str = "text", label_field: str = "label"
+    ) -> "NaiveBayesDomainModel":
+        """Fit on a JSON Lines corpus with one {"text": ..., "label": ...} per line."""
+        texts, labels = [], []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    texts.append(record[text_field])
+                    labels.append(record[label_field])
+        return self.fit(texts, labels)
+
+    def joint_log_likelihood(
+        self, texts: Sequence[Union[str, Document]]
+    ) -> List[List[float]]:
+        """log P(domain) + sum of log P(term | domain), one row per text."""
+        if not self.fitted:
+            raise RuntimeError("Domain model not fitted. Call fit() first.")
+        n_classes = len(self.classes)
+        indptr, indices, counts = [0], [], []
+        vocabulary = self.vocabulary
+        for text in texts:
+            for term, count in Counter(self._terms(text)).items():
+                term_id = vocabulary.get(term)
+                if term_id is not None:
+                    indices.append(term_id)
+                    counts.append(count)
+            indptr.append(len(indices))
+
+        if np is not None:
+            table = np.asarray(self.log_likelihood).reshape(-1, n_classes)
+            scores = np.tile(np.asarray(self.log_prior), (len(texts), 1))
+            if indices:
+                contrib = table[indices] * np.asarray(counts, dtype=float)[:, None]
+                starts = np.asarray(indptr[:-1])
+                nonempty = np.diff(indptr) > 0
+                scores[nonempty] += np.add.reduceat(contrib, starts[nonempty], axis=0)
+            return scores.tolist()
+
+        table = self.log_likelihood
+        scores = []
+        for i in range(len(texts)):
+            row = list(self.log_prior)
+            for k in range(indptr[i], indptr[i + 1]):
+                base = indices[k] * n_classes
+                for c in range(n_classes):
+                    row[c] += counts[k] * table[base + c]
+            scores.append(row)
+        return scores
+
+    def predict_batch(self, texts: Sequence[Union[str, Document]]) -> List[Dict]:
+        """Classify many resumes; each result mirrors ResumeDomainClassifier.predict."""
+        return [self._result(row) for row in self.joint_log_likelihood(texts)]
+
+    def predict(self, resume_text: Union[str, Document]) -> Dict:
+        return self.predict_batch([resume_text])[0]
+
+    def _result(self, joint: List[float]) -> Dict:
+        top = max(joint)
+        exp = [math.exp(v - top) for v in joint]
+        total = sum(exp)
+        ranked = sorted(range(len(joint)), key=lambda c: joint[c], reverse=True)
+        all_scores = {
+            self.classes[c]: {
+                "score": round(joint[c], 4),
+                "confidence": round(100 * exp[c] / total),
+            }
+            for c in ranked
+        }
+        return {
+            "primary_domain": self.classes[ranked[0]],
+            "secondary_domain": self.classes[ranked[1]] if len(ranked) > 1 else None,
+            "confidence": all_scores[self.classes[ranked[0]]]["confidence"],
+            "all_scores": all_scores,
+            "model": "naive_bayes",
+        }
+
+    def save(self, path: str):
+        """Persist the class list, vocabulary and log-probability tables."""
+        if not self.fitted:
+            raise RuntimeError("Domain model not fitted. Call fit() first.")
+        terms = sorted(self.vocabulary, key=self.vocabulary.get)
+        header = {
+            "kind": "naive_bayes",
+            "alpha": self.alpha,
+            "ngram_range": list(self.ngram_range),
+            "max_features": self.max_features,
+            "classes": self.classes,
+            "n_documents": self.n_documents,
+            "n_terms": len(terms),
+        }
+        write_artifact(
+            path,
+            header,
+            {
+                "vocabulary": "\n".join(terms).encode("utf-8"),
+                "log_prior": _array_bytes(array("d", self.log_prior)),
+                "log_likelihood": _array_bytes(array("d", self.log_likelihood)),
+            },
+        )
+
+    @classmethod
+    def load(cls, path: str, use_mmap: bool = True) -> "NaiveBayesDomainModel":
+        """Load a model saved with save(); the likelihood table stays memory-mapped."""
+        header, sections = read_artifact(path, use_mmap)
+        if header.get("kind") != "naive_bayes":
+            raise ValueError(f"{path} does not contain a domain model artifact")
+        model = cls(
+            alpha=header["alpha"],
+            ngram_range=tuple(header["ngram_range"]),
+            max_features=header["max_features"],
+        )
+        vocab_blob = bytes(sections["vocabulary"]).decode("utf-8")
+        terms = vocab_blob.split("\n") if header["n_terms"] else []
+        model.vocabulary = {t: i for i, t in enumerate(terms)}
+        model.classes = header["classes"]
+        model.log_prior = _array_view(sections["log_prior"], "d")
+        model.log_likelihood = _array_view(sections["log_likelihood"], "d")
+        model.n_documents = header["n_documents"]
+        model.fitted = True
+        return model
+
+
 # ─── Resume Domain Classifier ─────────────────────────────────────────────────
 
 
 class ResumeDomainClassifier:
     """
-    Naive Bayes-style domain classifier for resumes.
+    Domain classifier for resumes.
     Classifies into: Software, Data Science, DevOps, Mobile, Design, Finance, Marketing
+    Uses a trained NaiveBayesDomainModel when one is given, and falls back to
+    keyword counting otherwise.
     """
 
     DOMAIN_KEYWORDS = {
@@ -257,21 +882,51 @@ class ResumeDomainClassifier:
         },
     }
 
-    def predict(self, resume_text: str) -> Dict:
+    _compiled: Optional[Tuple[Dict, TermMatcher, List[str]]] = None
+
+    def __init__(self, model: Optional[NaiveBayesDomainModel] = None):
+        self.model = model
+
+    def _keyword_matcher(self) -> Tuple[TermMatcher, List[str]]:
+        """
+        One TermMatcher over every domain keyword plus the owning domain of each
+        term id. Rebuilt only if DOMAIN_KEYWORDS is replaced (e.g. by load()).
+        """
+        compiled = self._compiled
+        if compiled is None or compiled[0] is not self.DOMAIN_KEYWORDS:
+            owners = [
+                domain
+                for domain, config in self.DOMAIN_KEYWORDS.items()
+                for _ in config["primary"]
+            ]
+            terms = [
+                keyword
+                for config in self.DOMAIN_KEYWORDS.values()
+                for keyword in config["primary"]
+            ]
+            compiled = (self.DOMAIN_KEYWORDS, TermMatcher(terms), owners)
+            self._compiled = compiled
+        return compiled[1], compiled[2]
+
+    def predict(self, resume_text: Union[str, Document]) -> Dict:
         """Classify resume domain and return confidence scores."""
-        text_lower = resume_text.lower()
-        scores = {}
+        if self.model is not None:
+            return self.model.predict(resume_text)
+        matcher, owners = self._keyword_matcher()
+        doc = Document.of(resume_text)
+
+        # One pass over the document's tokens finds every domain's keywords;
+        # term ids come back in registration order, so matches keep list order
+        matched = {domain: [] for domain in self.DOMAIN_KEYWORDS}
+        for term_id in matcher.scan_ids(doc):
+            matched[owners[term_id]].append(matcher.terms[term_id])
 
+        scores = {}
         for domain, config in self.DOMAIN_KEYWORDS.items():
-            score = 0
-            matched = []
-            for keyword in config["primary"]:
-                if keyword in text_lower:
-                    score += 1
-                    matched.append(keyword)
+            score = len(matched[domain])
             scores[domain] = {
                 "score": score * config["weight"],
-                "matched_keywords": matched,
+                "matched_keywords": matched[domain],
                 "confidence": min(100, score * 8),
             }
 
@@ -291,13 +946,115 @@ class ResumeDomainClassifier:
             "all_scores": dict(sorted_domains),
         }
 
+    def predict_batch(
+        self,
+        texts: Sequence[Union[str, Document]],
+        processes: Optional[int] = None,
+        chunk_size: int = 500,
+    ) -> List[Dict]:
+        """
+        Classify many resumes, in input order. With processes > 1 the batch is
+        split into chunks of chunk_size and scored on a process pool.
+        """
+        if self.model is not None:
+            return self.model.predict_batch(texts)
+        if not processes or processes < 2 or len(texts) <= chunk_size:
+            return [self.predict(text) for text in texts]
+
+        # Documents are not shipped to workers; they re-tokenize the raw text
+        raw = [text.text if isinstance(text, Document) else text for text in texts]
+        chunks = [raw[i : i + chunk_size] for i in range(0, len(raw), chunk_size)]
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            results = pool.map(_predict_chunk, [self] * len(chunks), chunks)
+            return [prediction for chunk in results for prediction in chunk]
+
+
+def _predict_chunk(
+    classifier: "ResumeDomainClassifier", texts: List[str]
+) -> List[Dict]:
+    return [classifier.predict(text) for text in texts]
+
 
 # ─── Skill Gap Analyzer ───────────────────────────────────────────────────────
 
 
+class SkillGraph:
+    """
+    SKILL_TAXONOMY compiled into an undirected graph with integer node ids.
+    A skill is linked to each related/prerequisite skill listed for it. The
+    neighbourhood of a node (every node within max_distance hops, with its
+    distance) is computed by one bounded BFS and memoized, so distance
+    lookups after that are a dict access however large the taxonomy grows.
+    """
+
+    def __init__(
+        self,
+        taxonomy: Dict[str, List[str]],
+        max_distance: int = 3,
+        canonicalizer: Optional[SkillCanonicalizer] = None,
+    ):
+        self.max_distance = max_distance
+        self.canonicalizer = canonicalizer or SkillCanonicalizer()
+        self.names: List[str] = []
+        self.ids: Dict[str, int] = {}
+        edges: List[set] = []
+        for skill, related in taxonomy.items():
+            u = self._add(skill, edges)
+            for other in related:
+                v = self._add(other, edges)
+                if u != v:
+                    edges[u].add(v)
+                    edges[v].add(u)
+        self.adjacency = [array("i", sorted(e)) for e in edges]
+        self._neighbourhoods: Dict[int, Dict[int, int]] = {}
+
+    def _add(self, skill: str, edges: List[set]) -> int:
+        key = self.canonicalizer.key(skill)
+        node = self.ids.get(key)
+        if node is None:
+            node = self.ids[key] = len(self.names)
+            self.names.append(skill)
+            edges.append(set())
+        return node
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def node_id(self, skill: str) -> Optional[int]:
+        return self.ids.get(self.canonicalizer.key(skill))
+
+    def neighbourhood(self, node: int) -> Dict[int, int]:
+        """{node_id: hops} for every node within max_distance of node, itself excluded."""
+        near = self._neighbourhoods.get(node)
+        if near is None:
+            near = {}
+            frontier = [node]
+            for depth in range(1, self.max_distance + 1):
+                next_frontier = []
+                for u in frontier:
+                    for v in self.adjacency[u]:
+                        if v != node and v not in near:
+                            near[v] = depth
+                            next_frontier.append(v)
+                frontier = next_frontier
+            self._neighbourhoods[node] = near
+        return near
+
+    def distance(self, a: str, b: str) -> Optional[int]:
+        """Hop distance between two skills, or None if unknown or beyond max_distance."""
+        u, v = self.node_id(a), self.node_id(b)
+        if u is None or v is None:
+            return None
+        return 0 if u == v else self.neighbourhood(u).get(v)
+
+
 class SkillGapAnalyzer:
     """Analyzes gap between candidate skills and job requirements."""
 
+    # Candidate skills up to this many hops from a missing skill count as transferable
+    MAX_TRANSFER_DISTANCE = 2
+    GAP_SIZES = {1: "small", 2: "medium"}
+
     SKILL_TAXONOMY = {
         # Maps skills to related/prerequisite skills
         "React": ["JavaScript", "HTML", "CSS", "TypeScript", "Node.js"],
@@ -370,36 +1127,93 @@ class SkillGapAnalyzer:
         },
     }
 
+    _compiled: Optional[Tuple[Dict, SkillGraph]] = None
+
+    def __init__(self, canonicalizer: Optional[SkillCanonicalizer] = None):
+        # Skills are compared by canonical key, so "k8s" matches "Kubernetes"
+        self.canonicalizer = canonicalizer or SkillCanonicalizer()
+
+    @property
+    def graph(self) -> SkillGraph:
+        """Skill graph of SKILL_TAXONOMY, rebuilt only if the taxonomy is replaced."""
+        compiled = self._compiled
+        if compiled is None or compiled[0] is not self.SKILL_TAXONOMY:
+            graph = SkillGraph(
+                self.SKILL_TAXONOMY, self.MAX_TRANSFER_DISTANCE, self.canonicalizer
+            )
+            compiled = (self.SKILL_TAXONOMY, graph)
+            self._compiled = compiled
+        return compiled[1]
+
     def analyze(self, candidate_skills: List[str], required_skills: List[str]) -> Dict:
         """Full skill gap analysis with recommendations."""
-        candidate_lower = {s.lower() for s in candidate_skills}
-        required_lower = {s.lower() for s in required_skills}
+        return self.analyze_many(candidate_skills, [required_skills])[0]
+
+    def analyze_many(
+        self, candidate_skills: List[str], requirement_lists: Iterable[List[str]]
+    ) -> List[Dict]:
+        """Analyze one candidate against many requirement lists (e.g. many JDs)."""
+        graph = self.graph
+        # Candidate skills are typed by users, so misspellings are corrected
+        canonical = self.canonicalizer.fuzzy_canonical
+        candidate_keys = {self.canonicalizer.fuzzy_key(s) for s in candidate_skills}
+        # Neighbourhoods are taken around the candidate's skills, which are
+        # shared by every requirement list, so each gap is a lookup per skill
+        candidate_nodes = [
+            (s, graph.neighbourhood(node))
+            for s, node in ((s, graph.node_id(canonical(s))) for s in candidate_skills)
+            if node is not None
+        ]
+        return [
+            self._analyze(graph, candidate_keys, candidate_nodes, required_skills)
+            for required_skills in requirement_lists
+        ]
+
+    def _analyze(
+        self,
+        graph: SkillGraph,
+        candidate_keys: set,
+        candidate_nodes: List[Tuple[str, Dict[int, int]]],
+        required_skills: List[str],
+    ) -> Dict:
+        key = self.canonicalizer.key
 
         # Direct matches
-        matched = [s for s in required_skills if s.lower() in candidate_lower]
+        matched = [s for s in required_skills if key(s) in candidate_keys]
 
         # Gaps
-        gaps = [s for s in required_skills if s.lower() not in candidate_lower]
+        gaps = [s for s in required_skills if key(s) not in candidate_keys]
 
-        # Find transferable skills (partial matches)
+        # Transferable skills: candidate skills within a few hops of the gap
         transferable = []
+        close_gaps = set()
         for gap in gaps:
-            related = self.SKILL_TAXONOMY.get(gap, [])
-            transfer_from = [s for s in candidate_skills if s in related]
-            if transfer_from:
+            node = graph.node_id(gap)
+            if node is None:
+                continue
+            near = [
+                (near_skill[node], s)
+                for s, near_skill in candidate_nodes
+                if node in near_skill
+            ]
+            if near:
+                distance = min(d for d, _ in near)
+                if distance == 1:
+                    close_gaps.add(gap)
                 transferable.append(
                     {
                         "missing_skill": gap,
-                        "transferable_from": transfer_from,
-                        "gap_size": "small",
+                        "transferable_from": [
+                            s for _, s in sorted(near, key=lambda x: x[0])
+                        ],
+                        "gap_size": self.GAP_SIZES.get(distance, "large"),
+                        "distance": distance,
                     }
                 )
 
-        # Learning plan for top gaps
+        # Learning plan for top gaps not already covered by a closely related skill
         learning_plan = []
-        gap_skills_priority = [
-            g for g in gaps if g not in [t["missing_skill"] for t in transferable]
-        ]
+        gap_skills_priority = [g for g in gaps if g not in close_gaps]
         for skill in gap_skills_priority[:5]:
             resource = self.LEARNING_RESOURCES.get(
                 skill,
@@ -475,28 +1289,71 @@ class BulletPointScorer:
         "Scaled",
     ]
 
-    def score_bullet(self, bullet: str) -> Dict:
+    TECH_TERMS = [
+        "python",
+        "react",
+        "aws",
+        "docker",
+        "kubernetes",
+        "sql",
+        "api",
+        "machine learning",
+        "tensorflow",
+    ]
+
+    # Matched as substrings, so "savings" and "cost-saving" count as "saving"
+    IMPACT_PHRASES = [
+        "resulting in",
+        "leading to",
+        "achieving",
+        "improved",
+        "increased",
+        "reduced",
+        "saving",
+        "enabling",
+    ]
+
+    _compiled: Optional[
+        Tuple[List[str], FrozenSet[str], "re.Pattern", Tuple[str, ...]]
+    ] = None
+
+    def _patterns(self) -> Tuple[FrozenSet[str], "re.Pattern", Tuple[str, ...]]:
+        """
+        Frozen lowercase verb set, a whole-word regex over the tech terms and
+        the lowercase impact phrases, compiled once and rebuilt only if
+        ACTION_VERBS is replaced.
+        """
+        compiled = self._compiled
+        if compiled is None or compiled[0] is not self.ACTION_VERBS:
+            compiled = (
+                self.ACTION_VERBS,
+                frozenset(v.lower() for v in self.ACTION_VERBS),
+                re.compile(
+                    r"\b(?:" + "|".join(map(re.escape, self.TECH_TERMS)) + r")\b"
+                ),
+                tuple(p.lower() for p in self.IMPACT_PHRASES),
+            )
+            self._compiled = compiled
+        return compiled[1:]
+
+    def score_bullet(self, bullet: Union[str, Document]) -> Dict:
         """Score a bullet point on multiple dimensions (0-100 each)."""
+        verbs, tech_pattern, impact_phrases = self._patterns()
+        doc = Document.of(bullet)
+        bullet = doc.text
         scores = {}
 
         # 1. Starts with action verb
-        first_word = bullet.strip().split()[0] if bullet.strip() else ""
-        scores["action_verb"] = (
-            100
-            if any(first_word.lower() == v.lower() for v in self.ACTION_VERBS)
-            else 0
-        )
+        # The first whitespace-separated word, so "Led," or "- Built" get no credit
+        words = bullet.split()
+        first_word = words[0].lower() if words else ""
+        scores["action_verb"] = 100 if first_word in verbs else 0
 
         # 2. Has quantification
-        has_number = bool(
-            re.search(
-                r"\d+%?|\d+x|\$[\d,]+|\d+\s*(users|customers|hours|days|weeks)", bullet
-            )
-        )
-        scores["quantification"] = 100 if has_number else 0
+        scores["quantification"] = 100 if doc.metric_spans else 0
 
         # 3. Length (ideal: 10-25 words)
-        word_count = len(bullet.split())
+        word_count = doc.word_count
         if 10 <= word_count <= 25:
             scores["length"] = 100
         elif word_count < 10:
@@ -505,24 +1362,11 @@ class BulletPointScorer:
             scores["length"] = max(0, 100 - (word_count - 25) * 5)
 
         # 4. Technical depth (mentions technologies)
-        tech_pattern = r"\b(python|react|aws|docker|kubernetes|sql|api|machine learning|tensorflow)\b"
-        scores["technical_depth"] = (
-            80 if re.search(tech_pattern, bullet.lower()) else 30
-        )
+        scores["technical_depth"] = 80 if tech_pattern.search(doc.lower) else 30
 
         # 5. Impact clarity (result-oriented language)
-        impact_words = [
-            "resulting in",
-            "leading to",
-            "achieving",
-            "improved",
-            "increased",
-            "reduced",
-            "saving",
-            "enabling",
-        ]
         scores["impact_clarity"] = (
-            100 if any(w in bullet.lower() for w in impact_words) else 40
+            100 if any(p in doc.lower for p in impact_phrases) else 40
         )
 
         overall = int(sum(scores.values()) / len(scores))
@@ -541,6 +1385,26 @@ class BulletPointScorer:
             "suggestions": self._generate_suggestions(scores, bullet),
         }
 
+    def score_bullets(
+        self,
+        bullets: Sequence[Union[str, Document]],
+        processes: Optional[int] = None,
+        chunk_size: int = 1000,
+    ) -> List[Dict]:
+        """
+        Score many bullets, in input order, with the same per-bullet output as
+        score_bullet. With processes > 1 the batch is split into chunks of
+        chunk_size and scored on a process pool.
+        """
+        if not processes or processes < 2 or len(bullets) <= chunk_size:
+            return [self.score_bullet(b) for b in bullets]
+
+        raw = [b.text if isinstance(b, Document) else b for b in bullets]
+        chunks = [raw[i : i + chunk_size] for i in range(0, len(raw), chunk_size)]
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            results = pool.map(_score_chunk, [self] * len(chunks), chunks)
+            return [scored for chunk in results for scored in chunk]
+
     def _generate_suggestions(self, scores: Dict, bullet: str) -> List[str]:
         suggestions = []
         if scores["action_verb"] == 0:
@@ -566,6 +1430,10 @@ class BulletPointScorer:
         return suggestions
 
 
+def _score_chunk(scorer: "BulletPointScorer", bullets: List[str]) -> List[Dict]:
+    return [scorer.score_bullet(b) for b in bullets]
+
+
 # ─── Complete ML Pipeline ─────────────────────────────────────────────────────
 
 
@@ -575,30 +1443,111 @@ class ResumeMLPipeline:
     Combines all models for comprehensive analysis.
     """
 
-    def __init__(self):
-        self.vectorizer = TFIDFVectorizer(max_features=300)
-        self.classifier = ResumeDomainClassifier()
-        self.gap_analyzer = SkillGapAnalyzer()
+    def __init__(
+        self,
+        engine: Optional[ResumeAIEngine] = None,
+        domain_model: Optional[NaiveBayesDomainModel] = None,
+    ):
+        # Share the caller's warm engine instead of building one per analysis
+        self.engine = engine or ResumeAIEngine()
+        self.registry = ModelRegistry(max_features=300)
+        self.classifier = ResumeDomainClassifier(model=domain_model)
+        self.gap_analyzer = SkillGapAnalyzer(self.engine.skill_canonicalizer)
         self.bullet_scorer = BulletPointScorer()
-        self._fitted = False
 
-    def fit_vectorizer(self, sample_documents: List[str]):
-        """Fit TF-IDF on a corpus of resume/JD documents."""
-        self.vectorizer.fit(sample_documents)
-        self._fitted = True
+    @property
+    def vectorizer(self) -> Optional[TFIDFVectorizer]:
+        """Vectorizer of the current model snapshot, if one has been published."""
+        snapshot = self.registry.current
+        return snapshot.vectorizer if snapshot else None
+
+    def fit_vectorizer(self, sample_documents: List[str]) -> ModelSnapshot:
+        """Fit TF-IDF on a corpus of resume/JD documents and publish a new version."""
+        return self.registry.build(sample_documents)
+
+    def save(self, path: str):
+        """Persist the current model snapshot and the taxonomy tables as one artifact."""
+        snapshot = self.registry.current
+        if snapshot is None:
+            raise RuntimeError("No fitted model to save. Call fit_vectorizer() first.")
+        header = {
+            "kind": "pipeline",
+            "model_version": snapshot.version,
+            **snapshot.vectorizer._artifact_header(),
+            "taxonomy": {
+                "domain_keywords": self.classifier.DOMAIN_KEYWORDS,
+                "skill_taxonomy": self.gap_analyzer.SKILL_TAXONOMY,
+                "learning_resources": self.gap_analyzer.LEARNING_RESOURCES,
+                "action_verbs": self.bullet_scorer.ACTION_VERBS,
+            },
+        }
+        write_artifact(path, header, snapshot.vectorizer._artifact_sections())
+
+    @classmethod
+    def load(
+        cls,
+        path: str,
+        use_mmap: bool = True,
+        engine: Optional[ResumeAIEngine] = None,
+        domain_model: Optional[NaiveBayesDomainModel] = None,
+    ) -> "ResumeMLPipeline":
+        """Build a ready-to-serve pipeline from an artifact written by save()."""
+        pipeline = cls(engine=engine, domain_model=domain_model)
+        pipeline.load_model(path, use_mmap)
+        return pipeline
+
+    @classmethod
+    def from_env(
+        cls,
+        engine: Optional[ResumeAIEngine] = None,
+        domain_model: Optional[NaiveBayesDomainModel] = None,
+    ) -> "ResumeMLPipeline":
+        """
+        Load the artifact named by PIPELINE_MODEL_PATH, or start unfitted when
+        it is unset or nothing has been saved there yet (see /api/model/rebuild).
+        """
+        path = os.environ.get("PIPELINE_MODEL_PATH")
+        if path and os.path.exists(path):
+            return cls.load(path, engine=engine, domain_model=domain_model)
+        return cls(engine=engine, domain_model=domain_model)
+
+    def load_model(self, path: str, use_mmap: bool = True) -> ModelSnapshot:
+        """Publish the model and taxonomy tables of an artifact written by save()."""
+        header, sections = read_artifact(path, use_mmap)
+        if header.get("kind") != "pipeline":
+            raise ValueError(f"{path} does not contain a pipeline artifact")
+        taxonomy = header["taxonomy"]
+        self.classifier.DOMAIN_KEYWORDS = taxonomy["domain_keywords"]
+        self.gap_analyzer.SKILL_TAXONOMY = taxonomy["skill_taxonomy"]
+        self.gap_analyzer.LEARNING_RESOURCES = taxonomy["learning_resources"]
+        self.bullet_scorer.ACTION_VERBS = taxonomy["action_verbs"]
+        return self.registry.publish(
+            TFIDFVectorizer._from_artifact(header, sections),
+            header.get("model_version"),
+        )
 
-    def match_resume_to_job(self, resume_text: str, job_description: str) -> Dict:
+    def match_resume_to_job(
+        self,
+        resume_text: Union[str, Document],
+        job_description: Union[str, Document],
+    ) -> Dict:
         """
         Full pipeline: match resume to job description.
         Returns similarity score, domain, gaps, recommendations.
         """
-        # Fit on these two documents if not already fitted
-        if not self._fitted:
-            self.vectorizer.fit([resume_text, job_description])
-            self._fitted = True
+        # Read the snapshot once so the whole call uses a single model version
+        snapshot = self.registry.current
+        if snapshot is not None:
+            vectorizer, model_version = snapshot.vectorizer, snapshot.version
+        else:
+            # No corpus-fitted model yet: fit a throwaway model on this pair
+            # without touching any shared state
+            vectorizer = TFIDFVectorizer(max_features=self.registry.max_features)
+            vectorizer.fit([resume_text, job_description])
+            model_version = "pairwise"
 
-        vectors = self.vectorizer.transform([resume_text, job_description])
-        similarity = self.vectorizer.cosine_similarity(vectors[0], vectors[1])
+        vectors = vectorizer.transform_matrix([resume_text, job_description])
+        similarity = vectors.dot_row(0, vectors, 1)
 
         domain = self.classifier.predict(resume_text)
 
@@ -606,11 +1555,53 @@ class ResumeMLPipeline:
             "similarity_score": round(similarity * 100, 1),
             "domain_classification": domain,
             "recommendation": self._get_recommendation(similarity),
+            "model_version": model_version,
+        }
+
+    def similarity_matrix(
+        self,
+        resumes: Iterable[Union[str, Document]],
+        job_descriptions: Sequence[Union[str, Document]],
+        top_k: int = 5,
+        block_rows: int = 256,
+        sink: Optional[Callable[[int, Any], None]] = None,
+    ) -> Dict:
+        """
+        TF-IDF cosine similarity of every resume against every job description,
+        computed block_rows resumes at a time. Each block (first row, rows) is
+        handed to sink, e.g. SimilarityMatrixWriter.write_rows, and only each
+        resume's top_k jobs are kept, so memory stays bounded by one block.
+        """
+        job_descriptions = list(job_descriptions)
+        snapshot = self.registry.current
+        if snapshot is not None:
+            vectorizer, model_version = snapshot.vectorizer, snapshot.version
+        else:
+            # No corpus-fitted model yet: fit a throwaway model on both sets
+            resumes = list(resumes)
+            vectorizer = TFIDFVectorizer(max_features=self.registry.max_features)
+            vectorizer.fit(resumes + job_descriptions)
+            model_version = "batch"
+
+        job_matrix = vectorizer.transform_matrix(job_descriptions)
+        top_matches = []
+        n_rows = 0
+        blocks = vectorizer.similarity_blocks(resumes, job_matrix, block_rows)
+        for start, rows in blocks:
+            if sink is not None:
+                sink(start, rows)
+            top_matches.extend(_top_k_rows(rows, top_k))
+            n_rows = start + len(rows)
+
+        return {
+            "shape": [n_rows, len(job_descriptions)],
+            "model_version": model_version,
+            "top_matches": top_matches,
         }
 
     def analyze_resume_bullets(self, bullets: List[str]) -> Dict:
         """Analyze and score all bullets in a resume."""
-        scored = [self.bullet_scorer.score_bullet(b) for b in bullets]
+        scored = self.bullet_scorer.score_bullets(bullets)
         avg_score = (
             sum(s["overall_score"] for s in scored) / len(scored) if scored else 0
         )
@@ -623,26 +1614,28 @@ class ResumeMLPipeline:
             ],
         }
 
+    def score_bullets(self, bullets: Sequence[str]) -> List[Dict]:
+        """Score a batch of bullets (see BulletPointScorer.score_bullets)."""
+        return self.bullet_scorer.score_bullets(bullets)
+
     def full_analysis(self, resume_data: Dict, job_description: str) -> Dict:
         """Run complete ML analysis on a resume."""
-        # Serialize resume to text for analysis
-        resume_text = self._serialize_resume(resume_data)
+        # Serialize resume to text and tokenize both texts once for every analyzer
+        resume_doc = Document(self._serialize_resume(resume_data))
+        jd_doc = Document(job_description)
 
-        match = self.match_resume_to_job(resume_text, job_description)
+        match = self.match_resume_to_job(resume_doc, jd_doc)
 
         # Skill gap analysis
-        from ml_engine import ResumeAIEngine
-
-        engine = ResumeAIEngine()
-        jd_keywords = engine._extract_keywords(job_description)
-        candidate_skills = resume_data.get("skills", [])
+        jd_keywords = self.engine._extract_keywords(jd_doc)
+        candidate_skills = resume_data.get("skills") or []
         gap_analysis = self.gap_analyzer.analyze(candidate_skills, jd_keywords[:15])
 
         # Bullet analysis
         all_bullets = []
-        for exp in resume_data.get("experience", []):
-            desc = exp.get("description", "")
-            bullets = [s.strip() for s in desc.split(".") if len(s.strip()) > 10]
+        for exp in resume_data.get("experience") or []:
+            desc = Document(exp.get("description") or "")
+            bullets = [s.rstrip(".") for s in desc.sentences if len(s) > 10]
             all_bullets.extend(bullets)
 
         bullet_analysis = (
@@ -660,16 +1653,18 @@ class ResumeMLPipeline:
 
     def _serialize_resume(self, resume_data: Dict) -> str:
         parts = [
-            resume_data.get("name", ""),
-            " ".join(resume_data.get("skills", [])),
-            " ".join(edu.get("field", "") for edu in resume_data.get("education", [])),
+            resume_data.get("name") or "",
+            " ".join(resume_data.get("skills") or []),
+            " ".join(
+                edu.get("field") or "" for edu in resume_data.get("education") or []
+            ),
             " ".join(
                 f"{exp.get('role')} {exp.get('company')} {exp.get('description')}"
-                for exp in resume_data.get("experience", [])
+                for exp in resume_data.get("experience") or []
             ),
             " ".join(
-                f"{p.get('name')} {p.get('description')} {' '.join(p.get('technologies', []))}"
-                for p in resume_data.get("projects", [])
+                f"{p.get('name')} {p.get('description')} {' '.join(p.get('technologies') or [])}"
+                for p in resume_data.get("projects") or []
             ),
         ]
         return " ".join(parts)
@@ -697,6 +1692,468 @@ class ResumeMLPipeline:
             return "Resume needs significant customization. Focus on the skill gaps and ATS optimization."
 
 
+# ─── Sharded Execution ────────────────────────────────────────────────────────
+
+# The partition owned by a ShardPool worker process, built once by _init_shard
+_shard = None
+
+
+def _init_shard(factory: Callable[[int, int], Any], shard: int, n_shards: int):
+    global _shard
+    _shard = factory(shard, n_shards)
+
+
+def _call_shard(method: str, calls: List[tuple]) -> List:
+    call = getattr(_shard, method)
+    return [call(*args) for args in calls]
+
+
+def merge_top_k(
+    shard_hits: Sequence[Sequence[Tuple[float, int]]], k: int
+) -> List[Tuple[float, int]]:
+    """Global top k from per-shard (score, doc) lists, each ordered by (-score, doc)."""
+    return list(islice(heapq.merge(*shard_hits, key=lambda hit: (-hit[0], hit[1])), k))
+
+
+class ShardPool:
+    """
+    Scatter-gather over a partitioned corpus: one single-worker process per
+    shard, holding the partition factory(shard, n_shards) builds in it. A
+    call goes to every shard at once and results come back in shard order,
+    so shards search the same query in parallel and each keeps only its own
+    partition warm. factory must be picklable (a module-level function or a
+    functools.partial of one).
+    """
+
+    def __init__(self, factory: Callable[[int, int], Any], n_shards: int):
+        if n_shards < 1:
+            raise ValueError("n_shards must be at least 1")
+        self.factory = factory
+        self.n_shards = n_shards
+        self._pools: List[ProcessPoolExecutor] = []
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            if not self._pools:
+                self._pools = [
+                    ProcessPoolExecutor(
+                        max_workers=1,
+                        initializer=_init_shard,
+                        initargs=(self.factory, shard, self.n_shards),
+                    )
+                    for shard in range(self.n_shards)
+                ]
+
+    def scatter(self, method: str, *args) -> List:
+        """method(*args) on every shard's partition, one result per shard."""
+        return [results[0] for results in self.scatter_batch(method, [args])]
+
+    def scatter_batch(self, method: str, calls: Sequence[tuple]) -> List[List]:
+        """
+        method(*args) for every args in calls on every shard, as results[shard][i].
+        Each shard gets the whole batch as one task, so per-call IPC is paid
+        once per batch rather than once per query.
+        """
+        self.start()
+        calls = list(calls)
+        futures = [pool.submit(_call_shard, method, calls) for pool in self._pools]
+        return [future.result() for future in futures]
+
+    def shutdown(self):
+        with self._lock:
+            pools, self._pools = self._pools, []
+        for pool in pools:
+            pool.shutdown()
+
+    def __enter__(self) -> "ShardPool":
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+
+# ─── Candidate Ranking ────────────────────────────────────────────────────────
+
+
+class CandidateRankingIndex:
+    """
+    Stored candidate resumes ranked against a job description by a weighted
+    mix of the ATS score and TF-IDF similarity, without scoring the whole pool:
+
+    1. Similarity: TF-IDF cosine with the JD for every stored candidate,
+       from term postings over their stored vectors, so only candidates
+       sharing a term with the JD are touched. Vectors are kept per model
+       version: the current snapshot, or, when none is published, a model
+       fitted on the stored pool. Like a snapshot, the pool model stays
+       fixed as candidates come and go (new ones are vectorized with it)
+       and is refitted, outside the lock, only once the pool has changed
+       by pool_refit_fraction of its size at the last fit.
+    2. Bound: the job-independent part of each candidate's ATS score is
+       stored when it is added, and skill coverage of the JD's taxonomy
+       skills (CandidateCoverageIndex) bounds the keyword part from above.
+    3. Exact ATS: calculate_ats_score runs in order of the combined bound
+       and stops once no remaining candidate can reach the top k, or after
+       max_exact calls. A JD without taxonomy skills is bounded by
+       similarity alone, so every candidate stays rankable.
+    """
+
+    def __init__(
+        self,
+        pipeline: "ResumeMLPipeline",
+        ats_weight: float = 0.6,
+        shortlist_size: int = 2000,
+        max_exact: int = 300,
+        pool_max_features: int = 20000,
+        pool_refit_fraction: float = 0.5,
+    ):
+        self.pipeline = pipeline
+        self.engine = pipeline.engine
+        self.ats_weight = ats_weight
+        self.shortlist_size = shortlist_size
+        self.max_exact = max_exact
+        # The pool model only feeds sparse postings, so it keeps the rare
+        # terms that tell a niche resume (or JD) apart from the majority
+        self.pool_max_features = pool_max_features
+        self.pool_refit_fraction = pool_refit_fraction
+        # A separate interner keeps the engine's skill ids, and so the
+        # skill_bits of compiled JDs, independent of the uploaded resumes
+        self._coverage = CandidateCoverageIndex(
+            SkillInterner(canonicalizer=self.engine.skill_canonicalizer)
+        )
+        # Candidate id -> zlib-compressed resume text, decompressed only when scored
+        self._texts: Dict[str, bytes] = {}
+        self._resume_scores: Dict[str, float] = {}
+        self._vectors: Dict[str, Tuple[str, Dict[int, float]]] = {}
+        # Term id -> {candidate id: weight}, for the vectors of _postings_version
+        self._postings: Dict[int, Dict[str, float]] = defaultdict(dict)
+        self._postings_version: Optional[str] = None
+        self._pool_model: Optional[TFIDFVectorizer] = None
+        self._pool_generation = 0
+        self._pool_fitted_size = 0
+        # Adds and removes since the pool model was fitted
+        self._pool_changes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __contains__(self, candidate_id: str) -> bool:
+        return candidate_id in self._texts
+
+    def add(self, candidate_id: str, resume: Union[Dict, str]):
+        """Store or replace one candidate, given a resume dict or its text."""
+        self.add_many([(candidate_id, resume)])
+
+    def add_many(self, candidates: Iterable[Tuple[str, Union[Dict, str]]]) -> int:
+        """Store or replace many candidates. Returns how many were added."""
+        entries = []
+        for candidate_id, resume in candidates:
+            text = (
+                self.pipeline._serialize_resume(resume)
+                if isinstance(resume, dict)
+                else resume
+            )
+            doc = Document(text)
+            entries.append(
+                (
+                    candidate_id,
+                    zlib.compress(text.encode("utf-8")),
+                    self.engine.ats_resume_score(doc),
+                    self.engine.find_skills(doc),
+                )
+            )
+        with self._lock:
+            for candidate_id, packed, resume_score, _ in entries:
+                self._texts[candidate_id] = packed
+                self._resume_scores[candidate_id] = resume_score
+                self._drop_vector(candidate_id)
+            self._pool_changes += len(entries)
+            self._coverage.add_many((c, skills) for c, _, _, skills in entries)
+        return len(entries)
+
+    def remove(self, candidate_id: str) -> bool:
+        """Drop a candidate; returns False if it was not stored."""
+        with self._lock:
+            if candidate_id not in self._texts:
+                return False
+            del self._texts[candidate_id]
+            del self._resume_scores[candidate_id]
+            self._drop_vector(candidate_id)
+            self._pool_changes += 1
+            self._coverage.remove(candidate_id)
+            return True
+
+    def text(self, candidate_id: str) -> Optional[str]:
+        packed = self._texts.get(candidate_id)
+        return zlib.decompress(packed).decode("utf-8") if packed is not None else None
+
+    def rank(self, job_description: Union[str, JobContext], k: int = 20) -> Dict:
+        """Top-k stored candidates for a job description (text or compiled JobContext)."""
+        job = (
+            job_description
+            if isinstance(job_description, JobContext)
+            else self.engine.build_job_context(job_description)
+        )
+        skills = [kw for kw in job.keywords if self.engine.is_skill(kw)]
+        n_keywords = len(job.keywords)
+        # Non-skill keywords are not indexed, so the bound assumes they all match
+        unindexed = n_keywords - len(skills)
+
+        coverage = {}
+        if skills:
+            covered = self._coverage.query(skills, min_coverage=1, limit=len(self))
+            coverage = {e["candidate_id"]: e["coverage"] for e in covered["candidates"]}
+        similarities, model_version = self._similarities(job.job_description or "")
+        with self._lock:
+            resume_scores = dict(self._resume_scores)
+
+        w = self.ats_weight
+        bounded = []
+        for candidate_id, resume_score in resume_scores.items():
+            covered_keywords = coverage.get(candidate_id, 0) + unindexed
+            keyword_bound = covered_keywords / n_keywords * 100 if n_keywords else 100.0
+            # The slack absorbs float rounding differences from calculate_ats_score's sum
+            ats_bound = keyword_bound * 0.4 + resume_score + 1e-9
+            similarity = similarities.get(candidate_id, 0.0) * 100
+            bounded.append(
+                (w * ats_bound + (1 - w) * similarity, candidate_id, similarity)
+            )
+        bounded.sort(key=lambda b: -b[0])
+        shortlisted = sum(
+            1 for c in resume_scores if c in coverage or c in similarities
+        )
+
+        # Exact ATS in bound order, stopping once the bound cannot beat the k-th score
+        top: List[Tuple[float, int, Dict]] = []
+        exact = 0
+        for order, (bound, candidate_id, similarity) in enumerate(
+            bounded[: self.shortlist_size]
+        ):
+            if exact >= self.max_exact or (len(top) == k and bound <= top[0][0]):
+                break
+            text = self.text(candidate_id)
+            if text is None:
+                continue  # removed while ranking
+            ats = self.engine.calculate_ats_score(text, job)
+            exact += 1
+            score = w * ats["overall_score"] + (1 - w) * similarity
+            result = {
+                "candidate_id": candidate_id,
+                "score": round(score, 2),
+                "ats_score": ats["overall_score"],
+                "similarity_score": round(similarity, 1),
+                "matched_keywords": ats["matched_keywords"],
+                "missing_keywords": ats["missing_keywords"],
+            }
+            if len(top) < k:
+                heapq.heappush(top, (score, -order, result))
+            elif score > top[0][0]:
+                heapq.heapreplace(top, (score, -order, result))
+
+        return {
+            "pool_size": len(resume_scores),
+            "shortlisted": shortlisted,
+            "exact_scored": exact,
+            "model_version": model_version,
+            "candidates": [r for _, _, r in sorted(top, key=lambda t: (-t[0], -t[1]))],
+        }
+
+    def _similarities(self, job_text: str) -> Tuple[Dict[str, float], str]:
+        """
+        TF-IDF cosine of the JD with every stored candidate sharing a term
+        with it (all others are 0), plus the model version used.
+        """
+        vectorizer, version, model_version = self._model()
+        with self._lock:
+            if self._postings_version != version:
+                self._postings = defaultdict(dict)
+                self._postings_version = version
+            missing = [
+                (c, packed)
+                for c, packed in self._texts.items()
+                if self._vectors.get(c, (None,))[0] != version
+            ]
+        if missing:
+            # Only candidates added since their last vectorization, without the lock
+            matrix = vectorizer.transform_matrix(
+                [zlib.decompress(packed).decode("utf-8") for _, packed in missing]
+            )
+            with self._lock:
+                for i, (candidate_id, packed) in enumerate(missing):
+                    if (
+                        self._postings_version != version
+                        or self._texts.get(candidate_id) is not packed
+                    ):
+                        continue  # replaced, removed or refitted meanwhile
+                    self._drop_vector(candidate_id)
+                    vector = matrix.row_dict(i)
+                    self._vectors[candidate_id] = (version, vector)
+                    for term, weight in vector.items():
+                        self._postings[term][candidate_id] = weight
+
+        job_vector = vectorizer.transform_matrix([job_text]).row_dict(0)
+        similarities: Dict[str, float] = defaultdict(float)
+        with self._lock:
+            for term, weight in job_vector.items():
+                for candidate_id, value in self._postings.get(term, {}).items():
+                    similarities[candidate_id] += weight * value
+        return similarities, model_version
+
+    def _model(self) -> Tuple[TFIDFVectorizer, str, str]:
+        """
+        The vectorizer to rank with, its vector version and the model version
+        to report: the published snapshot, else the pool model, fitted (or
+        refitted once stale) on the stored texts without holding the lock.
+        """
+        snapshot = self.pipeline.registry.current
+        if snapshot is not None:
+            return snapshot.vectorizer, snapshot.version, snapshot.version
+        with self._lock:
+            stale = self._pool_model is None or (
+                self._pool_changes
+                > self.pool_refit_fraction * max(self._pool_fitted_size, 1)
+            )
+            if not stale:
+                return self._pool_model, f"pool-{self._pool_generation}", "pool"
+            packed_texts = list(self._texts.values())
+            changes = self._pool_changes
+            generation = self._pool_generation
+        model = TFIDFVectorizer(max_features=self.pool_max_features).fit(
+            zlib.decompress(packed).decode("utf-8") for packed in packed_texts
+        )
+        with self._lock:
+            if self._pool_generation == generation:
+                self._pool_model = model
+                self._pool_generation += 1
+                self._pool_fitted_size = len(packed_texts)
+                self._pool_changes -= changes
+            return self._pool_model, f"pool-{self._pool_generation}", "pool"
+
+    def _drop_vector(self, candidate_id: str):
+        """Forget a candidate's vector and its postings (call with the lock held)."""
+        cached = self._vectors.pop(candidate_id, None)
+        if cached is not None and cached[0] == self._postings_version:
+            for term in cached[1]:
+                self._postings[term].pop(candidate_id, None)
+
+
+# ─── Similarity Matrix ────────────────────────────────────────────────────────
+
+
+def _top_k_rows(rows, k: int) -> List[List[Dict]]:
+    """Best k columns of each row as {"job_index", "similarity_score"}, ties by column."""
+    k = max(k, 0)
+    if np is not None:
+        order = np.argsort(-rows, axis=1, kind="stable")[:, :k]
+        ranked = [
+            zip(cols.tolist(), row[cols].tolist()) for row, cols in zip(rows, order)
+        ]
+    else:
+        ranked = [
+            [(j, row[j]) for j in sorted(range(len(row)), key=lambda j: -row[j])[:k]]
+            for row in rows
+        ]
+    return [
+        [
+            {"job_index": j, "similarity_score": round(score * 100, 1)}
+            for j, score in row
+        ]
+        for row in ranked
+    ]
+
+
+class SimilarityMatrixWriter:
+    """
+    Streams similarity blocks to a file, row by row. "binary" writes a model
+    artifact (see write_artifact) whose "scores" section holds the matrix as
+    row-major float32, so read_similarity_matrix can memory-map it; "csv"
+    writes one line per resume with one column per job. The file is written
+    to a temp path and renamed on close.
+    """
+
+    FORMATS = ("binary", "csv")
+
+    def __init__(
+        self,
+        path: str,
+        shape: Tuple[int, int],
+        fmt: str = "binary",
+        row_labels: Optional[Sequence[str]] = None,
+        column_labels: Optional[Sequence[str]] = None,
+    ):
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Unknown similarity matrix format: {fmt!r}")
+        self.path = path
+        self.shape = (int(shape[0]), int(shape[1]))
+        self.fmt = fmt
+        self.row_labels = row_labels
+        self.rows_written = 0
+        self._tmp_path = f"{path}.tmp"
+        if fmt == "csv":
+            self._file = open(self._tmp_path, "w", newline="", encoding="utf-8")
+            self._csv = csv.writer(self._file)
+            columns = column_labels or range(self.shape[1])
+            self._csv.writerow(["resume", *columns])
+        else:
+            self._file = open(self._tmp_path, "wb")
+            header = {
+                "kind": "similarity_matrix",
+                "shape": list(self.shape),
+                "dtype": "float32",
+                "row_labels": list(row_labels) if row_labels else None,
+                "column_labels": list(column_labels) if column_labels else None,
+            }
+            size = self.shape[0] * self.shape[1] * 4
+            self._file.write(_artifact_prefix(header, {"scores": [0, size]}))
+
+    def write_rows(self, start: int, rows):
+        """Append a block of rows; blocks must arrive in order."""
+        if start != self.rows_written:
+            raise ValueError(f"Expected rows from {self.rows_written}, got {start}")
+        if self.fmt == "csv":
+            for i, row in enumerate(rows, start):
+                label = self.row_labels[i] if self.row_labels else i
+                self._csv.writerow([label, *(f"{score:.4f}" for score in row)])
+        elif np is not None:
+            self._file.write(np.asarray(rows, dtype="<f4").tobytes())
+        else:
+            self._file.write(_array_bytes(array("f", (x for row in rows for x in row))))
+        self.rows_written += len(rows)
+
+    def close(self):
+        self._file.close()
+        if self.rows_written != self.shape[0]:
+            os.remove(self._tmp_path)
+            raise ValueError(f"Wrote {self.rows_written} of {self.shape[0]} rows")
+        os.replace(self._tmp_path, self.path)
+
+    def __enter__(self) -> "SimilarityMatrixWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._file.close()
+            os.remove(self._tmp_path)
+
+
+def read_similarity_matrix(path: str, use_mmap: bool = True) -> Tuple[Dict, Any]:
+    """
+    Header and scores of a binary similarity matrix: a (rows, cols) NumPy
+    array when NumPy is installed, otherwise a flat row-major float view.
+    """
+    header, sections = read_artifact(path, use_mmap)
+    if header.get("kind") != "similarity_matrix":
+        raise ValueError(f"{path} does not contain a similarity matrix")
+    if np is not None:
+        scores = np.frombuffer(sections["scores"], dtype="<f4")
+        return header, scores.reshape(header["shape"])
+    return header, _array_view(sections["scores"], "f")
+
+
 # ─── Demo / Testing ───────────────────────────────────────────────────────────
 
 if __name__ == "__main__":
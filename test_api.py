@@ -173,6 +173,58 @@ def test_generate():
     return resp.status == 200
 
 
+def test_generate_batch():
+    """Test 5: Batch Generation"""
+    print("=" * 70)
+    print("TEST 5: Batch Generation (POST /api/generate/batch)")
+    print("=" * 70)
+
+    profile = {
+        "name": "Rahul Verma",
+        "email": "rahul@example.com",
+        "skills": ["Python", "Django", "PostgreSQL"],
+        "education": [
+            {
+                "institution": "NIT Trichy",
+                "degree": "B.Tech",
+                "field": "Information Technology",
+                "start_year": 2021,
+            }
+        ],
+        "projects": [
+            {
+                "name": "Campus Connect",
+                "description": "Placement portal built with Django and PostgreSQL",
+                "technologies": ["Python", "Django", "PostgreSQL"],
+            }
+        ],
+        "target_role": "Backend Developer",
+        "target_industry": "technology",
+    }
+    payload = {
+        "profiles": [profile, {"name": "Incomplete Profile"}],
+        "job_description": "Backend Developer with Python, Django and PostgreSQL experience.",
+        "company_name": "Infosys",
+    }
+
+    headers = {"Content-Type": "application/json"}
+    conn = http.client.HTTPConnection("127.0.0.1", 8000, timeout=30)
+    conn.request("POST", "/api/generate/batch", json.dumps(payload), headers)
+    resp = conn.getresponse()
+    print(f"Status: {resp.status}")
+    result = json.loads(resp.read().decode())
+
+    if "results" in result:
+        print(f"\n✅ Batch Results:")
+        print(f"   Succeeded: {result['succeeded']}/{result['total']}")
+        for item in result["results"]:
+            status = "ok" if item["success"] else f"error: {item['error'][:60]}"
+            print(f"   [{item['index']}] {status}")
+
+    print()
+    return resp.status == 200 and result.get("succeeded") == 1
+
+
 def test_ats_score():
     """Test 4: ATS Score"""
     print("=" * 70)
@@ -232,6 +284,52 @@ Tools & Platforms: Docker, Kubernetes, AWS, Git
     return resp.status == 200
 
 
+def test_full_analysis():
+    """Test 6: Full ML Analysis"""
+    print("=" * 70)
+    print("TEST 6: Full Analysis (POST /api/full-analysis)")
+    print("=" * 70)
+
+    payload = {
+        "profile": {
+            "name": "Ananya Iyer",
+            "email": "ananya@example.com",
+            "skills": ["Python", "Docker", "AWS"],
+            "education": [],
+            "experience": [
+                {
+                    "company": "CloudWorks",
+                    "role": "Backend Intern",
+                    "start_date": "Jan 2024",
+                    "description": "Built REST APIs serving 10000 users. Reduced deployment time by 60% using Docker.",
+                }
+            ],
+            "projects": [],
+            "target_role": "Backend Engineer",
+            "target_industry": "technology",
+        },
+        "job_description": "Backend Engineer with Python, Docker, Kubernetes and AWS experience.",
+    }
+
+    headers = {"Content-Type": "application/json"}
+    conn = http.client.HTTPConnection("127.0.0.1", 8000, timeout=30)
+    conn.request("POST", "/api/full-analysis", json.dumps(payload), headers)
+    resp = conn.getresponse()
+    print(f"Status: {resp.status}")
+    result = json.loads(resp.read().decode())
+
+    if "data" in result:
+        analysis = result["data"]
+        print(f"\n✅ Full Analysis Results:")
+        print(f"   Job Match: {analysis['job_match']['similarity_score']}%")
+        print(f"   Domain: {analysis['job_match']['domain_classification']['primary_domain']}")
+        print(f"   Skill Match: {analysis['skill_gap']['match_percentage']}%")
+        print(f"   Bullet Score: {analysis['bullet_quality'].get('average_score')}")
+
+    print()
+    return resp.status == 200
+
+
 if __name__ == "__main__":
     results = []
 
@@ -239,6 +337,8 @@ if __name__ == "__main__":
     results.append(("Templates", test_templates()))
     results.append(("Generate", test_generate()))
     results.append(("ATS Score", test_ats_score()))
+    results.append(("Batch Generate", test_generate_batch()))
+    results.append(("Full Analysis", test_full_analysis()))
 
     print("=" * 70)
     print("TEST SUMMARY")
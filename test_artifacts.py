@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Model Artifact Unit Tests for AI Resume Builder
+write_artifact/read_artifact and the save/load round trips of fitted models.
+Runs without a server: python -m pytest test_artifacts.py, or run this file.
+"""
+
+import os
+import random
+import sys
+import tempfile
+from array import array
+
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+for _path in (os.path.join(_ROOT, "backend"), os.path.join(_ROOT, "ml_model")):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+from ml_pipeline import (
+    NaiveBayesDomainModel,
+    ResumeMLPipeline,
+    TFIDFVectorizer,
+    read_artifact,
+    write_artifact,
+)
+
+pipeline = ResumeMLPipeline()
+
+DOMAINS = {
+    "Software Engineering": "python django react api backend services microservices git",
+    "Data Science": "pandas numpy machine learning statistics models regression tableau",
+    "Finance": "accounting audit ledger payroll budgeting tax reconciliation excel",
+}
+
+
+def _corpus(n: int = 200, seed: int = 2):
+    rng = random.Random(seed)
+    texts, labels = [], []
+    for _ in range(n):
+        label = rng.choice(sorted(DOMAINS))
+        words = DOMAINS[label].split() + ["team", "project", "improved", "built", "led"]
+        texts.append(" ".join(rng.choices(words, k=rng.randint(5, 40))))
+        labels.append(label)
+    return texts, labels
+
+
+def _roundtrip_paths(tmp: str):
+    """An artifact path in tmp for each load mode (memory-mapped and read into memory)."""
+    return [(os.path.join(tmp, f"model-{use_mmap}.bmf"), use_mmap) for use_mmap in (True, False)]
+
+
+def test_sections_round_trip_aligned():
+    """Headers and every section come back unchanged, each section 8-byte aligned"""
+    rng = random.Random(5)
+    sections = {
+        "empty": b"",
+        "odd": bytes(rng.randrange(256) for _ in range(13)),
+        "doubles": array("d", (rng.random() for _ in range(1000))).tobytes(),
+        "text": "zoë\nnaïve\n".encode("utf-8"),
+    }
+    header = {"kind": "test", "nested": {"values": [1, 2.5, "x"]}}
+    with tempfile.TemporaryDirectory() as tmp:
+        for path, use_mmap in _roundtrip_paths(tmp):
+            write_artifact(path, header, sections)
+            read_header, read_sections = read_artifact(path, use_mmap)
+            assert {k: v for k, v in read_header.items() if k != "sections"} == header
+            assert {name: bytes(view) for name, view in read_sections.items()} == sections
+            assert read_sections["doubles"].cast("d").tolist() == array("d", sections["doubles"]).tolist()
+            assert all(offset % 8 == 0 for offset, _ in read_header["sections"].values())
+            assert not os.path.exists(f"{path}.tmp")
+
+
+def test_foreign_files_are_rejected():
+    """A file without the artifact magic raises ValueError"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "foreign.bin")
+        with open(path, "wb") as f:
+            f.write(b"not an artifact at all")
+        try:
+            read_artifact(path)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("read_artifact accepted a foreign file")
+
+
+def test_vectorizer_round_trip():
+    """A loaded vectorizer has the same vocabulary, IDF and vectors as the saved one"""
+    texts, _ = _corpus()
+    vectorizer = TFIDFVectorizer(max_features=50).fit(texts)
+    expected = vectorizer.transform_matrix(texts)
+    with tempfile.TemporaryDirectory() as tmp:
+        for path, use_mmap in _roundtrip_paths(tmp):
+            vectorizer.save(path)
+            loaded = TFIDFVectorizer.load(path, use_mmap)
+            assert loaded.vocabulary == vectorizer.vocabulary
+            assert list(loaded.idf) == list(vectorizer.idf)
+            assert loaded.n_documents == vectorizer.n_documents
+            assert all(loaded.document_frequency[t] == vectorizer.document_frequency[t] for t in vectorizer.vocabulary)
+            matrix = loaded.transform_matrix(texts)
+            assert (list(matrix.indptr), list(matrix.indices), list(matrix.data)) == (
+                list(expected.indptr),
+                list(expected.indices),
+                list(expected.data),
+            )
+
+
+def test_domain_model_round_trip():
+    """A loaded Naive Bayes model predicts exactly what the saved one did"""
+    texts, labels = _corpus()
+    model = NaiveBayesDomainModel(max_features=100).fit(texts, labels)
+    queries = texts[:40] + ["", "payroll and python", "unseen words only"]
+    with tempfile.TemporaryDirectory() as tmp:
+        for path, use_mmap in _roundtrip_paths(tmp):
+            model.save(path)
+            loaded = NaiveBayesDomainModel.load(path, use_mmap)
+            assert loaded.classes == model.classes
+            assert loaded.predict_batch(queries) == model.predict_batch(queries)
+
+
+def test_pipeline_round_trip():
+    """A loaded pipeline serves the same model version and match results"""
+    texts, _ = _corpus()
+    source = ResumeMLPipeline(engine=pipeline.engine)
+    source.fit_vectorizer(texts)
+    version = source.registry.current.version
+    job = "Backend engineer: Python, Django, REST APIs and microservices"
+    with tempfile.TemporaryDirectory() as tmp:
+        for path, use_mmap in _roundtrip_paths(tmp):
+            source.save(path)
+            loaded = ResumeMLPipeline.load(path, use_mmap, engine=pipeline.engine)
+            assert loaded.registry.current.version == version
+            for resume in texts[:10]:
+                assert loaded.match_resume_to_job(resume, job) == source.match_resume_to_job(resume, job)
+
+
+
+def test_pipeline_from_env():
+    """PIPELINE_MODEL_PATH makes from_env serve the saved model; unset, it starts unfitted"""
+    texts, _ = _corpus()
+    source = ResumeMLPipeline(engine=pipeline.engine)
+    source.fit_vectorizer(texts)
+    saved = os.environ.pop("PIPELINE_MODEL_PATH", None)
+    try:
+        assert ResumeMLPipeline.from_env(engine=pipeline.engine).registry.current is None
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "pipeline.bmf")
+            source.save(path)
+            os.environ["PIPELINE_MODEL_PATH"] = path
+            loaded = ResumeMLPipeline.from_env(engine=pipeline.engine)
+            assert loaded.registry.current.version == source.registry.current.version
+            assert loaded.engine is pipeline.engine
+    finally:
+        os.environ.pop("PIPELINE_MODEL_PATH", None)
+        if saved is not None:
+            os.environ["PIPELINE_MODEL_PATH"] = saved
+
+
+if __name__ == "__main__":
+    tests = [(name, fn) for name, fn in sorted(globals().items()) if name.startswith("test_")]
+    failed = 0
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"✅ PASS  {name}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ FAIL  {name}: {e}")
+    sys.exit(1 if failed else 0)
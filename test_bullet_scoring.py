@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Bullet Scoring Unit Tests for AI Resume Builder
+BulletPointScorer breakdowns follow the original per-bullet scoring rules.
+Runs without a server: python -m pytest test_bullet_scoring.py, or run this file.
+"""
+
+import os
+import sys
+
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+for _path in (os.path.join(_ROOT, "backend"), os.path.join(_ROOT, "ml_model")):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+from ml_pipeline import BulletPointScorer
+
+scorer = BulletPointScorer()
+
+
+def _action_verb(bullet: str) -> int:
+    return scorer.score_bullet(bullet)["breakdown"]["action_verb"]
+
+
+def _impact(bullet: str) -> int:
+    return scorer.score_bullet(bullet)["breakdown"]["impact_clarity"]
+
+
+def test_impact_phrases_match_as_substrings():
+    """Impact phrases count inside longer words, as the original substring check did"""
+    for bullet in [
+        "Achieved savings of $2M",
+        "Spearheaded cost savings initiative",
+        "Drove cost-saving vendor consolidation",
+        "Designed a leading tool for analysts",
+    ]:
+        assert _impact(bullet) == 100, bullet
+
+
+def test_only_listed_phrases_count_as_impact():
+    """Forms that are not substrings of a listed phrase get no impact credit"""
+    assert _impact("Built dashboards for the sales team") == 40
+    assert _impact("Migrated billing to Kafka, which led to fewer outages") == 40
+    assert _impact("Achieved a 30% faster release cycle") == 40
+
+
+def test_technical_depth_matches_whole_words():
+    """Tech terms count on regex word boundaries over the lowercased bullet"""
+    assert scorer.score_bullet("Wrote python_script helpers")["breakdown"]["technical_depth"] == 30
+    assert scorer.score_bullet("Exposed a REST-API for billing")["breakdown"]["technical_depth"] == 80
+    assert scorer.score_bullet("Applied machine-learning models")["breakdown"]["technical_depth"] == 30
+
+
+
+def test_action_verb_is_the_first_word_as_written():
+    """Only a bare leading verb earns credit, not one after a dash or followed by punctuation"""
+    assert _action_verb("Built a billing service") == 100
+    assert _action_verb("  built a billing service") == 100
+    assert _action_verb("- Built a billing service") == 0
+    assert _action_verb("Led, with two peers, the migration") == 0
+    assert _action_verb("") == 0
+
+
+if __name__ == "__main__":
+    tests = [(name, fn) for name, fn in sorted(globals().items()) if name.startswith("test_")]
+    failed = 0
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"✅ PASS  {name}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ FAIL  {name}: {e}")
+    sys.exit(1 if failed else 0)
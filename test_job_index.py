@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Job Index Unit Tests for AI Resume Builder
+JobIndex.top_docs (block-max pruned posting cursors) against brute-force BM25.
+Runs without a server: python -m pytest test_job_index.py, or run this file.
+"""
+
+import os
+import random
+import sys
+import tempfile
+from collections import defaultdict
+
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+for _path in (os.path.join(_ROOT, "backend"), os.path.join(_ROOT, "ml_model")):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+from job_index import JobIndex
+from ml_pipeline import merge_top_k
+
+# Zipf-like vocabulary: a few terms with long multi-block posting lists, many rare ones
+VOCAB = [f"word{i}" for i in range(600)]
+WEIGHTS = [1 / (i + 1) for i in range(len(VOCAB))]
+
+
+def _corpus(n_docs: int = 9000, seed: int = 3):
+    rng = random.Random(seed)
+    for i in range(n_docs):
+        yield f"job-{i}", f"Posting {i}", " ".join(rng.choices(VOCAB, WEIGHTS, k=rng.randint(5, 60)))
+
+
+def _queries(n: int = 40, seed: int = 5):
+    rng = random.Random(seed)
+    return [" ".join(rng.choices(VOCAB, WEIGHTS, k=rng.randint(1, 80))) for _ in range(n)]
+
+
+def _brute_force(index: JobIndex, terms):
+    """BM25 score of every document, from fully decoded posting lists."""
+    scores = defaultdict(float)
+    for term_id, weight in terms:
+        first, end = index.term_block_start[term_id], index.term_block_start[term_id + 1]
+        for block in range(first, end):
+            docs, tfs = index._decode_block(block, first, index.term_df[term_id])
+            for doc, tf in zip(docs, tfs):
+                if index.doc_range is None or index.doc_range[0] <= doc < index.doc_range[1]:
+                    scores[doc] += weight * index._term_score(index.idf[term_id], tf, doc)
+    return scores
+
+
+def _assert_top_k(scores, k: int, top):
+    """top is a correct top k of scores: true scores, best first, nothing better left out."""
+    expected = sorted(scores.values(), reverse=True)[:k]
+    assert len(top) == len(expected), (len(top), len(expected))
+    for (score, doc), best in zip(top, expected):
+        assert abs(score - scores[doc]) < 1e-9, (doc, score, scores[doc])
+        assert abs(score - best) < 1e-9, (score, best)
+    assert len({doc for _, doc in top}) == len(top)
+
+
+_index = None
+
+
+def _built_index() -> JobIndex:
+    global _index
+    if _index is None:
+        _index = JobIndex.build(_corpus())
+    return _index
+
+
+def test_top_docs_equals_brute_force():
+    """Pruned search returns the exact BM25 top k for short and long queries"""
+    index = _built_index()
+    assert max(
+        index.term_block_start[t + 1] - index.term_block_start[t] for t in range(len(index.vocabulary))
+    ) > 1
+    for text in _queries(25):
+        terms = index.query_terms(text, max_terms=64)
+        scores = _brute_force(index, terms)
+        for k in (1, 10, 100):
+            _assert_top_k(scores, k, index.top_docs(terms, k))
+
+
+def test_saved_index_searches_the_same():
+    """A memory-mapped copy of the index gives identical results"""
+    index = _built_index()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "jobs.idx")
+        index.save(path)
+        loaded = JobIndex.load(path)
+        try:
+            for text in _queries(10):
+                assert loaded.search(text, 20) == index.search(text, 20)
+        finally:
+            del loaded
+
+
+def test_partitions_merge_into_the_global_top_k():
+    """Each partition is exact for its doc range and the merged lists match the whole index"""
+    index = _built_index()
+    parts = [index.partition(shard, 3) for shard in range(3)]
+    for text in _queries(15, seed=11):
+        terms = index.query_terms(text)
+        shard_hits = [part.top_docs(terms, 20) for part in parts]
+        for part, top in zip(parts, shard_hits):
+            _assert_top_k(_brute_force(part, terms), 20, top)
+        # Pruning changes the summation order, so compare scores as the API reports them
+        assert index.hits(merge_top_k(shard_hits, 20)) == index.hits(index.top_docs(terms, 20))
+
+
+def test_unknown_terms_and_empty_queries():
+    """Queries with no indexed terms find nothing"""
+    index = _built_index()
+    assert index.search("", 10) == []
+    assert index.search("zzzz qqqq", 10) == []
+    assert index.top_docs(index.query_terms("word0"), 0) == []
+
+
+if __name__ == "__main__":
+    tests = [(name, fn) for name, fn in sorted(globals().items()) if name.startswith("test_")]
+    failed = 0
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"✅ PASS  {name}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ FAIL  {name}: {e}")
+    sys.exit(1 if failed else 0)
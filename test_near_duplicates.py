@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Unit Tests for AI Resume Builder
+MinHash/LSH grouping against exact pairwise shingle Jaccard.
+Runs without a server: python -m pytest test_near_duplicates.py, or run this file.
+"""
+
+import os
+import random
+import sys
+
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+for _path in (os.path.join(_ROOT, "backend"), os.path.join(_ROOT, "ml_model")):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+import near_duplicates
+from near_duplicates import MinHasher, bands_for, find_near_duplicates, jaccard, shingles
+
+VOCAB = [f"skill{i}" for i in range(3000)]
+
+
+def _corpus(n_bases: int = 60, seed: int = 4):
+    """Random bullets plus copies with a few words replaced, dropped or appended, shuffled."""
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(n_bases):
+        words = rng.sample(VOCAB, rng.randint(8, 40))
+        texts.append(" ".join(words))
+        for _ in range(rng.randint(0, 3)):
+            copy = list(words)
+            for _ in range(rng.randint(0, 3)):
+                edit = rng.randrange(3)
+                if edit == 0:
+                    copy[rng.randrange(len(copy))] = rng.choice(VOCAB)
+                elif edit == 1 and len(copy) > 2:
+                    del copy[rng.randrange(len(copy))]
+                else:
+                    copy.append(rng.choice(VOCAB))
+            texts.append(" ".join(copy))
+    texts += ["", "   "]
+    rng.shuffle(texts)
+    return texts
+
+
+def _exact_groups(texts, threshold):
+    """Connected components of the pairs whose exact shingle Jaccard reaches threshold."""
+    sets = [shingles(text) for text in texts]
+    parent = list(range(len(texts)))
+
+    def root(i):
+        while parent[i] != i:
+            i = parent[i]
+        return i
+
+    pairs = {}
+    for a in range(len(texts)):
+        for b in range(a + 1, len(texts)):
+            similarity = jaccard(sets[a], sets[b])
+            if similarity >= threshold:
+                pairs[a, b] = similarity
+                ra, rb = root(a), root(b)
+                parent[max(ra, rb)] = min(ra, rb)
+    groups = {}
+    for i in range(len(texts)):
+        groups.setdefault(root(i), []).append(i)
+    return [members for members in groups.values() if len(members) > 1], pairs
+
+
+def test_groups_equal_exact_pairwise_grouping():
+    """LSH finds the same groups as comparing every pair, scored by an exact pair in the group"""
+    texts = _corpus()
+    for threshold in (0.6, 0.8):
+        found = find_near_duplicates(texts, threshold)
+        expected, pairs = _exact_groups(texts, threshold)
+        assert sorted(g["members"] for g in found) == sorted(expected), threshold
+        for group in found:
+            members = set(group["members"])
+            scores = {round(s, 3) for (a, b), s in pairs.items() if a in members and b in members}
+            assert group["similarity"] in scores
+        assert [g["members"][0] for g in found] == sorted(g["members"][0] for g in found)
+
+
+def test_groups_are_never_below_threshold():
+    """Whatever LSH proposes, grouped texts are linked by pairs at or above the threshold"""
+    texts = _corpus(n_bases=40, seed=9)
+    for threshold in (0.3, 0.5, 0.7, 0.95):
+        expected, _ = _exact_groups(texts, threshold)
+        components = {i: frozenset(members) for members in expected for i in members}
+        for group in find_near_duplicates(texts, threshold):
+            assert set(group["members"]) <= components.get(group["members"][0], frozenset()), threshold
+            assert group["similarity"] >= threshold
+
+
+def test_identical_texts_are_compared_linearly():
+    """A bucket of n copies costs one comparison per copy and band, not one per pair"""
+    texts = ["Built REST APIs in Python and deployed them to AWS"] * 2000
+    calls = []
+    saved_jaccard = near_duplicates.jaccard
+
+    def counting_jaccard(a, b):
+        calls.append(1)
+        return saved_jaccard(a, b)
+
+    near_duplicates.jaccard = counting_jaccard
+    try:
+        groups = find_near_duplicates(texts)
+    finally:
+        near_duplicates.jaccard = saved_jaccard
+    assert [g["members"] for g in groups] == [list(range(2000))]
+    assert groups[0]["similarity"] == 1.0
+    assert len(calls) == 1999
+
+
+def test_banding_follows_the_threshold():
+    """Lower thresholds get shorter bands; thresholds no banding can recall are rejected"""
+    assert [bands_for(t) for t in (0.95, 0.8, 0.6, 0.3)] == [8, 16, 32, 32]
+    assert bands_for(0.1) == 64
+    for threshold in (0.01, 0.04):
+        try:
+            bands_for(threshold)
+        except ValueError:
+            continue
+        raise AssertionError(f"threshold {threshold} accepted")
+
+
+def test_numpy_and_pure_python_signatures_agree():
+    """Both signature paths give identical minima, and estimates track the exact Jaccard"""
+    hasher = MinHasher(num_perm=128)
+    texts = _corpus(n_bases=10, seed=2)
+    sets = [hasher.shingles(text) for text in texts]
+    vectorized = [hasher.signature(s) for s in sets]
+    saved_np, near_duplicates.np = near_duplicates.np, None
+    try:
+        pure = [hasher.signature(s) for s in sets]
+    finally:
+        near_duplicates.np = saved_np
+    assert vectorized == pure
+    errors = [
+        abs(MinHasher.estimate(vectorized[a], vectorized[b]) - jaccard(sets[a], sets[b]))
+        for a in range(len(sets))
+        for b in range(a + 1, len(sets))
+        if sets[a] and sets[b]
+    ]
+    assert sum(errors) / len(errors) < 0.05
+
+
+if __name__ == "__main__":
+    tests = [(name, fn) for name, fn in sorted(globals().items()) if name.startswith("test_")]
+    failed = 0
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"✅ PASS  {name}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ FAIL  {name}: {e}")
+    sys.exit(1 if failed else 0)
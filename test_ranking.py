@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Candidate Ranking Unit Tests for AI Resume Builder
+CandidateRankingIndex.rank against exhaustive scoring of the whole pool.
+Runs without a server: python -m pytest test_ranking.py, or run this file.
+"""
+
+import os
+import random
+import sys
+
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+for _path in (os.path.join(_ROOT, "backend"), os.path.join(_ROOT, "ml_model")):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+from ml_pipeline import CandidateRankingIndex, ResumeMLPipeline
+
+pipeline = ResumeMLPipeline()
+
+ACCOUNTANT_RESUME = (
+    "Chartered accountant. Prepared financial statements, reconciliations, audits and "
+    "tax filings for 40 clients. Managed payroll, ledger accounts and budgeting; "
+    "reduced month-end close time by 30%."
+)
+ACCOUNTANT_JD = (
+    "Accountant needed: financial statements, reconciliations, audits, tax filings, "
+    "payroll, ledger accounts and budgeting."
+)
+JOB_DESCRIPTIONS = [
+    ACCOUNTANT_JD,
+    ACCOUNTANT_JD + " Some Python scripting is a plus.",
+    "Backend engineer: Python, Django, PostgreSQL, Docker, Kubernetes and AWS. "
+    "Build scalable services, data pipelines and monitoring.",
+    "",
+]
+
+
+def _pool(n: int = 120):
+    rng = random.Random(7)
+    skills = [s for sl in pipeline.engine.skill_categories.values() for s in sl]
+    words = (
+        "built designed led improved scaled reduced latency pipelines services team "
+        "customers platform data analytics dashboards migrated automated tested deployed"
+    ).split()
+    pool = [("accountant", ACCOUNTANT_RESUME), ("python-only", "Python")]
+    for i in range(n):
+        chosen = rng.sample(skills, rng.randint(2, 8))
+        text = " ".join(rng.choices(words + chosen, k=rng.randint(20, 60)))
+        pool.append((f"c{i}", f"{text} by {rng.randint(5, 60)}%"))
+    return pool
+
+
+def _exhaustive(index: CandidateRankingIndex, job_description: str, k: int):
+    """Combined score of every stored candidate, best first."""
+    job = pipeline.engine.build_job_context(job_description)
+    similarities, _ = index._similarities(job_description)
+    w = index.ats_weight
+    scored = []
+    for candidate_id in list(index._texts):
+        ats = pipeline.engine.calculate_ats_score(index.text(candidate_id), job)
+        similarity = similarities.get(candidate_id, 0.0) * 100
+        scored.append(round(w * ats["overall_score"] + (1 - w) * similarity, 2))
+    return sorted(scored, reverse=True)[:k]
+
+
+def _check(index: CandidateRankingIndex):
+    for job_description in JOB_DESCRIPTIONS:
+        ranked = index.rank(job_description, 10)
+        scores = [c["score"] for c in ranked["candidates"]]
+        assert scores == _exhaustive(index, job_description, 10), job_description
+        if job_description.startswith("Accountant"):
+            top = ranked["candidates"][0]["candidate_id"]
+            assert top.startswith("accountant"), job_description
+
+
+def test_rank_equals_exhaustive_scoring_with_pool_model():
+    """Without a published model, ranking uses a model fitted on the pool"""
+    index = CandidateRankingIndex(pipeline, max_exact=10**6)
+    index.add_many(_pool())
+    _check(index)
+    index.remove("c3")
+    index.add("c4", "Python Django developer, built REST APIs")
+    _check(index)
+
+
+def test_pool_model_is_refitted_only_after_enough_changes():
+    """Adds reuse the pool model until the pool has changed by the refit fraction"""
+    index = CandidateRankingIndex(pipeline, max_exact=10**6, pool_refit_fraction=0.5)
+    pool = _pool(60)
+    index.add_many(pool[:40])
+    index.rank(ACCOUNTANT_JD, 5)
+    generation = index._pool_generation
+    index.add_many(pool[40:50])
+    index.remove("c0")
+    _check(index)
+    assert index._pool_generation == generation
+    index.add_many(pool[50:])
+    index.rank(ACCOUNTANT_JD, 5)
+    assert index._pool_generation == generation + 1
+
+
+def test_rank_equals_exhaustive_scoring_with_snapshot():
+    """With a published model, stored vectors are reused across queries"""
+    snapshot_pipeline = ResumeMLPipeline(engine=pipeline.engine)
+    snapshot_pipeline.registry.max_features = 5000
+    pool = _pool()
+    snapshot_pipeline.fit_vectorizer([text for _, text in pool] + JOB_DESCRIPTIONS)
+    index = CandidateRankingIndex(snapshot_pipeline, max_exact=10**6)
+    index.add_many(pool)
+    _check(index)
+    index.add("accountant-python", ACCOUNTANT_RESUME + " Python")
+    _check(index)
+
+
+def test_job_without_skills_is_ranked():
+    """A JD naming no taxonomy skill ranks by similarity instead of failing"""
+    index = CandidateRankingIndex(pipeline)
+    index.add_many(_pool(20))
+    ranked = index.rank(ACCOUNTANT_JD, 3)
+    assert ranked["candidates"][0]["candidate_id"] == "accountant"
+
+
+if __name__ == "__main__":
+    tests = [(name, fn) for name, fn in sorted(globals().items()) if name.startswith("test_")]
+    failed = 0
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"✅ PASS  {name}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ FAIL  {name}: {e}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Response Cache Unit Tests for AI Resume Builder
+ResponseCache hits are independent copies of the stored value.
+Runs without a server: python -m pytest test_response_cache.py, or run this file.
+"""
+
+import os
+import sys
+
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+for _path in (os.path.join(_ROOT, "backend"), os.path.join(_ROOT, "ml_model")):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+from response_cache import ResponseCache, cache_key
+
+
+def test_hits_do_not_share_state():
+    """Mutating a value after set, or a hit after get, leaves the entry intact"""
+    cache = ResponseCache()
+    key = cache_key("ats-score", {"resume_text": "Python", "job_description": "Python"})
+    value = {"overall_score": 80, "matched_keywords": ["Python"]}
+    cache.set(key, value)
+    value["matched_keywords"].append("Django")
+
+    hit = cache.get(key)
+    assert hit == {"overall_score": 80, "matched_keywords": ["Python"]}
+    hit["overall_score"] = 0
+    assert cache.get(key)["overall_score"] == 80
+    assert cache.stats()["hits"] == 2
+
+
+def test_entries_are_bounded_by_serialized_size():
+    """The least recently used entries are evicted past max_bytes"""
+    cache = ResponseCache(max_bytes=100)
+    for i in range(5):
+        cache.set(str(i), {"text": "x" * 30})
+    stats = cache.stats()
+    assert stats["bytes"] <= 100 and stats["evictions"] == 3
+    assert cache.get("0") is None and cache.get("4") == {"text": "x" * 30}
+
+
+if __name__ == "__main__":
+    tests = [(name, fn) for name, fn in sorted(globals().items()) if name.startswith("test_")]
+    failed = 0
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"✅ PASS  {name}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ FAIL  {name}: {e}")
+    sys.exit(1 if failed else 0)
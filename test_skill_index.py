@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Skill Index Unit Tests for AI Resume Builder
+Typo correction of skill entries and job description keywords.
+Runs without a server: python -m pytest test_skill_index.py, or run this file.
+"""
+
+import os
+import random
+import sys
+
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+for _path in (os.path.join(_ROOT, "backend"), os.path.join(_ROOT, "ml_model")):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+from ml_engine import ResumeAIEngine
+from skill_index import CandidateCoverageIndex, SkillInterner
+
+engine = ResumeAIEngine()
+
+
+def test_profile_skill_typos_are_corrected():
+    """Unambiguous misspellings of known skills resolve to the canonical skill"""
+    canonicalizer = engine.skill_canonicalizer
+    for raw, expected in [
+        ("Pyhton", "Python"),
+        ("Kubernets", "Kubernetes"),
+        ("Javscript", "JavaScript"),
+        ("Djnago", "Django"),
+        ("Dokcer", "Docker"),
+        ("Postgress", "PostgreSQL"),
+        ("Typescirpt", "TypeScript"),
+        ("tensorflow", "TensorFlow"),
+        ("k8s", "Kubernetes"),
+    ]:
+        assert canonicalizer.fuzzy_canonical(raw) == expected, raw
+
+
+def test_real_skills_are_not_merged_into_neighbours():
+    """Real tech names and English words near a skill are kept as written"""
+    canonicalizer = engine.skill_canonicalizer
+    for raw in [
+        "NestJS", "Nest.js", "Nuxt.js", "MSSQL", "Vite.js", "GraphDB", "Flash", "Scale",
+        "GitLab", "Vuex", "Redash", "SwiftUI", "none",
+    ]:
+        assert canonicalizer.fuzzy_canonical(raw) == raw, raw
+        assert canonicalizer.correction(raw) is None, raw
+
+
+def test_lookup_still_suggests_close_skills():
+    """Kept entries are still offered as suggestions by /api/skills/lookup"""
+    for raw, expected in [("NestJS", "Next.js"), ("GitLab", "GitHub"), ("SwiftUI", "Swift"), ("Vuex", "Vue")]:
+        suggestions = engine.skill_canonicalizer.suggest(raw)
+        assert [s["skill"] for s in suggestions] == [expected], raw
+
+
+def test_profile_skill_bits_keep_unknown_skills_apart():
+    """A profile listing NestJS does not count as knowing Next.js"""
+    context = engine.build_context({"skills": ["NestJS", "Pyhton"]}, "Next.js and Python developer")
+    assert engine.skill_interner.names_of(context.skill_bits) == ["Python"]
+
+
+def test_job_description_words_are_not_turned_into_skills():
+    """English words one edit from a skill are not JD keywords"""
+    keywords = engine._extract_keywords("The system reacts to scalar inputs")
+    assert "React" not in keywords and "Scala" not in keywords
+
+
+def test_job_description_typos_next_to_skills_are_corrected():
+    """Misspelled skills in a list of other skills are still recognized"""
+    keywords = engine._extract_keywords("Deploy services with Docker and Kubernets on AWS")
+    assert "Kubernetes" in keywords
+    assert "Kubernetes" not in engine._extract_keywords("We need Kubernets experience")
+
+
+def test_job_skill_bits_do_not_depend_on_stored_candidates():
+    """The API's candidate indexes intern into their own tables, so compiled JD bits stay the same"""
+    import main
+
+    description = "Python developer with Foobarscript, Zeta Tooling and Docker"
+    before = main.ai_engine.build_job_context(description).skill_bits
+    vocabulary_size = len(main.ai_engine.skill_interner)
+    main.candidate_index.add("c1", ["Foobarscript", "Zeta Tooling", "Docker"])
+    main.ranking_index.add("c1", "Docker and Foobarscript developer")
+    try:
+        assert len(main.ai_engine.skill_interner) == vocabulary_size
+        assert main.ai_engine.build_job_context(description).skill_bits == before
+        assert engine.build_job_context(description).skill_bits == before
+    finally:
+        main.candidate_index.remove("c1")
+        main.ranking_index.remove("c1")
+
+
+def _brute_force_query(index, stored, required_skills, min_coverage, limit):
+    """CandidateCoverageIndex.query by checking every stored candidate's skill set."""
+    key = index.interner.key
+    required = {key(s) for s in required_skills} - {""}
+    threshold = max(1, min(len(required) if min_coverage is None else min_coverage, len(required)))
+    matches = []
+    for candidate_id, skills in stored.items():
+        covered = {key(s) for s in skills} & required
+        if len(covered) >= threshold:
+            matches.append((-len(covered), index._slots[candidate_id], candidate_id, covered))
+    matches.sort()
+    return threshold, len(matches), [(c, -n, covered) for n, _, c, covered in matches[:limit]]
+
+
+def test_coverage_index_equals_brute_force():
+    """Bit-sliced coverage counts match per-candidate set intersection, across adds, replaces and removes"""
+    rng = random.Random(11)
+    vocabulary = [s for skills in engine.skill_categories.values() for s in skills]
+    vocabulary += ["js", "k8s", "Postgres", "react.js", "Cobol-85", "Fortran", "Underwater Welding"]
+    index = CandidateCoverageIndex(SkillInterner(canonicalizer=engine.skill_canonicalizer))
+    stored = {}
+    for step in range(6):
+        batch = [(f"c{rng.randrange(400)}", rng.sample(vocabulary, rng.randint(0, 12))) for _ in range(150)]
+        index.add_many(batch)
+        stored.update(batch)
+        for candidate_id in rng.sample(sorted(stored), 20):
+            assert index.remove(candidate_id)
+            del stored[candidate_id]
+        assert len(index) == len(stored)
+
+        for _ in range(30):
+            required = rng.sample(vocabulary, rng.randint(1, 10)) + rng.choice([[], ["Quantum Basket Weaving"]])
+            min_coverage = rng.choice([None, 1, 2, 3, 20])
+            limit = rng.choice([5, 50, 1000])
+            result = index.query(required, min_coverage, limit)
+            threshold, total, expected = _brute_force_query(index, stored, required, min_coverage, limit)
+            assert result["min_coverage"] == threshold and result["total"] == total, (required, min_coverage)
+            got = [
+                (c["candidate_id"], c["coverage"], {index.interner.key(s) for s in c["matched_skills"]})
+                for c in result["candidates"]
+            ]
+            assert got == expected, (required, min_coverage)
+
+
+if __name__ == "__main__":
+    tests = [(name, fn) for name, fn in sorted(globals().items()) if name.startswith("test_")]
+    failed = 0
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"✅ PASS  {name}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ FAIL  {name}: {e}")
+    sys.exit(1 if failed else 0)